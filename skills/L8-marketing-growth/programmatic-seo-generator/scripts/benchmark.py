@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for Programmatic SEO Generator
+Measures DataLoader, TemplateEngine, QualityChecker and SEOValidator
+on synthetic datasets of increasing size
+"""
+
+import sys
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context, get_all_start_methods
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+SAMPLE_DATA = SKILL_DIR / 'examples' / 'sample_data.csv'
+DEFAULT_TEMPLATE = SKILL_DIR / 'templates' / 'product_page.html'
+
+STAGES = ['load', 'validate', 'normalize', 'render', 'quality', 'seo']
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+
+
+def build_dataset(path: Path, size: int, sample_path: Path = SAMPLE_DATA) -> Path:
+    """
+    Write a synthetic CSV of `size` rows shaped like examples/sample_data.csv.
+
+    Sample rows are cycled; id, title and url_slug are made unique so every
+    row renders its own page.
+    """
+    with open(sample_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        samples = list(reader)
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+
+        for i in range(size):
+            row = dict(samples[i % len(samples)])
+            row['id'] = str(i + 1)
+            row['title'] = f"{row['title']} {i + 1}"
+            row['url_slug'] = f"{row['url_slug']}-{i + 1}"
+            writer.writerow(row)
+
+    return path
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def run_stage(stage: str, data_path: str, pages_dir: str, template_path: str,
+              workers: int = 1) -> Dict[str, Any]:
+    """
+    Run one stage in a fresh process and time it.
+
+    Setup work (e.g. loading data before rendering) is excluded from the
+    timing but included in peak RSS, which is the whole process peak.
+    """
+    # Imported here so each stage starts from a clean interpreter
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from data_loader import DataLoader
+    from template_engine import TemplateEngine
+    from quality_checker import QualityChecker
+    from seo_validator import SEOValidator
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader = DataLoader(data_path)
+
+        if stage == 'load':
+            start = time.perf_counter()
+            items = len(loader.load())
+        elif stage == 'validate':
+            loader.load()
+            start = time.perf_counter()
+            items = loader.validate()['row_count']
+        elif stage == 'normalize':
+            loader.load()
+            start = time.perf_counter()
+            items = len(loader.normalize())
+        elif stage == 'render':
+            loader.load()
+            normalized = loader.normalize()
+            engine = TemplateEngine(template_path, pages_dir)
+            start = time.perf_counter()
+            items = engine.generate_pages(normalized, workers=workers)['generated_count']
+        elif stage == 'quality':
+            checker = QualityChecker(pages_dir)
+            start = time.perf_counter()
+            items = checker.check_all(workers=workers)['total_pages']
+        elif stage == 'seo':
+            validator = SEOValidator(pages_dir)
+            start = time.perf_counter()
+            items = validator.validate_all(workers=workers)['total_pages']
+        else:
+            raise ValueError(f"Unknown stage: {stage}")
+
+        seconds = time.perf_counter() - start
+
+    return {
+        'stage': stage,
+        'items': items,
+        'seconds': round(seconds, 4),
+        'items_per_sec': round(items / seconds, 1) if seconds > 0 else None,
+        'peak_rss_mb': _peak_rss_mb()
+    }
+
+
+def run_benchmarks(
+    sizes: List[int],
+    stages: List[str],
+    work_dir: Path,
+    template_path: Path = DEFAULT_TEMPLATE,
+    workers: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Run every stage for every dataset size.
+
+    Returns:
+        One result per (size, stage), in run order
+    """
+    results = []
+
+    # Fork where available: this process never imports the pipeline modules,
+    # so each stage still starts clean, and --workers pools inside the stage
+    # keep the platform default start method (as in the CLI)
+    ctx = get_context('fork' if 'fork' in get_all_start_methods() else 'spawn')
+
+    for size in sizes:
+        size_dir = work_dir / f"rows_{size}"
+        pages_dir = size_dir / 'pages'
+        pages_dir.mkdir(parents=True, exist_ok=True)
+
+        data_path = size_dir / 'data.csv'
+        if not data_path.exists():
+            print(f"Building synthetic dataset: {size} rows...")
+            build_dataset(data_path, size)
+
+        for stage in stages:
+            if stage in ('quality', 'seo') and not any(pages_dir.glob('*.html')):
+                print(f"  ⚠️  {stage}: no pages rendered for {size} rows, skipped")
+                continue
+
+            # A fresh process per stage keeps peak RSS per stage
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+                result = executor.submit(
+                    run_stage, stage, str(data_path), str(pages_dir),
+                    str(template_path), workers
+                ).result()
+
+            result['size'] = size
+            results.append(result)
+
+            rss = f"{result['peak_rss_mb']} MB" if result['peak_rss_mb'] is not None else 'n/a'
+            print(f"  {size:>9} rows | {stage:<9} | {result['seconds']:>9.3f}s | "
+                  f"{result['items_per_sec'] or 0:>10.1f}/s | peak RSS {rss}")
+
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str):
+    """Print per-stage speedups against a previous results file."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    previous = {(r['size'], r['stage']): r for r in baseline.get('results', [])}
+
+    print(f"\nComparison with: {baseline_path}")
+    for result in results:
+        before = previous.get((result['size'], result['stage']))
+        if not before or not result['seconds']:
+            continue
+        speedup = before['seconds'] / result['seconds']
+        print(f"  {result['size']:>9} rows | {result['stage']:<9} | "
+              f"{before['seconds']:.3f}s -> {result['seconds']:.3f}s ({speedup:.2f}x)")
+
+
+def main():
+    """CLI interface for benchmark suite."""
+    parser = argparse.ArgumentParser(description='Benchmark the programmatic SEO pipeline')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma-separated dataset sizes (default: 1000,10000,100000,1000000)')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"Comma-separated stages (default: {','.join(STAGES)})")
+    parser.add_argument('--template', default=str(DEFAULT_TEMPLATE), help='Template to render')
+    parser.add_argument('--workers', type=int, default=1, help='Workers for render, quality and seo (default: 1)')
+    parser.add_argument('--work-dir', default='benchmark_work',
+                        help='Directory for synthetic data and pages (reused between runs)')
+    parser.add_argument('--output', default='benchmark_results.json', help='Results JSON path')
+    parser.add_argument('--compare', help='Previous results JSON to compare against')
+
+    args = parser.parse_args()
+
+    try:
+        sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+        stages = [s.strip() for s in args.stages.split(',') if s.strip()]
+        unknown = [s for s in stages if s not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown stages: {', '.join(unknown)} (use {', '.join(STAGES)})")
+
+        print(f"Benchmarking sizes {sizes} | stages {stages}")
+        results = run_benchmarks(sizes, stages, Path(args.work_dir), Path(args.template), args.workers)
+
+        report = {
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'template': str(args.template),
+                'workers': args.workers
+            },
+            'results': results
+        }
+
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+        print(f"\n📊 Results saved to: {args.output}")
+
+        if args.compare:
+            compare(results, args.compare)
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,32 +1,112 @@
 #!/usr/bin/env python3
 """
 Data Loader for Programmatic SEO Generator
-Supports CSV, JSON, Google Sheets, and Airtable
+Supports CSV, JSON, NDJSON, Parquet, Arrow IPC, Google Sheets, and Airtable
 """
 
 import csv
+import hashlib
 import json
+import pickle
 import sys
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Set, Tuple
+import numpy as np
 import pandas as pd
+from row_schema import RowSchema, FieldRule
+from remote_sources import load_airtable, load_google_sheets, DEFAULT_CACHE_TTL
 
 
 class DataLoader:
     """Load and validate data from multiple sources."""
 
-    def __init__(self, source_path: str, source_type: Optional[str] = None):
+    # Bump when loading, validation or normalization output changes,
+    # so parsed-data caches from older versions are ignored
+    CACHE_VERSION = 2
+
+    # Layout of the pickled cache entry itself (bump when its keys change)
+    CACHE_FORMAT = 1
+
+    # Sources modified this close to a cache write are hashed even if
+    # size and mtime match (coarse filesystem timestamps, see _read_cache)
+    CACHE_RACY_NS = 2 * 10**9
+
+    # Sources that apply column projection while reading
+    PROJECTED_SOURCES = ['csv', 'ndjson', 'parquet', 'arrow']
+
+    # Fields read or generated by normalize()
+    NORMALIZE_FIELDS = ['title', 'description', 'category', 'meta_title', 'meta_description', 'keywords']
+
+    # Sources whose rows all share the file's columns (no per-row missing keys)
+    TABULAR_SOURCES = ['csv', 'parquet', 'arrow']
+
+    # Row numbers / IDs spelled out per validation message; the rest are counted
+    MAX_REPORTED = 10
+
+    def __init__(
+        self,
+        source_path: str,
+        source_type: Optional[str] = None,
+        columns: Optional[Iterable[str]] = None,
+        cache_dir: Optional[str] = None,
+        schema: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL
+    ):
         """
         Initialize data loader.
 
         Args:
             source_path: Path to data file or URL
-            source_type: Force source type (csv, json, sheets, airtable)
+            source_type: Force source type (csv, json, ndjson, parquet, arrow,
+                sheets, airtable)
+            columns: Fields the templates reference (see
+                TemplateEngine.referenced_fields). Only these, plus required,
+                recommended and normalization fields, are loaded, and they
+                are validated on every row. None loads all columns.
+            cache_dir: Directory for the parsed-data cache. Loaded,
+                validated and normalized data is pickled there, keyed by
+                source path, size, mtime, content hash and loader version,
+                so repeat runs on an unchanged local file skip parsing.
+                Airtable and Google Sheets responses are cached under
+                cache_dir/http for cache_ttl seconds.
+            schema: Row schema JSON file (see row_schema.RowSchema). Its
+                required/recommended fields replace the defaults, and its
+                type, length and pattern rules are checked by validate()
+                before rendering; rows failing 'reject' rules are dropped
+                by normalize() and iter_rows().
+            cache_ttl: Lifetime of cached API responses in seconds
         """
         self.source_path = source_path
         self.source_type = source_type or self._detect_type(source_path)
         self.data: List[Dict[str, Any]] = []
         self.required_fields = ['id', 'title', 'description']
+        self.recommended_fields = ['meta_title', 'meta_description', 'keywords', 'image_url']
+        self.stream_validation: Dict[str, Any] = {}
+
+        self.schema: Optional[RowSchema] = RowSchema.load(schema) if schema else None
+        if self.schema:
+            self.required_fields = self.schema.required_fields
+            self.recommended_fields = self.schema.recommended_fields
+
+        self.template_fields: Set[str] = set(columns) if columns is not None else set()
+        self.columns: Optional[Set[str]] = None
+        if columns is not None:
+            self.columns = (self.template_fields | set(self.required_fields)
+                            | set(self.recommended_fields) | set(self.NORMALIZE_FIELDS))
+            if self.schema:
+                self.columns |= set(self.schema.fields)
+
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self.cache_hit = False
+        self._cache_dirty = False
+        self._cache_touched = False  # cache hit on a touched file (see _read_cache)
+        self._cache_key: Optional[Dict[str, Any]] = None
+        self._cached_validation: Optional[Dict[str, Any]] = None
+        self._cached_normalized: Optional[List[Dict[str, Any]]] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_is_source = False  # self.data was read from self._frame
 
     def _detect_type(self, path: str) -> str:
         """Auto-detect source type from file extension or URL."""
@@ -36,6 +116,12 @@ class DataLoader:
             return 'csv'
         elif path_lower.endswith('.json'):
             return 'json'
+        elif path_lower.endswith(('.ndjson', '.jsonl')):
+            return 'ndjson'
+        elif path_lower.endswith(('.parquet', '.pq')):
+            return 'parquet'
+        elif path_lower.endswith(('.arrow', '.feather', '.ipc')):
+            return 'arrow'
         elif 'docs.google.com/spreadsheets' in path_lower:
             return 'sheets'
         elif 'airtable.com' in path_lower or 'api.airtable.com' in path_lower:
@@ -44,11 +130,27 @@ class DataLoader:
             raise ValueError(f"Cannot detect source type for: {path}")
 
     def load(self) -> List[Dict[str, Any]]:
-        """Load data from source."""
+        """Load data from source (or the parsed-data cache)."""
+        self._cached_validation = None
+        self._cached_normalized = None
+        self._frame = None
+        self._frame_is_source = False
+        self._cache_dirty = True
+
+        if self.cache_dir and self._read_cache():
+            self._cache_dirty = False
+            return self.data
+
         if self.source_type == 'csv':
             self.data = self._load_csv()
         elif self.source_type == 'json':
             self.data = self._load_json()
+        elif self.source_type == 'ndjson':
+            self.data = list(self._iter_ndjson())
+        elif self.source_type == 'parquet':
+            self.data = list(self._iter_parquet())
+        elif self.source_type == 'arrow':
+            self.data = list(self._iter_arrow())
         elif self.source_type == 'sheets':
             self.data = self._load_google_sheets()
         elif self.source_type == 'airtable':
@@ -56,13 +158,168 @@ class DataLoader:
         else:
             raise ValueError(f"Unsupported source type: {self.source_type}")
 
+        # File formats are projected while reading; other sources after loading
+        if self.columns is not None and self.source_type not in self.PROJECTED_SOURCES:
+            self.data = [self._project(row) for row in self.data]
+
         return self.data
 
+    def _cache_path(self) -> Path:
+        """Cache file for this source and column projection."""
+        source = str(Path(self.source_path).resolve())
+        columns = sorted(self.columns) if self.columns is not None else None
+        name = hashlib.sha256(json.dumps([source, columns]).encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{name}.pkl"
+
+    def _fingerprint(self) -> Optional[Dict[str, Any]]:
+        """
+        Cache key for a local source file (None for remote sources).
+
+        The content hash is left out here and filled in by
+        _content_hash() only when needed (see _read_cache).
+        """
+        path = Path(self.source_path)
+        if not path.is_file():
+            return None
+
+        stat = path.stat()
+        return {
+            'source': str(path.resolve()),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'content_hash': None,
+            'version': self.CACHE_VERSION,
+            'source_type': self.source_type,
+            'columns': sorted(self.columns) if self.columns is not None else None,
+            'required_fields': list(self.required_fields),
+            'recommended_fields': list(self.recommended_fields),
+            'schema': self.schema.spec if self.schema else None
+        }
+
+    def _content_hash(self) -> str:
+        """Hash of the whole source file."""
+        digest = hashlib.blake2b(digest_size=32)
+        with open(self.source_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _read_cache(self) -> bool:
+        """
+        Restore data from the cache if its key matches the source.
+
+        Same size and mtime as when the cache was written is a hit without
+        reading the source. Otherwise (or if the file was modified within
+        CACHE_RACY_NS of the cache write, where a later edit could keep
+        the mtime) the file is hashed, so a touched but byte-identical file
+        is still a hit. An unreadable entry or one of another CACHE_FORMAT
+        is a miss.
+        """
+        self._cache_key = self._fingerprint()
+        if self._cache_key is None:
+            return False
+
+        cache_path = self._cache_path()
+        if not cache_path.exists():
+            return False
+
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = pickle.load(f)
+            if entry.get('format') != self.CACHE_FORMAT:
+                return False
+            key = entry['key']
+            written_ns = entry['written_ns']
+            data = entry['data']
+            validation = entry['validation']
+            normalized = entry['normalized']
+        except Exception:
+            # Unreadable or foreign cache: reparse and overwrite it
+            return False
+
+        ignore = {'mtime_ns', 'content_hash'}
+        if any(key.get(k) != v for k, v in self._cache_key.items() if k not in ignore):
+            return False
+
+        stat_match = (key.get('mtime_ns') == self._cache_key['mtime_ns']
+                      and self._cache_key['mtime_ns'] < written_ns - self.CACHE_RACY_NS)
+        if stat_match:
+            self._cache_key['content_hash'] = key['content_hash']
+        else:
+            self._cache_key['content_hash'] = self._content_hash()
+            if key.get('content_hash') != self._cache_key['content_hash']:
+                return False
+
+        self.data = data
+        self._cached_validation = validation
+        self._cached_normalized = normalized
+        self.cache_hit = True
+        # Hashed hit (touched or racy file): rewrite the entry so the next run takes the fast path
+        self._cache_touched = not stat_match
+        return True
+
+    def save_cache(self):
+        """
+        Pickle loaded, validated and normalized data for the next run.
+
+        No-op without a cache_dir, for remote sources, or when nothing new
+        was computed since the cache was read.
+        """
+        if not self.cache_dir or self._cache_key is None or not (self._cache_dirty or self._cache_touched):
+            return
+
+        if self._cache_key['content_hash'] is None:
+            self._cache_key['content_hash'] = self._content_hash()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = self._cache_path()
+        tmp_path = cache_path.with_suffix('.tmp')
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                'format': self.CACHE_FORMAT,
+                'key': self._cache_key,
+                'written_ns': time.time_ns(),
+                'data': self.data,
+                'validation': self._cached_validation,
+                'normalized': self._cached_normalized
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # Atomic replace: a crashed run never leaves a truncated cache
+        tmp_path.replace(cache_path)
+        self._cache_dirty = False
+        self._cache_touched = False
+
+    def _project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the projected columns of a row."""
+        return {key: value for key, value in row.items() if key in self.columns}
+
+    def _usecols(self):
+        """pandas usecols filter for the projected columns (None = all)."""
+        if self.columns is None:
+            return None
+        columns = self.columns
+        return lambda name: name in columns
+
+    @staticmethod
+    def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Rows of a DataFrame as dicts of native Python values.
+
+        Same result as df.to_dict('records'), built from whole-column
+        tolist() calls instead of boxing every value separately.
+        """
+        columns = list(df.columns)
+        values = [df[name].tolist() for name in columns]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
     def _load_csv(self) -> List[Dict[str, Any]]:
         """Load data from CSV file."""
         try:
-            df = pd.read_csv(self.source_path)
-            return df.to_dict('records')
+            df = pd.read_csv(self.source_path, usecols=self._usecols())
+            self._frame = df
+            self._frame_is_source = True
+            return self._records(df)
         except FileNotFoundError:
             raise FileNotFoundError(f"CSV file not found: {self.source_path}")
         except Exception as e:
@@ -91,28 +348,86 @@ class DataLoader:
         except json.JSONDecodeError as e:
             raise Exception(f"Invalid JSON format: {e}")
 
+    def _iter_ndjson(self) -> Iterator[Dict[str, Any]]:
+        """Read newline-delimited JSON one record at a time."""
+        try:
+            with open(self.source_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise Exception(f"Invalid NDJSON on line {line_number}: {e}")
+                    if not isinstance(row, dict):
+                        raise ValueError(f"NDJSON line {line_number} is not an object")
+                    yield self._project(row) if self.columns is not None else row
+        except FileNotFoundError:
+            raise FileNotFoundError(f"NDJSON file not found: {self.source_path}")
+
+    def _arrow_columns(self, names: List[str]) -> Optional[List[str]]:
+        """Projected columns present in an Arrow/Parquet schema (None = all)."""
+        if self.columns is None:
+            return None
+        return [name for name in names if name in self.columns]
+
+    def _iter_parquet(self, batch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+        """Read Parquet in record batches (memory-mapped, column-projected)."""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet input requires pyarrow: pip install pyarrow")
+
+        if not Path(self.source_path).exists():
+            raise FileNotFoundError(f"Parquet file not found: {self.source_path}")
+
+        parquet_file = pq.ParquetFile(self.source_path, memory_map=True)
+        columns = self._arrow_columns(parquet_file.schema_arrow.names)
+
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield from batch.to_pylist()
+
+    def _iter_arrow(self, batch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+        """Read Arrow IPC (file/Feather v2 or stream) from a memory map."""
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc as ipc
+        except ImportError:
+            raise ImportError("Arrow input requires pyarrow: pip install pyarrow")
+
+        if not Path(self.source_path).exists():
+            raise FileNotFoundError(f"Arrow file not found: {self.source_path}")
+
+        with pa.memory_map(str(self.source_path), 'r') as source:
+            try:
+                reader = ipc.open_file(source)
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            except pa.ArrowInvalid:
+                # Not the random-access file format: read as IPC stream
+                source.seek(0)
+                reader = ipc.open_stream(source)
+                batches = iter(reader)
+
+            columns = self._arrow_columns(reader.schema.names)
+
+            for batch in batches:
+                if columns is not None:
+                    batch = batch.select(columns)
+                # Large batches are sliced so rows are materialized gradually
+                for offset in range(0, batch.num_rows, batch_size):
+                    yield from batch.slice(offset, batch_size).to_pylist()
+
+    def _http_cache_dir(self) -> Optional[str]:
+        """Response cache directory for remote sources (None = no cache)."""
+        return str(self.cache_dir / 'http') if self.cache_dir else None
+
     def _load_google_sheets(self) -> List[Dict[str, Any]]:
-        """Load data from Google Sheets via google-workspace source."""
-        # TODO: Implement Google Sheets integration
-        # Requires: google-workspace source to be active
-        # For now, print instructions
-        raise NotImplementedError(
-            "Google Sheets integration requires google-workspace source.\n"
-            "1. Activate source: google-workspace\n"
-            "2. Export sheet to CSV\n"
-            "3. Use CSV loader instead"
-        )
+        """Load data from Google Sheets via the Sheets API (see remote_sources)."""
+        return load_google_sheets(self.source_path, self._http_cache_dir(), self.cache_ttl)
 
     def _load_airtable(self) -> List[Dict[str, Any]]:
-        """Load data from Airtable API."""
-        # TODO: Implement Airtable integration
-        # Requires: Airtable API key
-        raise NotImplementedError(
-            "Airtable integration requires API key.\n"
-            "1. Get API key from https://airtable.com/account\n"
-            "2. Export base to CSV\n"
-            "3. Use CSV loader instead"
-        )
+        """Load data from the Airtable API (see remote_sources)."""
+        return load_airtable(self.source_path, self._http_cache_dir(), self.cache_ttl)
 
     def validate(self) -> Dict[str, Any]:
         """
@@ -121,6 +436,21 @@ class DataLoader:
         Returns:
             Validation result with errors and warnings
         """
+        if self._cached_validation is None:
+            self._cached_validation = self._validate()
+            self._cache_dirty = True
+        return self._cached_validation
+
+    def _validate(self) -> Dict[str, Any]:
+        """
+        Validate loaded data (uncached, see validate()).
+
+        Runs in linear time: empty values are found with vectorized column
+        checks and duplicate IDs with one hashed pass over the ID column.
+        Every duplicate ID and empty required field is reported in
+        'duplicate_ids' and 'empty_fields' (row numbers are 1-based);
+        messages spell out at most MAX_REPORTED of them and count the rest.
+        """
         errors = []
         warnings = []
 
@@ -128,29 +458,64 @@ class DataLoader:
             errors.append("No data loaded")
             return {'valid': False, 'errors': errors, 'warnings': warnings}
 
-        # Check required fields
+        df = self._data_frame()
+        row_count = len(df)
         first_row = self.data[0]
-        missing_fields = [f for f in self.required_fields if f not in first_row]
+
+        # Check required fields (on every row: JSON rows may differ)
+        present = self._present_counts(df, set(self.required_fields) | self.template_fields)
+        missing_fields = [f for f in self.required_fields if present[f] == 0]
+        partly_missing = [f"{f} ({row_count - present[f]} rows)" for f in self.required_fields
+                          if 0 < present[f] < row_count]
 
         if missing_fields:
             errors.append(f"Missing required fields: {', '.join(missing_fields)}")
+        if partly_missing:
+            errors.append(f"Required fields missing in some rows: {', '.join(partly_missing)}")
 
         # Check for empty values in required fields
-        for i, row in enumerate(self.data):
-            for field in self.required_fields:
-                if field in row and not str(row[field]).strip():
-                    warnings.append(f"Row {i+1}: Empty value for '{field}'")
+        empty_fields = {}
+        for field in self.required_fields:
+            if not present[field]:
+                continue
+            mask = self._empty_mask(df[field])
+            if present[field] < row_count:
+                mask &= self._has_key_mask(field)
+            if mask.any():
+                empty_fields[field] = self._row_numbers(mask)
+                warnings.append(self._empty_warning(field, empty_fields[field]))
 
-        # Check for duplicate IDs
-        ids = [row.get('id') for row in self.data if 'id' in row]
-        duplicate_ids = [id for id in ids if ids.count(id) > 1]
+        # Check fields the templates reference, on every row
+        counters = self._field_counters()
+        for field, counts in counters.items():
+            counts[0] = present[field]
+            if present[field]:
+                # Rows without the key are NaN in the frame: don't count them as empty
+                counts[1] = int(self._empty_mask(df[field]).sum()) - (row_count - present[field])
+        warnings.extend(self._field_warnings(counters))
 
+        # Check for duplicate IDs
+        duplicate_ids = self._duplicate_ids(df)
         if duplicate_ids:
-            errors.append(f"Duplicate IDs found: {set(duplicate_ids)}")
+            errors.append(self._duplicate_error(duplicate_ids))
+
+        # Schema rules, on the values templates will see
+        schema_failures = []
+        rejected_rows = []
+        if self.schema:
+            rejected = pd.Series(False, index=df.index)
+            for rule, label, mask in self.schema.check_columns(self._schema_values(df)):
+                schema_failures.append((rule, label, self._row_numbers(mask)))
+                if rule.on_fail == 'reject':
+                    rejected |= mask
+            rejected_rows = self._row_numbers(rejected)
+            warnings.extend(self._schema_warnings(
+                [(rule, label, rows, len(rows)) for rule, label, rows in schema_failures],
+                rejected_rows, len(rejected_rows)
+            ))
 
         # Recommendations
-        recommended_fields = ['meta_title', 'meta_description', 'keywords', 'image_url']
-        missing_recommended = [f for f in recommended_fields if f not in first_row]
+        missing_recommended = [f for f in self.recommended_fields if f not in first_row]
 
         if missing_recommended:
             warnings.append(
@@ -161,10 +526,209 @@ class DataLoader:
             'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings,
-            'row_count': len(self.data),
-            'fields': list(first_row.keys())
+            'row_count': row_count,
+            'fields': list(first_row.keys()),
+            'duplicate_ids': duplicate_ids,
+            'empty_fields': empty_fields,
+            'schema_failures': {f"{rule.field} {label}": rows for rule, label, rows in schema_failures},
+            'rejected_rows': rejected_rows
         }
 
+    def _data_frame(self) -> pd.DataFrame:
+        """Loaded rows as a DataFrame (kept from the CSV read, else built once)."""
+        if self._frame is None or len(self._frame) != len(self.data):
+            self._frame = pd.DataFrame.from_records(self.data)
+            self._frame_is_source = False
+        return self._frame
+
+    def _present_counts(self, df: pd.DataFrame, fields: Set[str]) -> Dict[str, int]:
+        """Number of rows that have each field as a key."""
+        if self.source_type in self.TABULAR_SOURCES:
+            return {f: len(df) if f in df.columns else 0 for f in fields}
+
+        # Record sources (JSON, APIs) may omit keys per row
+        return {f: sum(1 for row in self.data if f in row) if f in df.columns else 0
+                for f in fields}
+
+    def _has_key_mask(self, field: str) -> pd.Series:
+        """Boolean mask of rows that have `field` as a key."""
+        return pd.Series([field in row for row in self.data])
+
+    @staticmethod
+    def _empty_mask(column: pd.Series) -> pd.Series:
+        """Vectorized _is_empty(): None, NaN and blank strings."""
+        mask = column.isna()
+        if not pd.api.types.is_numeric_dtype(column):
+            mask |= column.astype(str).str.strip().eq('')
+        return mask
+
+    @staticmethod
+    def _row_numbers(mask: pd.Series) -> List[int]:
+        """1-based row numbers where mask is True."""
+        return (mask.to_numpy().nonzero()[0] + 1).tolist()
+
+    @staticmethod
+    def _duplicate_ids(df: pd.DataFrame) -> Dict[Any, List[int]]:
+        """Map every duplicated ID to its 1-based row numbers, in order of first appearance."""
+        if 'id' not in df.columns:
+            return {}
+
+        ids = df['id']
+        mask = ids.duplicated(keep=False) & ids.notna()
+        if not mask.any():
+            return {}
+
+        duplicates: Dict[Any, List[int]] = {}
+        for row_id, row in zip(ids[mask].tolist(), DataLoader._row_numbers(mask)):
+            duplicates.setdefault(row_id, []).append(row)
+        return duplicates
+
+    @classmethod
+    def _format_rows(cls, rows: List[int], total: Optional[int] = None) -> str:
+        """'rows 3, 7, 9 (+120 more)': at most MAX_REPORTED of `total` (default len(rows)) row numbers."""
+        shown = ', '.join(str(r) for r in rows[:cls.MAX_REPORTED])
+        more = (len(rows) if total is None else total) - min(len(rows), cls.MAX_REPORTED)
+        return f"rows {shown}" + (f" (+{more} more)" if more > 0 else '')
+
+    @classmethod
+    def _empty_warning(cls, field: str, rows: List[int], total: Optional[int] = None) -> str:
+        """Warning for a required field that is empty in some rows."""
+        total = len(rows) if total is None else total
+        return f"Empty value for '{field}' in {total} rows: {cls._format_rows(rows, total)}"
+
+    @classmethod
+    def _tally(cls, tally: List[Any], row: int):
+        """Count a row in a [count, first MAX_REPORTED row numbers] tally."""
+        tally[0] += 1
+        if len(tally[1]) < cls.MAX_REPORTED:
+            tally[1].append(row)
+
+    @classmethod
+    def _duplicate_error(cls, duplicates: Dict[Any, List[int]]) -> str:
+        """Error listing at most MAX_REPORTED duplicate IDs with their rows."""
+        shown = [f"{row_id!r} ({cls._format_rows(rows)})"
+                 for row_id, rows in list(duplicates.items())[:cls.MAX_REPORTED]]
+        more = len(duplicates) - len(shown)
+        rows = sum(len(r) for r in duplicates.values())
+        return (f"Duplicate IDs found: {len(duplicates)} IDs in {rows} rows: {'; '.join(shown)}"
+                + (f" (+{more} more IDs)" if more > 0 else ''))
+
+    def _schema_values(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Schema field columns as normalize() will hand them to templates.
+
+        Strings are stripped (blank ones are left out of the checks);
+        meta_title, meta_description and keywords are generated where
+        missing. String columns stay in pandas' string dtype so the checks
+        run on vectorized string kernels.
+        """
+        # Only CSV reads empty cells as NaN, which normalize() keeps (truthy);
+        # in a frame built from records NaN stands for None or a missing key
+        nan_falsy = self.source_type != 'csv'
+
+        def column(name: str) -> Tuple[pd.Series, pd.Series]:
+            """(values, falsy mask) of one normalized column."""
+            values = df[name]
+            if pd.api.types.is_bool_dtype(values):
+                return values, ~values
+            if pd.api.types.is_numeric_dtype(values):
+                return values, values.eq(0) | (values.isna() & nan_falsy)
+            if values.dtype != object:
+                stripped = values.str.strip()
+                blank = (stripped.eq('') | (stripped.isna() & nan_falsy)).astype(bool)
+                return stripped.mask(blank), blank
+            values = values.map(lambda v: (v.strip() or None) if isinstance(v, str) else v)
+            return values, values.map(lambda v: v is None or v == 0 or v is False).astype(bool)
+
+        def text(name: str) -> pd.Series:
+            """str() of each normalized value, as an f-string would format it."""
+            if name not in df.columns:
+                return pd.Series('', index=df.index)
+            values, falsy = column(name)
+            if df[name].dtype != object and pd.api.types.is_string_dtype(df[name]):
+                return values.mask(falsy, 'None').fillna('nan')
+            return values.astype(object).astype(str).mask(values.isna() & nan_falsy, 'None')
+
+        def generate(name: str, generated: pd.Series):
+            """Fill a generated field where its column is missing or falsy."""
+            if name not in df.columns:
+                columns[name] = generated
+            else:
+                values, falsy = column(name)
+                columns[name] = values.mask(falsy, generated)
+
+        fields = self.schema.fields
+        columns = {name: column(name)[0] for name in fields if name in df.columns}
+
+        if 'meta_title' in fields:
+            title = (column('title')[0] if 'title' in df.columns
+                     else pd.Series('Untitled', index=df.index))
+            generate('meta_title', title)
+
+        if 'meta_description' in fields:
+            if 'description' in df.columns:
+                desc, desc_falsy = column('description')
+                generated = desc.astype(str).str.slice(0, 160).mask(desc_falsy | desc.isna(), 'No description')
+            else:
+                generated = pd.Series('No description', index=df.index)
+            generate('meta_description', generated)
+
+        if 'keywords' in fields:
+            generate('keywords', (text('title') + ' ' + text('category')).str.strip())
+
+        return columns
+
+    @classmethod
+    def _schema_warnings(cls, failures: List[Tuple[FieldRule, str, List[int], int]],
+                         rejected_rows: List[int], rejected_count: int) -> List[str]:
+        """One warning per failed schema check (rule, label, rows, row count), plus the rejected rows."""
+        warnings = [
+            f"Field '{rule.field}' {label} in {count} rows: {cls._format_rows(rows, count)}"
+            + (" (rejected)" if rule.on_fail == 'reject' else '')
+            for rule, label, rows, count in failures
+        ]
+        if rejected_count:
+            warnings.append(f"Rejected {rejected_count} rows failing schema rules: "
+                            f"{cls._format_rows(rejected_rows, rejected_count)}")
+        return warnings
+
+    def _field_counters(self) -> Dict[str, List[int]]:
+        """
+        Per-field [present, empty] row counters for template fields.
+
+        Fields that normalize() generates or that are required are skipped.
+        """
+        fields = self.template_fields - set(self.required_fields) - set(self.NORMALIZE_FIELDS)
+        return {field: [0, 0] for field in sorted(fields)}
+
+    def _count_fields(self, row: Dict[str, Any], counters: Dict[str, List[int]]):
+        """Update template field counters with one row."""
+        for field, counts in counters.items():
+            if field in row:
+                counts[0] += 1
+                if self._is_empty(row[field]):
+                    counts[1] += 1
+
+    @staticmethod
+    def _field_warnings(counters: Dict[str, List[int]]) -> List[str]:
+        """Warnings for template fields absent from the data or empty in some rows."""
+        warnings = []
+        for field, (present, empty) in counters.items():
+            if not present:
+                warnings.append(f"Template field '{field}' not found in data")
+            elif empty:
+                warnings.append(f"Template field '{field}' empty in {empty} rows")
+        return warnings
+
+    @staticmethod
+    def _is_empty(value: Any) -> bool:
+        """True for None, NaN and blank strings."""
+        if value is None:
+            return True
+        if isinstance(value, float) and value != value:
+            return True
+        return isinstance(value, str) and not value.strip()
+
     def normalize(self) -> List[Dict[str, Any]]:
         """
         Normalize data for template rendering.
@@ -172,61 +736,321 @@ class DataLoader:
         - Convert empty strings to None
         - Strip whitespace
         - Generate missing SEO fields from existing data
+        - Drop rows failing schema rules with on_fail 'reject'
+
+        CSV feeds are normalized column-wise on the DataFrame they were
+        read from; other sources (whose rows may differ in keys) row by row.
+        Both give the same result. The result is kept for save_cache() and
+        returned by repeat calls.
         """
-        normalized = []
+        if self._cached_normalized is None:
+            if self._frame_is_source and len(self._frame) == len(self.data):
+                self._cached_normalized = self._normalize_frame(self._frame)
+            else:
+                self._cached_normalized = [self._normalize_row(row) for row in self.data]
+
+            if self.schema and self.schema.rejects:
+                rejected = set(self.validate().get('rejected_rows', []))
+                self._cached_normalized = [row for i, row in enumerate(self._cached_normalized, 1)
+                                           if i not in rejected]
+            self._cache_dirty = True
+
+        return self._cached_normalized
+
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        normalize() for the rows of a DataFrame, computed column by column.
+
+        String cells are stripped and blank ones set to None with the
+        column's string kernels; meta_title, meta_description and keywords
+        are generated with column masks, slicing and concatenation, for
+        the rows that lack them only. Rows are built once at the end. Same
+        result as _normalize_row() on each of _records(df).
+        """
+        columns: Dict[str, np.ndarray] = {}
+
+        for name in df.columns:
+            column = df[name]
+            if pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+                columns[name] = column.to_numpy(dtype=object)
+                continue
+
+            try:
+                stripped = column.str.strip()
+            except AttributeError:
+                # Object column without string cells
+                columns[name] = column.to_numpy(dtype=object)
+                continue
+
+            if column.dtype == object:
+                # strip() gives NaN for the non-string cells of a mixed column
+                values = column.to_numpy(dtype=object, copy=True)
+                is_str = stripped.notna().to_numpy()
+                values[is_str] = stripped.to_numpy(dtype=object)[is_str]
+            else:
+                # String dtype: every non-missing cell is a string
+                values = stripped.to_numpy(dtype=object, copy=True)
+                is_str = column.notna().to_numpy()
+
+            values[is_str & stripped.eq('').fillna(False).to_numpy(dtype=bool)] = None
+            columns[name] = values
+
+        count = len(df)
+
+        def text(name: str, rows: np.ndarray) -> pd.Series:
+            """str() of the values in rows, as an f-string formats them ('' if the column is missing)."""
+            if name not in columns:
+                return pd.Series([''] * len(rows), dtype=object)
+            return pd.Series(columns[name][rows].astype(str), dtype=object)
+
+        def fill(name: str, generate):
+            """Set a generated field in the rows where its column is missing or falsy (NaN is truthy)."""
+            if name in columns:
+                rows = (~columns[name].astype(bool)).nonzero()[0]
+                values = columns[name].copy()
+            else:
+                rows = np.arange(count)
+                values = np.empty(count, dtype=object)
+            if len(rows):
+                values[rows] = generate(rows)
+            columns[name] = values
+
+        def meta_title(rows: np.ndarray) -> np.ndarray:
+            return columns['title'][rows] if 'title' in columns else 'Untitled'
+
+        def meta_description(rows: np.ndarray) -> np.ndarray:
+            if 'description' not in columns:
+                return 'No description'
+            description = columns['description'][rows]
+            empty = ~description.astype(bool) | pd.isna(description)
+            sliced = text('description', rows).str.slice(0, 160).to_numpy(dtype=object, copy=True)
+            sliced[empty] = 'No description'
+            return sliced
+
+        def keywords(rows: np.ndarray) -> np.ndarray:
+            return (text('title', rows) + ' ' + text('category', rows)).str.strip().to_numpy(dtype=object)
 
-        for row in self.data:
-            normalized_row = {}
+        fill('meta_title', meta_title)
+        fill('meta_description', meta_description)
+        fill('keywords', keywords)
 
-            for key, value in row.items():
-                # Strip whitespace
-                if isinstance(value, str):
-                    value = value.strip()
-                    # Convert empty to None
-                    if not value:
-                        value = None
+        names = list(columns)
+        values = [columns[name].tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)]
 
-                normalized_row[key] = value
+    @staticmethod
+    def _normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a single row (see normalize())."""
+        normalized_row = {}
 
-            # Generate meta_title if missing
-            if 'meta_title' not in normalized_row or not normalized_row['meta_title']:
-                normalized_row['meta_title'] = normalized_row.get('title', 'Untitled')
+        for key, value in row.items():
+            # Strip whitespace
+            if isinstance(value, str):
+                value = value.strip()
+                # Convert empty to None
+                if not value:
+                    value = None
 
-            # Generate meta_description if missing
-            if 'meta_description' not in normalized_row or not normalized_row['meta_description']:
-                desc = normalized_row.get('description', '')
-                # Truncate to 160 chars
-                normalized_row['meta_description'] = desc[:160] if desc else 'No description'
+            normalized_row[key] = value
 
-            # Generate keywords if missing
-            if 'keywords' not in normalized_row or not normalized_row['keywords']:
-                title = normalized_row.get('title', '')
-                category = normalized_row.get('category', '')
-                normalized_row['keywords'] = f"{title} {category}".strip()
+        return DataLoader._fill_seo_fields(normalized_row)
 
-            normalized.append(normalized_row)
+    @staticmethod
+    def _fill_seo_fields(normalized_row: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate missing SEO fields of a normalized row in place."""
+        # Generate meta_title if missing
+        if 'meta_title' not in normalized_row or not normalized_row['meta_title']:
+            normalized_row['meta_title'] = normalized_row.get('title', 'Untitled')
 
-        return normalized
+        # Generate meta_description if missing
+        if 'meta_description' not in normalized_row or not normalized_row['meta_description']:
+            desc = normalized_row.get('description', '')
+            # Truncate to 160 chars (NaN: empty CSV cell)
+            empty = not desc or (isinstance(desc, float) and desc != desc)
+            normalized_row['meta_description'] = 'No description' if empty else str(desc)[:160]
+
+        # Generate keywords if missing
+        if 'keywords' not in normalized_row or not normalized_row['keywords']:
+            title = normalized_row.get('title', '')
+            category = normalized_row.get('category', '')
+            normalized_row['keywords'] = f"{title} {category}".strip()
+
+        return normalized_row
+
+    def iter_rows(self, chunk_size: int = 10000, normalize: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows from source without materializing the whole dataset.
+
+        CSV, Parquet and Arrow sources are read in chunks of `chunk_size`
+        rows and NDJSON line by line; other sources fall back to load().
+        Each row is validated before it is yielded and, unless `normalize`
+        is False, normalized one at a time. Rows failing schema 'reject'
+        rules are skipped.
+
+        Validation errors stop the stream at the first bad row, so nothing
+        is rendered from it. Warnings are collected as counts plus the
+        first MAX_REPORTED row numbers and are available in
+        `self.stream_validation` once the iterator is exhausted (full
+        counts under 'counts'). The only state that grows with the feed is
+        one 64-bit digest per distinct ID, needed to spot duplicates.
+
+        Raises:
+            ValueError: If a row lacks a required field or repeats an ID
+        """
+        errors = []
+        warnings = []
+        seen_ids: Set[int] = set()  # 64-bit digests of the IDs read so far
+        empty_fields: Dict[str, List[Any]] = {f: [0, []] for f in self.required_fields}
+        fields: List[str] = []
+        row_count = 0
+
+        # Template field presence/emptiness, counted as rows stream past
+        counters = self._field_counters()
+
+        # Failed rows per schema check, in schema order
+        schema_rows: Dict[Tuple[str, str], List[Any]] = {}
+        if self.schema:
+            schema_rows = {(field, label): [0, []] for field, rule in self.schema.rules.items()
+                           for label in rule.labels()}
+        rejected: List[Any] = [0, []]
+
+        self.stream_validation = {}
+
+        for row in self._iter_source(chunk_size):
+            row_count += 1
+            if row_count == 1:
+                fields = list(row.keys())
+
+            missing_fields = [f for f in self.required_fields if f not in row]
+            if missing_fields:
+                if row_count == 1:
+                    raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+                raise ValueError(f"Row {row_count}: missing required fields: {', '.join(missing_fields)}")
+
+            # Check for empty values in required fields
+            for field in self.required_fields:
+                if self._is_empty(row[field]):
+                    self._tally(empty_fields[field], row_count)
+
+            self._count_fields(row, counters)
+
+            # Check for duplicate IDs
+            row_id = row.get('id')
+            if not self._is_empty(row_id):
+                digest = self._id_digest(row_id)
+                if digest in seen_ids:
+                    raise ValueError(f"Duplicate ID {row_id!r} in row {row_count}")
+                seen_ids.add(digest)
+
+            if self.schema:
+                normalized_row = self._normalize_row(row)
+                failed = self.schema.check_row(normalized_row)
+                for rule, label in failed:
+                    self._tally(schema_rows[(rule.field, label)], row_count)
+                if any(rule.on_fail == 'reject' for rule, _ in failed):
+                    self._tally(rejected, row_count)
+                    continue
+                yield normalized_row if normalize else row
+            else:
+                yield self._normalize_row(row) if normalize else row
+
+        if row_count == 0:
+            errors.append("No data loaded")
+
+        empty_fields = {f: tally for f, tally in empty_fields.items() if tally[0]}
+        warnings.extend(self._empty_warning(f, rows, count) for f, (count, rows) in empty_fields.items())
+        warnings.extend(self._field_warnings(counters))
+
+        schema_failures = [(self.schema.rules[field], label, rows, count)
+                           for (field, label), (count, rows) in schema_rows.items() if count]
+        warnings.extend(self._schema_warnings(schema_failures, rejected[1], rejected[0]))
+
+        missing_recommended = [f for f in self.recommended_fields if f not in fields]
+        if fields and missing_recommended:
+            warnings.append(
+                f"Missing recommended fields for SEO: {', '.join(missing_recommended)}"
+            )
+
+        self.stream_validation = {
+            'valid': len(errors) == 0,
+            'errors': errors,
+            'warnings': warnings,
+            'row_count': row_count,
+            'fields': fields,
+            'empty_fields': {f: rows for f, (_, rows) in empty_fields.items()},
+            'schema_failures': {f"{rule.field} {label}": rows for rule, label, rows, _ in schema_failures},
+            'rejected_rows': rejected[1],
+            'counts': {
+                'empty_fields': {f: count for f, (count, _) in empty_fields.items()},
+                'schema_failures': {f"{rule.field} {label}": count for rule, label, _, count in schema_failures},
+                'rejected_rows': rejected[0]
+            }
+        }
+
+    @staticmethod
+    def _id_digest(row_id: Any) -> int:
+        """64-bit digest of an ID; integral floats (IDs in CSV chunks with gaps) match their int."""
+        if isinstance(row_id, float) and row_id.is_integer():
+            row_id = int(row_id)
+        return int.from_bytes(hashlib.blake2b(repr(row_id).encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def _iter_source(self, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """Yield raw rows from source, chunked where the format allows."""
+        if self.source_type == 'ndjson':
+            yield from self._iter_ndjson()
+            return
+        if self.source_type == 'parquet':
+            yield from self._iter_parquet(chunk_size)
+            return
+        if self.source_type == 'arrow':
+            yield from self._iter_arrow(chunk_size)
+            return
+        if self.source_type != 'csv':
+            yield from self.load()
+            return
+
+        try:
+            reader = pd.read_csv(self.source_path, chunksize=chunk_size, usecols=self._usecols())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {self.source_path}")
+
+        with reader:
+            for chunk in reader:
+                yield from self._records(chunk)
 
 
 def main():
     """CLI interface for data loader."""
     if len(sys.argv) < 2:
-        print("Usage: python data_loader.py <data_source> [--validate]")
+        print("Usage: python data_loader.py <data_source> [--validate] [--cache-dir DIR] "
+              "[--cache-ttl SECONDS] [--schema FILE]")
         print("\nExamples:")
         print("  python data_loader.py data/products.csv")
         print("  python data_loader.py data/products.json --validate")
+        print("  python data_loader.py data/products.parquet --validate")
+        print("  python data_loader.py data/products.csv --validate --schema examples/row_schema.json")
+        print("  AIRTABLE_TOKEN=pat... python data_loader.py https://airtable.com/appXXX/tblYYY --cache-dir .cache")
         sys.exit(1)
 
     source_path = sys.argv[1]
     validate_only = '--validate' in sys.argv
+    cache_dir = None
+    if '--cache-dir' in sys.argv:
+        cache_dir = sys.argv[sys.argv.index('--cache-dir') + 1]
+    cache_ttl = DEFAULT_CACHE_TTL
+    if '--cache-ttl' in sys.argv:
+        cache_ttl = float(sys.argv[sys.argv.index('--cache-ttl') + 1])
+    schema = None
+    if '--schema' in sys.argv:
+        schema = sys.argv[sys.argv.index('--schema') + 1]
 
     try:
-        loader = DataLoader(source_path)
+        loader = DataLoader(source_path, cache_dir=cache_dir, schema=schema, cache_ttl=cache_ttl)
         print(f"Loading data from: {source_path} (type: {loader.source_type})")
 
         data = loader.load()
-        print(f"✅ Loaded {len(data)} rows")
+        print(f"✅ Loaded {len(data)} rows{' (from cache)' if loader.cache_hit else ''}")
 
         # Validate
         validation = loader.validate()
@@ -251,7 +1075,9 @@ def main():
 
             # Output sample
             print(f"\nSample row (first):")
-            print(json.dumps(normalized[0], indent=2, ensure_ascii=False))
+            print(json.dumps(normalized[0], indent=2, ensure_ascii=False, default=str))
+
+        loader.save_cache()
 
     except Exception as e:
         print(f"❌ Error: {e}")
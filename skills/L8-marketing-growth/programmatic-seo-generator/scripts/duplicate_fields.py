@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Duplicate Fields for Programmatic SEO Generator
+Corpus-wide detection of pages sharing a title, meta description or H1,
+and of canonicals pointing at a shared or missing URL
+"""
+
+import hashlib
+import heapq
+from typing import List, Dict, Any, Optional, Iterable, Hashable
+from link_graph import resolve_href
+
+# seo_elements fields compared across pages, with their issue labels
+FIELDS = {'meta_title': 'title', 'meta_description': 'meta description', 'h1': 'H1'}
+
+# Pages named per listed group
+EXAMPLES = 5
+
+
+def field_key(value: Optional[str]) -> Optional[bytes]:
+    """
+    Index key of a field value: a 64-bit hash of the value with case and
+    whitespace differences removed (None for missing or empty values).
+    """
+    if not value:
+        return None
+    normalized = ' '.join(value.split()).casefold()
+    if not normalized:
+        return None
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+
+
+class DuplicateIndex:
+    """
+    Pages grouped by key, built in one sweep.
+
+    Each key maps to the pages that share it, so finding every collision
+    costs one dictionary lookup per page and stays linear in the number of
+    pages; only the listed groups are ranked.
+    """
+
+    def __init__(self, keys: Iterable[Optional[Hashable]]):
+        """
+        Build the index.
+
+        Args:
+            keys: Key of each page (see field_key); None is never a duplicate
+        """
+        index: Dict[Hashable, List[int]] = {}
+        count = 0
+        for page, key in enumerate(keys):
+            count += 1
+            if key is not None:
+                index.setdefault(key, []).append(page)
+
+        self.groups: List[List[int]] = [pages for pages in index.values() if len(pages) > 1]
+        self.group = [-1] * count  # group of each page (-1 if unique)
+        for number, pages in enumerate(self.groups):
+            for page in pages:
+                self.group[page] = number
+
+    def size(self, page: int) -> int:
+        """Pages sharing the page's key, itself included (0 if unique)."""
+        number = self.group[page]
+        return len(self.groups[number]) if number >= 0 else 0
+
+    def other(self, page: int) -> Optional[int]:
+        """First other page sharing the page's key (None if unique)."""
+        number = self.group[page]
+        if number < 0:
+            return None
+        group = self.groups[number]
+        return group[1] if group[0] == page else group[0]
+
+    def largest(self, listed: int) -> List[List[int]]:
+        """The listed largest groups, largest first."""
+        return heapq.nlargest(listed, self.groups, key=len)
+
+    def summary(self, pages: List[str], labels: List[Any], listed: int = 100) -> Dict[str, Any]:
+        """
+        Group counts and the largest groups.
+
+        Args:
+            pages: Page name of each page (for examples)
+            labels: Value shown for each page's group (e.g. the title)
+            listed: Maximum groups listed
+
+        Returns:
+            Groups, pages in groups and the largest groups with their size
+        """
+        return {
+            'groups': len(self.groups),
+            'pages': sum(len(group) for group in self.groups),
+            'largest': [
+                {'value': labels[group[0]], 'pages': len(group),
+                 'examples': [pages[page] for page in group[:EXAMPLES]]}
+                for group in self.largest(listed)
+            ]
+        }
+
+
+class CanonicalIndex:
+    """
+    Where each page's canonical URL points, resolved to URL slugs.
+
+    Pages are grouped by canonical target (see DuplicateIndex), so pages
+    that hand their ranking to the same URL and canonicals pointing at
+    pages that do not exist are found in one sweep.
+    """
+
+    def __init__(
+        self,
+        canonicals: List[Optional[str]],
+        slugs: List[str],
+        base_url: str,
+        known: Iterable[str] = ()
+    ):
+        """
+        Build the index.
+
+        Args:
+            canonicals: Canonical URL of each page (None if missing)
+            slugs: URL slug of each page
+            base_url: Site base URL without trailing slash
+            known: Slugs of site pages that exist but were not generated
+                (the site root always exists)
+        """
+        self.slugs = slugs
+        self.external = 0  # canonicals on another site
+        self.targets: List[Optional[str]] = []
+        for canonical, slug in zip(canonicals, slugs):
+            target = resolve_href(canonical, f"/{slug}", base_url) if canonical else None
+            if canonical and target is None:
+                self.external += 1
+            self.targets.append(target)
+
+        existing = set(slugs)
+        existing.update(known)
+        existing.add('')
+        self.missing = [target is not None and target not in existing for target in self.targets]
+        self.index = DuplicateIndex(self.targets)
+
+    def analyze(self, pages: List[str], listed: int = 100) -> Dict[str, Any]:
+        """
+        Summarize the canonicals.
+
+        Args:
+            pages: Page name of each page (for listings)
+            listed: Maximum groups and missing targets listed
+
+        Returns:
+            Canonical report; per-page values are in self.targets,
+            self.missing and self.index
+        """
+        # Missing targets: number of pages pointing there and the first of them
+        missing_targets: Dict[str, List[Any]] = {}
+        for page, target in enumerate(self.targets):
+            if self.missing[page]:
+                entry = missing_targets.setdefault(target, [0, pages[page]])
+                entry[0] += 1
+        top_missing = heapq.nlargest(listed, missing_targets.items(), key=lambda item: item[1][0])
+
+        return {
+            'self_referencing': sum(1 for target, slug in zip(self.targets, self.slugs) if target == slug),
+            'external': self.external,
+            'shared_groups': len(self.index.groups),
+            'shared_pages': sum(len(group) for group in self.index.groups),
+            'largest': [
+                {'target': f"/{self.targets[group[0]]}", 'pages': len(group),
+                 'examples': [pages[page] for page in group[:EXAMPLES]]}
+                for group in self.index.largest(listed)
+            ],
+            'missing': sum(self.missing),
+            'missing_targets': [
+                {'target': f"/{target}", 'pages': count, 'example': example}
+                for target, (count, example) in top_missing
+            ]
+        }
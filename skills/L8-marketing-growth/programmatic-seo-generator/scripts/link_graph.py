@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Link Graph for Programmatic SEO Generator
+Site-wide internal link analysis: broken links, orphan pages, in-degree
+distribution and click depth from hub pages
+"""
+
+import math
+import posixpath
+from array import array
+from typing import List, Dict, Any, Optional, Iterable, Set
+from urllib.parse import urlsplit, urljoin, unquote
+import numpy as np
+from qa_report import PERCENTILES
+
+# Hub pages used for click depth when none are given: the most linked pages
+DEFAULT_HUBS = 10
+
+# In-degree histogram buckets (low, high); high None = no upper bound
+IN_DEGREE_BUCKETS = [(0, 0), (1, 1), (2, 5), (6, 10), (11, 50), (51, None)]
+
+
+def resolve_href(href: str, page_path: str, base_url: str) -> Optional[str]:
+    """URL slug an href on page_path points at, or None for other sites and same-page links."""
+    href = href.strip()
+    if href == base_url or href.startswith(base_url + '/'):
+        href = href[len(base_url):] or '/'
+
+    if href.startswith('/') and not href.startswith('//'):
+        # Root-relative (the common case): no URL parsing needed
+        path = href.split('#', 1)[0].split('?', 1)[0]
+    elif href.startswith('//') or urlsplit(href).scheme:
+        return None
+    else:
+        path = urlsplit(href).path
+        if not path:
+            return None
+        path = urljoin(page_path, path)
+
+    if '%' in path:
+        path = unquote(path)
+    if '/.' in path or '//' in path:
+        path = posixpath.normpath(path)
+
+    slug = path.strip('/')
+    if slug.endswith('.html'):
+        slug = slug[:-len('.html')]
+    return slug
+
+
+def link_targets(hrefs: Iterable[str], url_slug: str, base_url: str) -> List[str]:
+    """
+    Resolve the internal links of a page to URL slugs.
+
+    Root-relative ('/produkt-1'), relative ('../produkt-1') and absolute
+    links on base_url all resolve to the slug they point at ('' is the site
+    root). Links to other hosts or schemes, and links to the page itself
+    ('#faq', '?sort=price-asc'), are dropped.
+
+    Args:
+        hrefs: href of every <a> on the page (PageFacts.links)
+        url_slug: URL slug of the page
+        base_url: Site base URL without trailing slash
+
+    Returns:
+        Distinct target slugs, in link order
+    """
+    page_path = f"/{url_slug}"
+    targets = []
+    seen = {url_slug}
+
+    for href in hrefs:
+        slug = resolve_href(href, page_path, base_url)
+        if slug is not None and slug not in seen:
+            seen.add(slug)
+            targets.append(slug)
+
+    return targets
+
+
+def read_site_urls(path: str, base_url: str) -> Set[str]:
+    """
+    Read the slugs of existing site pages from a file with one URL or path
+    per line (e.g. exported from the live sitemap).
+
+    Args:
+        path: URL list file
+        base_url: Site base URL without trailing slash
+
+    Returns:
+        Slugs of the listed pages on base_url
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        slugs = {resolve_href(line, '/', base_url) for line in f if line.strip()}
+    slugs.discard(None)
+    return slugs
+
+
+def _percentile(values: np.ndarray, percent: float) -> Optional[int]:
+    """Nearest-rank percentile of sorted values (None if empty)."""
+    if not len(values):
+        return None
+    return int(values[max(1, math.ceil(percent / 100 * len(values))) - 1])
+
+
+def _histogram(degrees: np.ndarray) -> Dict[str, int]:
+    """Pages per IN_DEGREE_BUCKETS bucket of sorted in-degrees."""
+    histogram = {}
+    for low, high in IN_DEGREE_BUCKETS:
+        label = str(low) if low == high else f"{low}+" if high is None else f"{low}-{high}"
+        stop = len(degrees) if high is None else np.searchsorted(degrees, high, side='right')
+        histogram[label] = int(stop - np.searchsorted(degrees, low, side='left'))
+    return histogram
+
+
+def _top_targets(targets: List[List[str]], pages: List[str], listed: int) -> List[Dict[str, Any]]:
+    """Most linked of the per-page targets, with the number of linking pages and the first of them."""
+    counts: Dict[str, List[Any]] = {}
+    for page, links in enumerate(targets):
+        for target in links:
+            entry = counts.setdefault(target, [0, pages[page]])
+            entry[0] += 1
+    top = sorted(counts.items(), key=lambda item: -item[1][0])[:listed]
+    return [{'target': f"/{target}", 'pages': linking, 'example': example} for target, (linking, example) in top]
+
+
+class LinkGraph:
+    """
+    Directed graph of links between generated pages.
+
+    Built in one sweep over the pages' link targets: a slug index maps each
+    target to its page, and edges are stored in CSR form (indptr/indices),
+    so degrees and breadth-first search run as numpy array operations.
+    """
+
+    def __init__(self, slugs: List[str], targets: List[List[str]], known: Optional[Iterable[str]] = None):
+        """
+        Build the graph.
+
+        Args:
+            slugs: URL slug of each page
+            targets: Link target slugs of each page (see link_targets)
+            known: Slugs of site pages that exist but were not generated
+                (category pages, legal pages...); links to them are not
+                broken. None if no site URL list is available: links to
+                pages that were not generated cannot be checked and are
+                listed as unverified instead. The site root always exists.
+        """
+        self.slugs = slugs
+        count = len(slugs)
+        verify = known is not None
+        known = set(known or ())
+        known.add('')
+
+        index: Dict[str, int] = {}
+        for page, slug in enumerate(slugs):
+            index.setdefault(slug, page)
+
+        sources, destinations = array('q'), array('q')
+        self.broken: List[List[str]] = [[] for _ in range(count)]
+        self.unverified: List[List[str]] = [[] for _ in range(count)]
+        for page, links in enumerate(targets):
+            for target in links:
+                other = index.get(target)
+                if other is None:
+                    if target not in known:
+                        (self.broken if verify else self.unverified)[page].append(target)
+                elif other != page:
+                    sources.append(page)
+                    destinations.append(other)
+
+        sources = np.frombuffer(sources, dtype=np.int64) if sources else np.zeros(0, dtype=np.int64)
+        destinations = np.frombuffer(destinations, dtype=np.int64) if destinations else np.zeros(0, dtype=np.int64)
+
+        # Sources are appended in page order, so edges are already grouped
+        self.indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=count), out=self.indptr[1:])
+        self.indices = destinations
+        self.in_degree = np.bincount(destinations, minlength=count)
+
+    @property
+    def edges(self) -> int:
+        """Number of links between distinct generated pages."""
+        return len(self.indices)
+
+    def hubs(self, slugs: Optional[Iterable[str]] = None) -> List[int]:
+        """
+        Pages to measure click depth from.
+
+        Args:
+            slugs: Hub page slugs (default: the DEFAULT_HUBS most linked pages)
+
+        Returns:
+            Page indices of the hubs that were generated
+        """
+        if slugs is not None:
+            wanted = set(slugs)
+            return [page for page, slug in enumerate(self.slugs) if slug in wanted]
+
+        linked = np.flatnonzero(self.in_degree)
+        order = np.argsort(-self.in_degree[linked], kind='stable')
+        return linked[order][:DEFAULT_HUBS].tolist()
+
+    def click_depth(self, hubs: List[int]) -> np.ndarray:
+        """
+        Breadth-first click depth of every page from the hubs.
+
+        Each level expands the whole frontier at once: the CSR rows of the
+        frontier pages are gathered with one index array.
+
+        Returns:
+            Depth per page (0 for hubs, -1 if unreachable)
+        """
+        depth = np.full(len(self.slugs), -1, dtype=np.int64)
+        frontier = np.unique(np.asarray(hubs, dtype=np.int64))
+        depth[frontier] = 0
+        level = 0
+
+        while len(frontier):
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                break
+
+            offsets = np.arange(total) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+            reached = self.indices[offsets]
+            frontier = np.unique(reached[depth[reached] < 0])
+            level += 1
+            depth[frontier] = level
+
+        return depth
+
+    def analyze(self, pages: List[str], hubs: Optional[Iterable[str]] = None, listed: int = 100) -> Dict[str, Any]:
+        """
+        Summarize the graph.
+
+        Args:
+            pages: Page name of each page (for listings)
+            hubs: Hub page slugs for click depth (default: see hubs())
+            listed: Maximum orphan pages and broken or unverified targets listed
+
+        Returns:
+            Link graph report; per-page values are in self.in_degree,
+            self.depth, self.broken and self.unverified
+        """
+        count = len(self.slugs)
+        hub_pages = self.hubs(hubs)
+        self.depth = self.click_depth(hub_pages)
+
+        orphans = np.flatnonzero(self.in_degree == 0)
+        degrees = np.sort(self.in_degree)
+        reached = self.depth[self.depth >= 0]
+        depth_counts = np.bincount(reached) if len(reached) else np.zeros(0, dtype=np.int64)
+
+        return {
+            'pages': count,
+            'links': self.edges,
+            'broken_links': sum(len(targets) for targets in self.broken),
+            'pages_with_broken_links': sum(1 for targets in self.broken if targets),
+            'broken_targets': _top_targets(self.broken, pages, listed),
+            'unverified_links': sum(len(targets) for targets in self.unverified),
+            'unverified_targets': _top_targets(self.unverified, pages, listed),
+            'orphans': len(orphans),
+            'orphan_pages': [pages[page] for page in orphans[:listed].tolist()],
+            'in_degree': {
+                'average': round(float(degrees.mean()), 1) if count else None,
+                'max': int(degrees[-1]) if count else None,
+                'percentiles': {f'p{p}': _percentile(degrees, p) for p in PERCENTILES},
+                'histogram': _histogram(degrees)
+            },
+            'hubs': [self.slugs[page] for page in hub_pages],
+            'click_depth': {
+                'max': int(len(depth_counts) - 1) if len(reached) else None,
+                'average': round(float(reached.mean()), 2) if len(reached) else None,
+                'unreachable': int(count - len(reached)),
+                'histogram': {str(level): int(n) for level, n in enumerate(depth_counts.tolist())}
+            }
+        }
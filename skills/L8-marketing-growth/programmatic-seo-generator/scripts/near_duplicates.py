@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection for Programmatic SEO Generator
+MinHash signatures of page text with an LSH index, so each page is only
+compared with likely duplicates instead of every other page
+"""
+
+import hashlib
+import re
+import zlib
+from typing import List, Tuple, Iterable, Any, Union
+import numpy as np
+
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Band keys combine signature values with this multiplier (uint64 wraps)
+BAND_MULTIPLIER = np.uint64(4294967291)
+
+
+class MinHasher:
+    """MinHash signatures of word shingles."""
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+        boilerplate: Iterable[int] = ()
+    ):
+        """
+        Initialize hasher.
+
+        Args:
+            num_perm: Signature length (more = better similarity estimates)
+            shingle_size: Words per shingle
+            seed: Seed of the hash permutations; signatures are only
+                comparable between hashers with the same settings
+            boilerplate: Shingle hashes of template text left out of
+                signatures (see learn_boilerplate)
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.boilerplate = np.unique(np.fromiter(boilerplate, dtype=np.uint64))
+
+        # Multiply-shift hashing: high 32 bits of (a * h + b) mod 2**64, a odd
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 2**63, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, 2**63, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    @property
+    def settings(self) -> List[Any]:
+        """Everything signatures depend on: [num_perm, shingle_size, boilerplate digest]."""
+        digest = hashlib.blake2b(self.boilerplate.tobytes(), digest_size=8).hexdigest()
+        return [self.num_perm, self.shingle_size, digest]
+
+    def learn_boilerplate(self, texts: Iterable[str]) -> 'MinHasher':
+        """
+        Leave the template's own text out of later signatures.
+
+        Every shingle of the given texts is dropped from signatures, so the
+        navigation, headings and footer all pages of a template share do
+        not make distinct pages look alike. The texts are the template(s)
+        rendered without row data (see template_engine.template_boilerplate),
+        never the pages: text that pages share through their data is what
+        the uniqueness check is there to catch.
+
+        Args:
+            texts: Body texts of the templates rendered without row data
+
+        Returns:
+            self
+        """
+        hashes = [self._hash_shingles(text) for text in texts]
+        self.boilerplate = np.unique(np.concatenate([self.boilerplate] + hashes))
+        return self
+
+    def _hash_shingles(self, text: str) -> np.ndarray:
+        """Distinct shingle hashes of a text, boilerplate included."""
+        words = WORD_PATTERN.findall(text.lower())
+        size = self.shingle_size
+
+        if len(words) <= size:
+            hashes = {zlib.crc32(' '.join(words).encode('utf-8'))}
+        else:
+            hashes = {zlib.crc32(' '.join(words[i:i + size]).encode('utf-8'))
+                      for i in range(len(words) - size + 1)}
+
+        return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+    def shingles(self, text: str) -> np.ndarray:
+        """
+        Hash the word shingles of a text.
+
+        Shingles are hashed with CRC32 (not hash()), so signatures computed
+        in worker processes match.
+
+        Returns:
+            Distinct shingle hashes as uint64, without boilerplate
+        """
+        hashes = self._hash_shingles(text)
+        if len(self.boilerplate):
+            hashes = hashes[~np.isin(hashes, self.boilerplate, assume_unique=True)]
+        return hashes
+
+    def signature(self, text: str) -> bytes:
+        """
+        MinHash signature of a text.
+
+        A text made only of template text gets the signature of the empty
+        set, so pages without any row text are duplicates of each other.
+
+        Returns:
+            num_perm uint32 minimums as bytes (compact and picklable)
+        """
+        hashes = self.shingles(text)
+        if not len(hashes):
+            return np.full(self.num_perm, 0xFFFFFFFF, dtype=np.uint32).tobytes()
+        values = (hashes[:, None] * self._a + self._b) >> np.uint64(32)
+        return values.min(axis=0).astype(np.uint32).tobytes()
+
+
+def find_near_duplicates(
+    signatures: Union[List[bytes], np.ndarray],
+    threshold: float,
+    bands: int = 64,
+    neighbors: int = 3,
+    limit: int = 5,
+    chunk_size: int = 100000
+) -> List[Tuple[float, List[Tuple[int, float]]]]:
+    """
+    Find near-duplicate pages with locality-sensitive hashing.
+
+    Pages with identical signatures are grouped first (similarity 1.0).
+    The distinct signatures are split into bands; signatures that agree on
+    a whole band land in the same bucket and become candidate pairs.
+    Buckets are sorted runs of equal band keys and each signature is
+    paired with its next `neighbors` signatures in the run, so even huge
+    buckets cost O(pages) instead of O(pages²). Candidate similarity is the
+    fraction of equal signature positions (the MinHash Jaccard estimate).
+    Distinct signatures are processed in sorted order, so results do not
+    depend on page order.
+
+    Args:
+        signatures: One MinHasher signature per page, or a (pages, num_perm)
+            uint32 array of them (e.g. a memmap of spilled signatures)
+        threshold: Minimum similarity for a pair to be reported
+        bands: LSH bands (must divide the signature length)
+        neighbors: Signatures paired per bucket member and band
+        limit: Closest duplicates reported per page
+        chunk_size: Candidate pairs compared per batch
+
+    Returns:
+        Per page (in input order): highest similarity to any candidate
+        (0.0 if none) and up to `limit` (page index, similarity) pairs at
+        or above threshold, closest first
+    """
+    count = len(signatures)
+    if count < 2:
+        return [(0.0, []) for _ in range(count)]
+
+    if isinstance(signatures, np.ndarray):
+        matrix = signatures
+    else:
+        matrix = np.frombuffer(b''.join(signatures), dtype=np.uint32).reshape(count, -1)
+    rows = matrix.shape[1] // bands
+    if rows * bands != matrix.shape[1]:
+        raise ValueError(f"{bands} bands do not divide signature length {matrix.shape[1]}")
+
+    # Identical signatures: one group each, members in page order
+    matrix, group_of = np.unique(matrix, axis=0, return_inverse=True)
+    group_of = group_of.ravel()
+    groups = len(matrix)
+    members: List[List[int]] = [[] for _ in range(groups)]
+    for page, group in enumerate(group_of.tolist()):
+        members[group].append(page)
+
+    # Candidate pairs of groups (a < b) encoded as a * groups + b
+    candidates = []
+    for band in range(bands if groups > 1 else 0):
+        keys = matrix[:, band * rows].astype(np.uint64)
+        for col in range(band * rows + 1, (band + 1) * rows):
+            keys = keys * BAND_MULTIPLIER + matrix[:, col]
+
+        # Stable sort keeps each bucket in group order, so a < b
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        for d in range(1, neighbors + 1):
+            same = sorted_keys[:-d] == sorted_keys[d:]
+            if same.any():
+                candidates.append(order[:-d][same].astype(np.int64) * groups + order[d:][same])
+
+    best = np.zeros(groups)
+    found_a, found_b, found_sim = [], [], []
+    pairs = np.unique(np.concatenate(candidates)) if candidates else np.zeros(0, dtype=np.int64)
+
+    for start in range(0, len(pairs), chunk_size):
+        chunk = pairs[start:start + chunk_size]
+        a, b = chunk // groups, chunk % groups
+        sim = (matrix[a] == matrix[b]).mean(axis=1)
+
+        np.maximum.at(best, a, sim)
+        np.maximum.at(best, b, sim)
+
+        close = sim >= threshold
+        found_a.append(a[close])
+        found_b.append(b[close])
+        found_sim.append(sim[close])
+
+    # Close groups in both directions, closest first
+    close_groups: List[List[Tuple[int, float]]] = [[] for _ in range(groups)]
+    if found_sim:
+        src = np.concatenate(found_a + found_b)
+        dst = np.concatenate(found_b + found_a)
+        sim = np.concatenate(found_sim + found_sim)
+        order = np.lexsort((dst, -sim, src))
+        for group, other, similarity in zip(src[order].tolist(), dst[order].tolist(), sim[order].tolist()):
+            if len(close_groups[group]) < limit:
+                close_groups[group].append((other, similarity))
+
+    results = []
+    for page, group in enumerate(group_of.tolist()):
+        duplicates = [(other, 1.0) for other in members[group][:limit + 1] if other != page][:limit]
+        for other_group, similarity in close_groups[group]:
+            if len(duplicates) >= limit:
+                break
+            duplicates.extend((other, similarity) for other in members[other_group][:limit - len(duplicates)])
+
+        identical = len(members[group]) > 1
+        results.append((1.0 if identical else float(best[group]), duplicates))
+
+    return results
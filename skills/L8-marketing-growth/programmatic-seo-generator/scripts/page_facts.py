@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Page Facts for Programmatic SEO Generator
+Single-pass HTML extractor collecting everything QualityChecker and
+SEOValidator check (text, title, meta, links, images, JSON-LD, canonical),
+and the compact per-page record both checkers work from
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Dict, Optional, Tuple
+
+
+# Elements that never have content (closed as soon as they open)
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed',
+    'frame', 'hr', 'image', 'img', 'input', 'isindex', 'keygen', 'link',
+    'menuitem', 'meta', 'nextid', 'param', 'source', 'spacer', 'track', 'wbr'
+])
+
+# Text inside these elements is not page text
+HIDDEN_ELEMENTS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# Whitespace-only text is kept as is inside these
+PRESERVE_WHITESPACE = frozenset(['pre', 'textarea'])
+
+ASCII_SPACES = frozenset('\x20\x0a\x09\x0c\x0d')
+
+# <meta name=...> and <meta property=...> values collected into PageFacts.meta
+META_NAMES = frozenset(['description', 'keywords', 'robots'])
+META_PROPERTIES = frozenset(['og:title', 'og:description', 'og:image'])
+
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'tel:')
+
+# Words counted by QualityChecker's word count check
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+class PageFacts:
+    """
+    Facts of one page, as BeautifulSoup('html.parser') would report them.
+
+    Attributes:
+        text: Document text (soup.get_text())
+        body_start, body_end: Span of the first <body> in text
+        title: Text of the first <title> (None if missing)
+        h1: Text of the first <h1> (None if missing)
+        h1_count: Number of <h1> tags
+        meta: First content per META_NAMES / META_PROPERTIES key and
+            'canonical' (first <link rel="canonical"> href); a key is present
+            when its tag is, with None if the attribute is missing
+        links: href of every <a href>
+        images: Number of <img> tags
+        images_without_alt: <img> tags with a missing or empty alt
+        schema: Text of the first JSON-LD script (None if missing, '' if empty)
+    """
+
+    __slots__ = ('text', 'body_start', 'body_end', 'title', 'h1', 'h1_count',
+                 'meta', 'links', 'images', 'images_without_alt', 'schema')
+
+    def __init__(self):
+        self.text = ''
+        self.body_start = 0
+        self.body_end = 0
+        self.title: Optional[str] = None
+        self.h1: Optional[str] = None
+        self.h1_count = 0
+        self.meta: Dict[str, Optional[str]] = {}
+        self.links: List[str] = []
+        self.images = 0
+        self.images_without_alt = 0
+        self.schema: Optional[str] = None
+
+    @property
+    def body_text(self) -> str:
+        """Text of the first <body> (whole text if there is none)."""
+        return self.text[self.body_start:self.body_end]
+
+    @property
+    def internal_links(self) -> List[str]:
+        """Links that are not absolute, mailto: or tel: URLs."""
+        return [href for href in self.links if not href.startswith(EXTERNAL_PREFIXES)]
+
+    @property
+    def word_count(self) -> int:
+        """Words in the document text."""
+        return len(WORD_PATTERN.findall(self.text))
+
+
+class PageRecord:
+    """
+    Compact facts of one page: everything QualityChecker and SEOValidator
+    check, without the page text.
+
+    Built from PageFacts after a parse, or loaded from the site database
+    (site_db.py) without touching the HTML.
+
+    Attributes:
+        name: Page name relative to the pages directory
+        url_slug: URL slug (None if not known)
+        content_hash: page_store.content_hash of the HTML (None if not known)
+        title, h1, h1_count, meta, links, images, images_without_alt,
+        schema: As in PageFacts
+        word_count: Words in the document text
+        signature: MinHash signature of the body text (None if not computed)
+    """
+
+    __slots__ = ('name', 'url_slug', 'content_hash', 'title', 'h1', 'h1_count', 'meta', 'links',
+                 'word_count', 'images', 'images_without_alt', 'schema', 'signature')
+
+    def __init__(self, name: str, **values):
+        self.name = name
+        for slot in self.__slots__[1:]:
+            setattr(self, slot, values.get(slot))
+
+    @classmethod
+    def from_facts(
+        cls,
+        facts: PageFacts,
+        name: str,
+        url_slug: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        signature: Optional[bytes] = None
+    ) -> 'PageRecord':
+        """Record of extracted page facts."""
+        return cls(
+            name,
+            url_slug=url_slug,
+            content_hash=content_hash,
+            title=facts.title,
+            h1=facts.h1,
+            h1_count=facts.h1_count,
+            meta=facts.meta,
+            links=facts.links,
+            word_count=facts.word_count,
+            images=facts.images,
+            images_without_alt=facts.images_without_alt,
+            schema=facts.schema,
+            signature=signature
+        )
+
+    @property
+    def internal_links(self) -> List[str]:
+        """Links that are not absolute, mailto: or tel: URLs."""
+        return [href for href in self.links if not href.startswith(EXTERNAL_PREFIXES)]
+
+
+class _FactParser(HTMLParser):
+    """
+    Event handler filling a PageFacts in one pass.
+
+    Follows BeautifulSoup's html.parser tree builder: void elements close
+    immediately, an end tag closes every element opened after its start
+    tag (stray end tags are ignored), and whitespace-only text becomes a
+    single space or newline.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.facts = PageFacts()
+        self.pieces: List[str] = []
+        self.length = 0
+        self.data: List[str] = []
+
+        # Open elements: (name, tracked) where tracked is 'title', 'h1',
+        # 'body' or 'schema' for the first one of each, else None
+        self.stack: List[Tuple[str, Optional[str]]] = []
+        self.spans: Dict[str, List[int]] = {}
+        self.schema_data: Optional[List[str]] = None
+        self.hidden = 0
+        self.preserve = 0
+
+    def _flush(self):
+        """End the current text segment (BeautifulSoup's endData)."""
+        if not self.data:
+            return
+        data = ''.join(self.data)
+        self.data = []
+
+        if not self.preserve and all(c in ASCII_SPACES for c in data):
+            data = '\n' if '\n' in data else ' '
+
+        if self.schema_data is not None:
+            self.schema_data.append(data)
+        if not self.hidden:
+            self.pieces.append(data)
+            self.length += len(data)
+
+    def _open(self, name: str, attrs: Dict[str, str]):
+        tracked = None
+        if name in ('title', 'h1', 'body') and name not in self.spans:
+            tracked = name
+            self.spans[name] = [self.length, -1]
+        elif name == 'script' and attrs.get('type') == 'application/ld+json' and self.facts.schema is None:
+            tracked = 'schema'
+            self.facts.schema = ''
+            self.schema_data = []
+
+        self.stack.append((name, tracked))
+        if name in HIDDEN_ELEMENTS:
+            self.hidden += 1
+        if name in PRESERVE_WHITESPACE:
+            self.preserve += 1
+
+    def _close(self, name: str):
+        if not any(open_name == name for open_name, _ in self.stack):
+            return
+
+        while self.stack:
+            open_name, tracked = self.stack.pop()
+            if tracked == 'schema':
+                self.facts.schema = ''.join(self.schema_data)
+                self.schema_data = None
+            elif tracked:
+                self.spans[tracked][1] = self.length
+            if open_name in HIDDEN_ELEMENTS:
+                self.hidden -= 1
+            if open_name in PRESERVE_WHITESPACE:
+                self.preserve -= 1
+            if open_name == name:
+                break
+
+    def _element(self, name: str, attrs: Dict[str, str]):
+        """Record facts of a start tag."""
+        facts = self.facts
+
+        if name == 'h1':
+            facts.h1_count += 1
+        elif name == 'a':
+            if 'href' in attrs:
+                facts.links.append(attrs['href'])
+        elif name == 'img':
+            facts.images += 1
+            if not attrs.get('alt'):
+                facts.images_without_alt += 1
+        elif name == 'meta':
+            for key, known in ((attrs.get('name'), META_NAMES), (attrs.get('property'), META_PROPERTIES)):
+                if key in known and key not in facts.meta:
+                    facts.meta[key] = attrs.get('content')
+        elif name == 'link':
+            if 'canonical' in attrs.get('rel', '').split() and 'canonical' not in facts.meta:
+                facts.meta['canonical'] = attrs.get('href')
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        # Valueless attributes are '' and the last duplicate wins, as in bs4
+        attributes = {key: '' if value is None else value for key, value in attrs}
+        self._element(tag, attributes)
+        if tag not in VOID_ELEMENTS:
+            self._open(tag, attributes)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._close(tag)
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag not in VOID_ELEMENTS:
+            self._close(tag)
+
+    def handle_data(self, data):
+        self.data.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.upper().startswith('CDATA['):
+            # CDATA sections count as text
+            self.data.append(data[len('CDATA['):])
+            self._flush()
+
+    def result(self) -> PageFacts:
+        """Finish parsing and return the facts."""
+        self.close()
+        self._flush()
+        while self.stack:
+            self._close(self.stack[-1][0])
+
+        facts = self.facts
+        facts.text = ''.join(self.pieces)
+
+        for name, (start, end) in self.spans.items():
+            value = facts.text[start:end]
+            if name == 'body':
+                facts.body_start, facts.body_end = start, end
+            else:
+                setattr(facts, name, value)
+        if 'body' not in self.spans:
+            facts.body_end = len(facts.text)
+
+        return facts
+
+
+def extract_facts(html: str) -> PageFacts:
+    """
+    Extract page facts in a single parse.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        PageFacts of the page
+    """
+    parser = _FactParser()
+    parser.feed(html)
+    return parser.result()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Page Store for Programmatic SEO Generator
+Output layouts for generated pages (flat, sharded, tar/zip archive),
+a uniform reader and the incremental result cache used by
+quality_checker and seo_validator
+"""
+
+import hashlib
+import io
+import json
+import pickle
+import re
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+
+LAYOUTS = ['flat', 'sharded', 'tar', 'zip']
+ARCHIVE_LAYOUTS = ['tar', 'zip']
+
+# Written next to sharded/archived pages; maps page names to URL slugs
+INDEX_FILE = 'page_index.json'
+
+
+def slugify(text: str) -> str:
+    """
+    Convert text to URL-safe slug.
+
+    Examples:
+        "Oak Desk" -> "oak-desk"
+        "Product #123" -> "product-123"
+    """
+    # Lowercase
+    slug = text.lower()
+
+    # Replace spaces and special chars with hyphens
+    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = re.sub(r'[\s_]+', '-', slug)
+
+    # Remove leading/trailing hyphens
+    slug = slug.strip('-')
+
+    return slug or 'page'
+
+
+def page_name(url_slug: str, layout: str = 'flat') -> str:
+    """
+    Relative page name for a URL slug in the given layout.
+
+    Examples:
+        ("oak-desk", "flat")    -> "oak-desk.html"
+        ("oak-desk", "sharded") -> "3f/oak-desk.html"
+    """
+    if layout == 'sharded':
+        # 256 hash-prefix directories keep each directory small
+        prefix = hashlib.md5(url_slug.encode('utf-8')).hexdigest()[:2]
+        return f"{prefix}/{url_slug}.html"
+
+    return f"{url_slug}.html"
+
+
+def archive_name(layout: str) -> str:
+    """Archive filename inside the output directory."""
+    return 'pages.tar' if layout == 'tar' else 'pages.zip'
+
+
+class PageArchive:
+    """Stream pages into a single tar or zip archive."""
+
+    def __init__(self, path: str, layout: str):
+        """
+        Initialize archive writer.
+
+        Args:
+            path: Archive file path (overwritten)
+            layout: 'tar' or 'zip'
+        """
+        if layout not in ARCHIVE_LAYOUTS:
+            raise ValueError(f"Unsupported archive layout: {layout}")
+
+        self.path = Path(path)
+        self.layout = layout
+
+        if layout == 'tar':
+            self._tar = tarfile.open(self.path, 'w', format=tarfile.PAX_FORMAT)
+            self._zip = None
+        else:
+            self._zip = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED)
+            self._tar = None
+
+    def add(self, name: str, html: str) -> Dict[str, Any]:
+        """
+        Append one page.
+
+        Returns:
+            Index entry; for tar archives includes the data offset and size
+            so readers can seek straight to the page
+        """
+        data = html.encode('utf-8')
+
+        if self._zip is not None:
+            self._zip.writestr(name, data)
+            return {'name': name}
+
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+
+        header = info.tobuf(self._tar.format, self._tar.encoding, self._tar.errors)
+        offset = self._tar.offset + len(header)
+        self._tar.addfile(info, io.BytesIO(data))
+
+        return {'name': name, 'offset': offset, 'size': len(data)}
+
+    def close(self):
+        """Finalize the archive."""
+        if self._tar is not None:
+            self._tar.close()
+        if self._zip is not None:
+            self._zip.close()
+
+
+def write_index(output_dir: str, layout: str, pages: List[Dict[str, Any]]) -> Path:
+    """
+    Write the page index for a sharded or archived output.
+
+    Args:
+        output_dir: Output directory
+        layout: Output layout
+        pages: Entries with 'name' and 'url_slug' (plus tar offsets), in page order
+
+    Returns:
+        Path to the index file
+    """
+    index = {
+        'layout': layout,
+        'archive': archive_name(layout) if layout in ARCHIVE_LAYOUTS else None,
+        'pages': pages
+    }
+
+    index_path = Path(output_dir) / INDEX_FILE
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+
+    return index_path
+
+
+def load_index(output_dir: str) -> Optional[Dict[str, Any]]:
+    """Load the page index of an output directory (None for flat output)."""
+    index_path = Path(output_dir) / INDEX_FILE
+    if not index_path.exists():
+        return None
+
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class PageReader:
+    """Read generated pages from any output layout without extracting."""
+
+    def __init__(self, pages_dir: str, listing: Optional[Dict[str, Any]] = None):
+        """
+        Initialize page reader.
+
+        Args:
+            pages_dir: Output directory (flat, sharded, or with pages.tar/pages.zip)
+            listing: Listing of another reader of the same directory (see
+                listing), e.g. in worker processes, to skip the directory
+                scan and index load
+        """
+        self.pages_dir = Path(pages_dir)
+        self._tar_file = None
+        self._zip = None
+
+        if listing is None:
+            listing = self._scan()
+
+        self.layout: str = listing['layout']
+        self.pages: List[str] = listing['pages']
+        self._archive: Optional[str] = listing['archive']
+        self._slugs: Dict[str, str] = listing['slugs']
+        self._offsets: Dict[str, Dict[str, int]] = listing['offsets']
+
+        if self.layout == 'tar':
+            self._tar_file = open(self.pages_dir / self._archive, 'rb')
+        elif self.layout == 'zip':
+            self._zip = zipfile.ZipFile(self.pages_dir / self._archive, 'r')
+
+    def _scan(self) -> Dict[str, Any]:
+        """Listing of pages_dir from its page index, else its *.html files."""
+        index = load_index(self.pages_dir)
+
+        if index is None:
+            pages = sorted(p.name for p in self.pages_dir.glob('*.html'))  # stable page order
+            return {'layout': 'flat', 'archive': None, 'pages': pages, 'slugs': {}, 'offsets': {}}
+
+        listing = {'layout': index['layout'], 'archive': index['archive'], 'pages': [], 'slugs': {}, 'offsets': {}}
+        for entry in index['pages']:
+            listing['pages'].append(entry['name'])
+            listing['slugs'][entry['name']] = entry['url_slug']
+            if 'offset' in entry:
+                listing['offsets'][entry['name']] = {'offset': entry['offset'], 'size': entry['size']}
+        return listing
+
+    @property
+    def listing(self) -> Dict[str, Any]:
+        """Resolved pages, URL slugs and archive offsets (picklable, for PageReader(listing=...))."""
+        return {
+            'layout': self.layout,
+            'archive': self._archive,
+            'pages': self.pages,
+            'slugs': self._slugs,
+            'offsets': self._offsets
+        }
+
+    def read(self, name: str) -> str:
+        """Return the HTML of a page by its relative name."""
+        if self._tar_file is not None:
+            entry = self._offsets[name]
+            self._tar_file.seek(entry['offset'])
+            return self._tar_file.read(entry['size']).decode('utf-8')
+
+        if self._zip is not None:
+            return self._zip.read(name).decode('utf-8')
+
+        with open(self.pages_dir / name, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def url_slug(self, name: str) -> str:
+        """URL slug of a page (from the index, else the filename)."""
+        return self._slugs.get(name) or Path(name).stem
+
+    def close(self):
+        """Release archive handles."""
+        if self._tar_file is not None:
+            self._tar_file.close()
+            self._tar_file = None
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+
+def content_hash(html: str, *extra: str) -> str:
+    """Hash of a page's HTML (plus any extra inputs of its check), used to detect unchanged pages."""
+    digest = hashlib.blake2b(html.encode('utf-8'), digest_size=16)
+    for value in extra:
+        digest.update(b'\0' + value.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Per-page check results from the last run, keyed by page content hash.
+
+    The whole cache is tied to a key (checker version and thresholds): if
+    the key changed since it was written, every page is checked again.
+    """
+
+    def __init__(self, path: str, key: Dict[str, Any]):
+        """
+        Load the cache (empty if missing, unreadable or for another key).
+
+        Args:
+            path: Cache file (pickled)
+            key: Checker version, thresholds and settings results depend on
+        """
+        self.path = Path(path)
+        self.key = key
+        self.pages: Dict[str, Dict[str, Any]] = {}
+
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception:
+            # Unreadable cache: check everything and overwrite it
+            return
+
+        if cache.get('key') == key:
+            self.pages = cache.get('pages', {})
+
+    def hash(self, name: str) -> Optional[str]:
+        """Content hash of a page at the last run (None if not cached)."""
+        entry = self.pages.get(name)
+        return entry['hash'] if entry else None
+
+    def result(self, name: str) -> Any:
+        """Cached result of a page."""
+        return self.pages[name]['result']
+
+    def save(self, entries: List[Tuple[str, str, Any]]):
+        """
+        Replace the cache with this run's results.
+
+        Args:
+            entries: (page name, content hash, result) of every checked
+                page, the result being any picklable value; pages not
+                listed are dropped
+        """
+        self.pages = {name: {'hash': digest, 'result': result} for name, digest, result in entries}
+        tmp_path = self.path.with_suffix('.tmp')
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': self.key, 'pages': self.pages}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # Atomic replace: a crashed run never leaves a truncated cache
+        tmp_path.replace(self.path)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+QA Report Streaming for Programmatic SEO Generator
+JSONL reports written as pages are checked, with summary statistics
+computed online in bounded memory
+"""
+
+import sys
+import argparse
+import json
+import math
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+
+PERCENTILES = [10, 25, 50, 75, 90, 99]
+
+
+def issue_type(message: str) -> str:
+    """Issue or warning message without its details ('Low word count: 65 ...' -> 'Low word count')."""
+    return message.split(':', 1)[0]
+
+
+class QAStats:
+    """
+    Online aggregates of page results.
+
+    Numeric fields are kept as value histograms (scores move in 0.5 steps,
+    word counts are integers), so percentiles are exact while memory grows
+    with the number of distinct values, not with the number of pages.
+    """
+
+    def __init__(self, numeric: Iterable[str] = ('score', 'word_count')):
+        """
+        Initialize aggregates.
+
+        Args:
+            numeric: Result fields to average and compute percentiles for
+        """
+        self.numeric = list(numeric)
+        self.total = 0
+        self.passed = 0
+        self.sums: Dict[str, float] = {field: 0.0 for field in self.numeric}
+        self.histograms: Dict[str, Counter] = {field: Counter() for field in self.numeric}
+        self.issues: Counter = Counter()
+        self.warnings: Counter = Counter()
+
+    def _count(self, values: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) the pass flag and numeric values."""
+        if values['passed']:
+            self.passed += sign
+        for field in self.numeric:
+            value = values[field]
+            self.sums[field] += sign * value
+            self.histograms[field][value] += sign
+            if not self.histograms[field][value]:
+                del self.histograms[field][value]
+
+    def add(self, result: Dict[str, Any]):
+        """Count a page result."""
+        self.total += 1
+        self._count(result, 1)
+        self.issues.update(issue_type(issue) for issue in result['issues'])
+        self.warnings.update(issue_type(warning) for warning in result['warnings'])
+
+    def revise(self, old: Dict[str, Any], new: Dict[str, Any], issues: List[str] = ()):
+        """
+        Update a page already counted (e.g. after the corpus-wide uniqueness check).
+
+        Args:
+            old: Previous pass flag and numeric values of the page
+            new: New pass flag and numeric values
+            issues: Issues added to the page
+        """
+        self._count(old, -1)
+        self._count(new, 1)
+        self.issues.update(issue_type(issue) for issue in issues)
+
+    def percentile(self, field: str, percent: float) -> Optional[float]:
+        """Nearest-rank percentile of a numeric field (None if no pages)."""
+        if not self.total:
+            return None
+
+        rank = max(1, math.ceil(percent / 100 * self.total))
+        seen = 0
+        for value in sorted(self.histograms[field]):
+            seen += self.histograms[field][value]
+            if seen >= rank:
+                return value
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        """Summary statistics of every page counted so far."""
+        total = self.total
+        summary = {
+            'total_pages': total,
+            'passed': self.passed,
+            'failed': total - self.passed,
+            'pass_rate': round(self.passed / total * 100, 1) if total else 0.0
+        }
+
+        for field in self.numeric:
+            summary[f'average_{field}'] = round(self.sums[field] / total, 1) if total else None
+
+        summary['percentiles'] = {
+            field: {f'p{p}': self.percentile(field, p) for p in PERCENTILES}
+            for field in self.numeric
+        }
+        summary['issue_counts'] = dict(self.issues.most_common())
+        summary['warning_counts'] = dict(self.warnings.most_common())
+
+        return summary
+
+
+class JSONLReport:
+    """
+    Streaming QA report: one JSON object per line.
+
+    Records are tagged with 'record':
+        page      one per checked page, in page order
+        revision  later change to a page (new score/passed and added issue)
+        summary   last line; summary statistics of the whole run
+
+    Lines are flushed as they are written, so a run that stops partway
+    still leaves every completed page (see summarize()).
+    """
+
+    def __init__(self, path: str, numeric: Iterable[str] = ('score', 'word_count'), flush_every: int = 100):
+        """
+        Open the report for writing.
+
+        Args:
+            path: Output path (.jsonl)
+            numeric: Result fields to aggregate (see QAStats)
+            flush_every: Flush to disk every N records
+        """
+        self.path = Path(path)
+        self.stats = QAStats(numeric)
+        self.flush_every = flush_every
+        self._pending = 0
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write('\n')
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def add(self, result: Dict[str, Any]):
+        """Write and count a page result."""
+        self.stats.add(result)
+        self._write({'record': 'page', **result})
+
+    def revise(self, page: str, old: Dict[str, Any], new: Dict[str, Any], issues: List[str] = (), **details):
+        """
+        Write and count a revision of an earlier page record.
+
+        Args:
+            page: Page name
+            old: Previous pass flag and numeric values
+            new: New pass flag and numeric values
+            issues: Issues added to the page
+            **details: Extra fields for the record (e.g. duplicates)
+        """
+        self.stats.revise(old, new, issues)
+        self._write({'record': 'revision', 'page': page, **new, 'issues': list(issues), **details})
+
+    def close(self, **extra) -> Dict[str, Any]:
+        """
+        Write the summary line and close the report.
+
+        Args:
+            **extra: Additional summary fields
+
+        Returns:
+            Summary statistics
+        """
+        summary = {**self.stats.summary(), **extra}
+        self._write({'record': 'summary', **summary})
+        self._file.close()
+        return summary
+
+
+def summarize(path: str, numeric: Iterable[str] = ('score', 'word_count')) -> Dict[str, Any]:
+    """
+    Recompute summary statistics from the page and revision records of a
+    JSONL report (e.g. one left by a run that stopped partway).
+
+    Args:
+        path: JSONL report
+        numeric: Result fields to aggregate
+
+    Returns:
+        Summary statistics; 'complete' is False if the report has no
+        summary line
+    """
+    stats = QAStats(numeric)
+    fields = ['passed'] + stats.numeric
+    current: Dict[str, Dict[str, Any]] = {}  # pass flag and numeric values per page
+    complete = False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Last line cut off by a crash
+                break
+
+            kind = record.get('record')
+            if kind == 'page':
+                stats.add(record)
+                current[record['page']] = {field: record[field] for field in fields}
+            elif kind == 'revision':
+                new = {field: record[field] for field in fields}
+                stats.revise(current[record['page']], new, record['issues'])
+                current[record['page']] = new
+            elif kind == 'summary':
+                complete = True
+
+    return {**stats.summary(), 'complete': complete}
+
+
+def main():
+    """CLI interface: summarize a JSONL QA report."""
+    parser = argparse.ArgumentParser(description='Summarize a streaming (JSONL) quality report')
+    parser.add_argument('report', help='JSONL report written by quality_checker.py --jsonl')
+
+    args = parser.parse_args()
+
+    try:
+        summary = summarize(args.report)
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+
+        if not summary['complete']:
+            print(f"\n⚠️  No summary line: the run stopped after {summary['total_pages']} pages")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
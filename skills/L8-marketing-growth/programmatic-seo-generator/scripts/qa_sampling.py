@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+QA Sampling for Programmatic SEO Generator
+Stratified random samples of pages and pass-rate confidence intervals,
+to gate large runs without checking every page
+"""
+
+import math
+import random
+from collections import Counter
+from statistics import NormalDist
+from typing import List, Dict, Any, Optional, Tuple
+from page_store import slugify
+
+
+def stratified_order(strata: List[str], size: int, rng: random.Random) -> List[int]:
+    """
+    Draw a proportionally stratified random sample, in checking order.
+
+    Each stratum is shuffled and its pages are spread evenly over [0, 1)
+    (systematic keys (k + offset) / stratum size); sorting by key then
+    interleaves the strata, so every prefix of the order is itself a
+    proportional stratified sample and checking can stop at any point.
+
+    Args:
+        strata: Stratum of each page
+        size: Sample size (capped at the number of pages)
+        rng: Random generator
+
+    Returns:
+        Page indices of the sample, in checking order
+    """
+    members: Dict[str, List[int]] = {}
+    for page, stratum in enumerate(strata):
+        members.setdefault(stratum, []).append(page)
+
+    keyed = []
+    for pages in members.values():
+        rng.shuffle(pages)
+        offset = rng.random()
+        keyed.extend(((k + offset) / len(pages), page) for k, page in enumerate(pages))
+
+    keyed.sort()
+    return [page for _, page in keyed[:size]]
+
+
+def wilson_interval(rate: float, n: float, z: float) -> Tuple[float, float]:
+    """Wilson score interval of a proportion observed in n trials."""
+    if n <= 0:
+        return 0.0, 1.0
+
+    denominator = 1 + z * z / n
+    centre = (rate + z * z / (2 * n)) / denominator
+    half = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / denominator
+    # The observed rate is always inside (guards rounding at 0 and 1)
+    return max(0.0, min(rate, centre - half)), min(1.0, max(rate, centre + half))
+
+
+class PassRateEstimate:
+    """
+    Stratified estimate of the pass rate of all pages from a sample.
+
+    The estimate weights each stratum's sample pass rate by its share of
+    pages. The interval is a Wilson interval on the effective sample size
+    (sample pass-rate variance with finite population correction).
+    Strata without sampled pages yet are unknown: they count as all failing
+    for the lower bound and all passing for the upper bound.
+    """
+
+    def __init__(self, sizes: Dict[str, int], confidence: float = 0.99, gate: float = 90.0):
+        """
+        Initialize estimate.
+
+        Args:
+            sizes: Pages per stratum
+            confidence: Confidence level of the interval
+            gate: Pass rate (percent) the run must reach
+        """
+        self.sizes = dict(sizes)
+        self.total = sum(self.sizes.values())
+        self.confidence = confidence
+        self.gate = gate
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.sampled: Counter = Counter()
+        self.passed: Counter = Counter()
+
+    def add(self, stratum: str, passed: bool):
+        """Count a checked page."""
+        self.sampled[stratum] += 1
+        if passed:
+            self.passed[stratum] += 1
+
+    def interval(self) -> Tuple[float, float, float]:
+        """
+        Current estimate.
+
+        Returns:
+            (pass rate, lower bound, upper bound) as fractions
+        """
+        covered = [stratum for stratum in self.sizes if self.sampled[stratum]]
+        if not covered:
+            return 0.0, 0.0, 1.0
+
+        covered_pages = sum(self.sizes[stratum] for stratum in covered)
+        rate = 0.0
+        variance = 0.0
+        for stratum in covered:
+            weight = self.sizes[stratum] / covered_pages
+            n = self.sampled[stratum]
+            stratum_rate = self.passed[stratum] / n
+            rate += weight * stratum_rate
+            if n > 1:
+                fpc = 1 - n / self.sizes[stratum]
+                variance += weight * weight * stratum_rate * (1 - stratum_rate) / (n - 1) * fpc
+
+        sampled = sum(self.sampled[stratum] for stratum in covered)
+        if sampled >= covered_pages:
+            lower = upper = rate  # every page checked
+        else:
+            if variance > 0 and 0 < rate < 1:
+                effective = rate * (1 - rate) / variance
+            else:
+                # No spread observed: plain sample size, corrected for the
+                # share of pages already checked
+                effective = sampled / (1 - sampled / covered_pages)
+            lower, upper = wilson_interval(rate, effective, self.z)
+
+        share = covered_pages / self.total
+        return rate, lower * share, upper * share + (1 - share)
+
+    def decision(self) -> Optional[str]:
+        """'pass' or 'fail' once the interval clears the gate, else None."""
+        _, lower, upper = self.interval()
+        if lower * 100 >= self.gate:
+            return 'pass'
+        if upper * 100 < self.gate:
+            return 'fail'
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        """Estimate, interval, decision and per-stratum counts."""
+        rate, lower, upper = self.interval()
+        return {
+            'sampled': sum(self.sampled.values()),
+            'pass_rate': round(rate * 100, 1),
+            'interval': [round(lower * 100, 1), round(upper * 100, 1)],
+            'confidence': self.confidence,
+            'gate': self.gate,
+            'decision': self.decision() or 'inconclusive',
+            'strata': {
+                stratum: {
+                    'pages': pages,
+                    'sampled': self.sampled[stratum],
+                    'pass_rate': (round(self.passed[stratum] / self.sampled[stratum] * 100, 1)
+                                  if self.sampled[stratum] else None)
+                }
+                for stratum, pages in sorted(self.sizes.items(), key=lambda item: -item[1])
+            }
+        }
+
+
+def load_fields(data_path: str, fields: List[str], url_field: str = 'id') -> Dict[str, Dict[str, str]]:
+    """
+    Map URL slugs to fields of the rows they were generated from.
+
+    Slugs are derived the way template_engine.py derives them (url_field,
+    or the 1-based row number if missing, through slugify).
+
+    Args:
+        data_path: Data source the pages were generated from
+        fields: Row fields to read (e.g. category, page_type)
+        url_field: Field used for URL slugs when generating
+
+    Returns:
+        URL slug -> {field: value ('' if missing)}
+    """
+    # pandas (via DataLoader) is only needed when reading data fields
+    from data_loader import DataLoader
+
+    loader = DataLoader(data_path, columns=list(fields) + [url_field])
+    values = {}
+    for index, row in enumerate(loader.iter_rows(), 1):
+        values[slugify(str(row.get(url_field, index)))] = {
+            field: '' if row.get(field) is None else str(row.get(field)) for field in fields
+        }
+    return values
+
+
+def load_strata(data_path: str, field: str, url_field: str = 'id') -> Dict[str, str]:
+    """
+    Map URL slugs to a stratum field of the rows they were generated from
+    (see load_fields).
+
+    Returns:
+        URL slug -> field value
+    """
+    return {slug: values[field] for slug, values in load_fields(data_path, [field], url_field).items()}
@@ -7,10 +7,20 @@ Validates generated pages against SEO best practices
 import sys
 import argparse
 import json
+import random
+import tempfile
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import re
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Union
+import numpy as np
+from page_store import PageReader, ResultCache, content_hash
+from page_facts import PageFacts, PageRecord, extract_facts
+from near_duplicates import MinHasher, find_near_duplicates
+from qa_report import JSONLReport, QAStats
+from qa_sampling import PassRateEstimate, load_strata, stratified_order
+from site_db import SiteDB
 
 
 class QualityChecker:
@@ -24,31 +34,76 @@ class QualityChecker:
     META_TITLE_MAX = 60
     META_DESC_MIN = 150
     META_DESC_MAX = 160
-
-    def __init__(self, pages_dir: str):
+    MAX_DUPLICATES = 5  # closest duplicates reported per page
+
+    # Incremental mode: bump CACHE_VERSION whenever per-page checks change
+    CACHE_FILE = 'quality_cache.pkl'
+    CACHE_VERSION = 2
+
+    def __init__(
+        self,
+        pages_dir: str,
+        load: bool = True,
+        db: Optional[str] = None,
+        boilerplate: Iterable[int] = ()
+    ):
         """
         Initialize quality checker.
 
         Args:
             pages_dir: Directory containing generated HTML pages
+            load: Collect pages from pages_dir (False to check rendered
+                HTML in memory via check_html)
+            db: Site database (site_db.py) to read page facts from instead
+                of parsing the HTML
+            boilerplate: Shingle hashes of the template text, left out of
+                the uniqueness signatures (see template_engine.template_boilerplate)
         """
         self.pages_dir = Path(pages_dir)
-        self.pages: List[Path] = []
+        self.db_path = db
+        self.pages: List[str] = []  # page names relative to pages_dir
+        self.reader: Optional[PageReader] = None
+        self.db: Optional[SiteDB] = None
         self.results: List[Dict[str, Any]] = []
+        self._signatures: List[bytes] = []  # MinHash signature of each result, until check_uniqueness()
+        self.minhasher = MinHasher(boilerplate=boilerplate)
+        self.incremental: Optional[Dict[str, int]] = None  # reuse stats of the last check_all()
 
         # Load pages
-        self._load_pages()
+        if load:
+            self._load_pages()
+
+    def _load_pages(self, listing: Optional[Dict[str, Any]] = None):
+        """
+        Load all HTML pages from directory (flat, sharded or archived) or the site database.
+
+        Args:
+            listing: Page listing of a loaded instance (see listing), to
+                skip the directory scan (worker processes)
+        """
+        if self.db_path:
+            self.db = SiteDB(self.db_path, readonly=True)
+            if (self.db.minhash() or [])[:2] != [self.minhasher.num_perm, self.minhasher.shingle_size]:
+                raise ValueError(f"Signatures in {self.db.path} use other MinHash settings (rebuild it)")
+            self.pages = listing['pages'] if listing else self.db.names()
+            if not self.pages:
+                raise ValueError(f"No pages in site database: {self.db.path}")
+            return
 
-    def _load_pages(self):
-        """Load all HTML pages from directory."""
         if not self.pages_dir.exists():
             raise FileNotFoundError(f"Pages directory not found: {self.pages_dir}")
 
-        self.pages = list(self.pages_dir.glob('*.html'))
+        self.reader = PageReader(str(self.pages_dir), listing)
+        self.pages = self.reader.pages
 
         if not self.pages:
             raise ValueError(f"No HTML pages found in: {self.pages_dir}")
 
+    @property
+    def listing(self) -> Dict[str, Any]:
+        """Resolved pages (and archive offsets) for worker processes."""
+        return self.reader.listing if self.reader is not None else {'pages': self.pages}
+
     def check_page(self, page_path: Path) -> Dict[str, Any]:
         """
         Check single page quality.
@@ -59,39 +114,82 @@ class QualityChecker:
         with open(page_path, 'r', encoding='utf-8') as f:
             html = f.read()
 
-        soup = BeautifulSoup(html, 'html.parser')
+        return self.check_html(html, page_path.name)
+
+    def check_html(
+        self,
+        html: str,
+        page_name: str,
+        facts: Optional[PageFacts] = None
+    ) -> Dict[str, Any]:
+        """
+        Check quality of a rendered page held in memory.
+
+        Args:
+            html: Page HTML
+            page_name: Page filename used in the report (e.g. 'oak-desk.html')
+            facts: Already extracted page facts, to share one parse between checkers
+
+        Returns:
+            Quality report with score (1-10) and issues
+        """
+        return self._check_html(html, page_name, facts)[0]
+
+    def _check_html(
+        self,
+        html: str,
+        page_name: str,
+        facts: Optional[PageFacts] = None
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """check_html() plus the page's MinHash signature (for check_uniqueness())."""
+        if facts is None:
+            facts = extract_facts(html)
+
+        # Uniqueness needs every page: keep a MinHash signature of the body text
+        signature = self.minhasher.signature(facts.body_text)
+        return self._check_record(PageRecord.from_facts(facts, page_name, signature=signature))
+
+    def check_record(self, record: PageRecord) -> Dict[str, Any]:
+        """
+        Check quality of a page from its facts record (no HTML needed).
+
+        Args:
+            record: Page facts (from a parse or the site database)
+
+        Returns:
+            Quality report with score (1-10) and issues
+        """
+        return self._check_record(record)[0]
 
+    def _check_record(self, record: PageRecord) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """check_record() plus the record's MinHash signature (for check_uniqueness())."""
         issues = []
         warnings = []
         score = 10.0  # Start with perfect score, deduct for issues
 
         # 1. Word count check
-        text = soup.get_text()
-        words = re.findall(r'\b\w+\b', text)
-        word_count = len(words)
+        word_count = record.word_count
 
         if word_count < self.MIN_WORD_COUNT:
             issues.append(f"Low word count: {word_count} (min {self.MIN_WORD_COUNT})")
             score -= 2.0
 
         # 2. H1 tag check
-        h1_tags = soup.find_all('h1')
+        h1_count = record.h1_count
 
-        if len(h1_tags) == 0:
+        if h1_count == 0:
             issues.append("Missing H1 tag")
             score -= 1.5
-        elif len(h1_tags) > 1:
-            warnings.append(f"Multiple H1 tags found ({len(h1_tags)})")
+        elif h1_count > 1:
+            warnings.append(f"Multiple H1 tags found ({h1_count})")
             score -= 0.5
 
         # 3. Meta title check
-        meta_title = soup.find('title')
-
-        if not meta_title:
+        if record.title is None:
             issues.append("Missing <title> tag")
             score -= 1.5
         else:
-            title_length = len(meta_title.get_text())
+            title_length = len(record.title)
             if title_length < self.META_TITLE_MIN:
                 warnings.append(f"Meta title too short: {title_length} chars (recommended {self.META_TITLE_MIN}-{self.META_TITLE_MAX})")
                 score -= 0.5
@@ -100,14 +198,13 @@ class QualityChecker:
                 score -= 0.5
 
         # 4. Meta description check
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        has_meta_desc = 'description' in record.meta
 
-        if not meta_desc:
+        if not has_meta_desc:
             issues.append("Missing meta description")
             score -= 1.5
         else:
-            desc_content = meta_desc.get('content', '')
-            desc_length = len(desc_content)
+            desc_length = len(record.meta['description'] or '')
             if desc_length < self.META_DESC_MIN:
                 warnings.append(f"Meta description too short: {desc_length} chars (recommended {self.META_DESC_MIN}-{self.META_DESC_MAX})")
                 score -= 0.5
@@ -116,28 +213,19 @@ class QualityChecker:
                 score -= 0.5
 
         # 5. Internal links check
-        internal_links = soup.find_all('a', href=True)
-        internal_link_count = len([
-            link for link in internal_links
-            if not link['href'].startswith(('http://', 'https://', 'mailto:', 'tel:'))
-        ])
+        internal_link_count = len(record.internal_links)
 
         if internal_link_count < self.MIN_INTERNAL_LINKS:
             issues.append(f"Few internal links: {internal_link_count} (min {self.MIN_INTERNAL_LINKS})")
             score -= 1.0
 
         # 6. Image alt tags check
-        images = soup.find_all('img')
-        images_without_alt = [img for img in images if not img.get('alt')]
-
-        if images_without_alt:
-            issues.append(f"Images missing alt tags: {len(images_without_alt)}/{len(images)}")
+        if record.images_without_alt:
+            issues.append(f"Images missing alt tags: {record.images_without_alt}/{record.images}")
             score -= 1.0
 
         # 7. Schema markup check
-        schema_script = soup.find('script', attrs={'type': 'application/ld+json'})
-
-        if not schema_script:
+        if record.schema is None:
             warnings.append("Missing schema markup (JSON-LD)")
             score -= 0.5
 
@@ -147,42 +235,335 @@ class QualityChecker:
         # Determine pass/fail
         passed = score >= 7.0 and len(issues) == 0
 
-        return {
-            'page': page_path.name,
+        # 8. Uniqueness is checked corpus-wide (check_uniqueness())
+        result = {
+            'page': record.name,
             'score': round(score, 1),
             'passed': passed,
             'word_count': word_count,
             'internal_links': internal_link_count,
-            'h1_count': len(h1_tags),
-            'has_meta_title': meta_title is not None,
-            'has_meta_description': meta_desc is not None,
-            'has_schema': schema_script is not None,
-            'images_total': len(images),
-            'images_with_alt': len(images) - len(images_without_alt),
+            'h1_count': h1_count,
+            'has_meta_title': record.title is not None,
+            'has_meta_description': has_meta_desc,
+            'has_schema': record.schema is not None,
+            'images_total': record.images,
+            'images_with_alt': record.images - record.images_without_alt,
             'issues': issues,
             'warnings': warnings
         }
+        return result, record.signature
+
+    def set_results(self, results: List[Dict[str, Any]], signatures: List[bytes]):
+        """
+        Take results checked elsewhere (see _check_html(), e.g. while
+        rendering) with their MinHash signatures, for build_report().
+        """
+        if len(results) != len(signatures):
+            raise ValueError(f"{len(results)} results but {len(signatures)} signatures")
+        self.results = results
+        self._signatures = signatures
 
-    def check_all(self) -> Dict[str, Any]:
+    def check_uniqueness(self):
+        """
+        Compare all checked pages with each other (corpus-wide check).
+
+        Uses the MinHash signatures kept with self.results (by check_all()
+        or set_results()) with an LSH index, so only likely duplicates are
+        compared. Adds 'uniqueness' (percent, 100 minus the highest
+        similarity found) and 'duplicates' (closest pages above the
+        MIN_UNIQUENESS limit) to every result and fails pages below
+        MIN_UNIQUENESS. Signatures are dropped afterwards, so calling this
+        again is a no-op.
+        """
+        if not self._signatures:
+            return
+
+        signatures, self._signatures = self._signatures, []
+        matches = self._near_duplicates([r['page'] for r in self.results], signatures)
+
+        for result, (uniqueness, duplicates) in zip(self.results, matches):
+            result['uniqueness'] = uniqueness
+            result['duplicates'] = duplicates
+
+            if uniqueness < self.MIN_UNIQUENESS:
+                result['issues'].append(self._duplicate_issue(uniqueness, duplicates))
+                result['score'] = self._duplicate_score(result['score'])
+                result['passed'] = False
+
+    def _near_duplicates(
+        self,
+        names: List[str],
+        signatures: Union[List[bytes], np.ndarray]
+    ) -> List[Tuple[float, List[Dict[str, Any]]]]:
+        """(uniqueness, closest duplicates) of every page."""
+        threshold = 1 - self.MIN_UNIQUENESS / 100
+        matches = find_near_duplicates(signatures, threshold, limit=self.MAX_DUPLICATES)
+        return [
+            (round((1 - best) * 100, 1),
+             [{'page': names[other], 'similarity': round(similarity, 2)} for other, similarity in duplicates])
+            for best, duplicates in matches
+        ]
+
+    def _duplicate_issue(self, uniqueness: float, duplicates: List[Dict[str, Any]]) -> str:
+        """Issue message for a page below MIN_UNIQUENESS."""
+        closest = duplicates[0]
+        return (f"Near-duplicate content: {uniqueness}% unique (min {self.MIN_UNIQUENESS}%), "
+                f"closest: {closest['page']} ({closest['similarity']:.0%} similar)")
+
+    def _duplicate_score(self, score: float) -> float:
+        """Score of a page after failing the uniqueness check."""
+        return round(max(1.0, score - 1.5), 1)
+
+    def check_all(
+        self,
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        incremental: bool = False,
+        jsonl: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Check all pages in directory.
 
+        Args:
+            workers: Number of worker processes (1 = check in this process)
+            chunk_size: Pages per worker task (default: spread ~4 chunks per worker)
+            incremental: Reuse results of pages whose HTML is unchanged since
+                the last incremental run (cached in CACHE_FILE)
+            jsonl: Stream results to this JSONL report as they are produced
+                instead of collecting them (see qa_report.JSONLReport)
+
         Returns:
-            Quality report for all pages
+            Quality report for all pages (results in self.pages order,
+            whatever the number of workers); with jsonl, only the summary
         """
         print(f"Checking {len(self.pages)} pages...")
 
         self.results = []
+        self._signatures = []
+        self.incremental = None
+        cache = ResultCache(str(self.pages_dir / self.CACHE_FILE), self.cache_key()) if incremental else None
+        previous = [cache.hash(name) if cache else None for name in self.pages]
+        entries = []  # (name, content hash, (result, signature)) for the cache
+        reused = 0
+
+        # Streaming keeps only what the uniqueness check needs per page;
+        # signatures are spilled to a temporary file until the end
+        report = JSONLReport(jsonl) if jsonl else None
+        signature_file = tempfile.TemporaryFile() if report else None
+        scores = array('d')
+        word_counts = array('q')
+        passed = bytearray()
+
+        checked = self._iter_checked(self.pages, previous, workers, chunk_size)
+        for name, (digest, result, signature) in zip(self.pages, checked):
+            if result is None:
+                result, signature = cache.result(name)
+                reused += 1
+            if cache:
+                entries.append((name, digest, (result, signature)))
+
+            if report is None:
+                self.results.append(result)
+                self._signatures.append(signature)
+                continue
+
+            signature_file.write(signature)
+            scores.append(result['score'])
+            word_counts.append(result['word_count'])
+            passed.append(result['passed'])
+            report.add(result)
+
+        if cache:
+            # Saved before the uniqueness check changes results
+            cache.save(entries)
+            self.incremental = {'reused': reused, 'checked': len(self.pages) - reused}
+
+        print(f"\n✅ Quality check complete!")
+
+        if report is None:
+            return self.build_report()
+
+        # Uniqueness results arrive as revisions of the pages they fail
+        duplicate_pages = 0
+        signature_file.flush()
+        with signature_file:
+            signatures = np.memmap(signature_file, dtype=np.uint32, mode='r').reshape(len(self.pages), -1)
+            matches = self._near_duplicates(self.pages, signatures)
+        for i, (uniqueness, duplicates) in enumerate(matches):
+            if uniqueness >= self.MIN_UNIQUENESS:
+                continue
+            duplicate_pages += 1
+            old = {'passed': bool(passed[i]), 'score': scores[i], 'word_count': word_counts[i]}
+            new = {**old, 'passed': False, 'score': self._duplicate_score(scores[i])}
+            report.revise(self.pages[i], old, new, [self._duplicate_issue(uniqueness, duplicates)],
+                          uniqueness=uniqueness, duplicates=duplicates)
+
+        extra = {'near_duplicate_pages': duplicate_pages}
+        if self.incremental is not None:
+            extra['incremental'] = self.incremental
+        return report.close(**extra)
+
+    def check_sample(
+        self,
+        size: int,
+        strata: Optional[List[str]] = None,
+        confidence: float = 0.99,
+        gate: float = 90.0,
+        check_every: int = 50,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Gate a run on a stratified random sample instead of every page.
+
+        Pages are checked in stratified_order(), so any prefix is a
+        proportional sample. Every `check_every` pages the stratified pass
+        rate interval is compared with the gate; checking stops as soon as
+        the interval is entirely above (pass) or below (fail) it. If the
+        sample runs out first the decision is 'inconclusive' and a full
+        check_all() is needed. The corpus-wide uniqueness check needs every
+        page and is not part of the estimate.
 
-        for i, page_path in enumerate(self.pages, 1):
-            result = self.check_page(page_path)
+        Args:
+            size: Maximum pages to check
+            strata: Stratum of each page in self.pages (default: one stratum)
+            confidence: Confidence level of the pass rate interval
+            gate: Pass rate (percent) the run must reach
+            check_every: Pages checked between interval checks
+            seed: Sampling seed (default: random; the seed used is reported)
+            workers: Number of worker processes (1 = check in this process)
+            chunk_size: Pages per worker task (default: check_every / workers)
+
+        Returns:
+            Sample report: estimate, interval, decision, per-stratum counts
+            and the checked pages' results
+        """
+        strata = strata or ['all'] * len(self.pages)
+        seed = seed if seed is not None else random.randrange(2**32)
+        order = stratified_order(strata, size, random.Random(seed))
+        names = [self.pages[i] for i in order]
+        print(f"Sampling up to {len(names)} of {len(self.pages)} pages...")
+
+        estimate = PassRateEstimate(Counter(strata), confidence, gate)
+        stats = QAStats()
+        self.results = []
+        self._signatures = []  # uniqueness is not part of the sample
+        self.incremental = None
+
+        checked = self._iter_checked(names, [None] * len(names), workers, chunk_size or max(1, check_every // workers))
+        for i, (page, (_, result, _)) in enumerate(zip(order, checked), 1):
             self.results.append(result)
+            stats.add(result)
+            estimate.add(strata[page], result['passed'])
 
-            # Progress indicator
-            if i % 10 == 0 or i == len(self.pages):
-                print(f"  {i}/{len(self.pages)} pages checked...", end='\r')
+            if i % check_every == 0 and estimate.decision():
+                break
+        checked.close()
 
-        print(f"\n✅ Quality check complete!")
+        print(f"\n✅ Sample check complete!")
+
+        summary = stats.summary()
+        return {
+            'mode': 'sample',
+            'total_pages': len(self.pages),
+            **estimate.summary(),
+            'seed': seed,
+            'average_score': summary['average_score'],
+            'percentiles': summary['percentiles'],
+            'issue_counts': summary['issue_counts'],
+            'warning_counts': summary['warning_counts'],
+            'pages_with_issues': [r for r in self.results if r['issues']],
+            'results': self.results
+        }
+
+    def _iter_checked(
+        self,
+        names: List[str],
+        previous: List[Optional[str]],
+        workers: int,
+        chunk_size: Optional[int]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[bytes]]]:
+        """Yield _check_stored() results for the named pages in order, serially or in a process pool."""
+        total = len(names)
+
+        if workers > 1 and total > 1:
+            chunk_size = chunk_size or max(1, -(-total // (workers * 4)))
+            pending = deque()
+            done = 0
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(self.pages_dir), self.listing, self.db_path, self.minhasher.boilerplate.tolist())
+            ) as executor:
+                # Bounded in-flight chunks; results are collected in submission order
+                for start in range(0, total, chunk_size):
+                    stop = start + chunk_size
+                    pending.append(executor.submit(_check_chunk, names[start:stop], previous[start:stop]))
+                    while pending and (len(pending) >= workers * 2 or stop >= total):
+                        chunk = pending.popleft().result()
+                        yield from chunk
+                        done += len(chunk)
+                        print(f"  {done}/{total} pages checked...", end='\r')
+        else:
+            for i, name in enumerate(names, 1):
+                yield self._check_stored(name, previous[i - 1])
+
+                # Progress indicator
+                if i % 10 == 0 or i == total:
+                    print(f"  {i}/{total} pages checked...", end='\r')
+
+    def cache_key(self) -> Dict[str, Any]:
+        """Checker version and every setting a per-page result depends on."""
+        return {
+            'version': self.CACHE_VERSION,
+            'thresholds': {
+                'min_word_count': self.MIN_WORD_COUNT,
+                'min_internal_links': self.MIN_INTERNAL_LINKS,
+                'meta_title': [self.META_TITLE_MIN, self.META_TITLE_MAX],
+                'meta_description': [self.META_DESC_MIN, self.META_DESC_MAX]
+            },
+            'minhash': self.db.minhash() if self.db is not None else self.minhasher.settings
+        }
+
+    def _check_stored(
+        self,
+        name: str,
+        previous_hash: Optional[str] = None
+    ) -> Tuple[str, Optional[Dict[str, Any]], Optional[bytes]]:
+        """
+        Check a page from pages_dir (or the site database) unless its HTML
+        is unchanged.
+
+        Returns:
+            (content hash, result, MinHash signature), with result and
+            signature None if the hash equals previous_hash (cached result
+            still valid)
+        """
+        if self.db is not None:
+            record = self.db.record(name)
+            digest = record.content_hash
+            if digest == previous_hash:
+                return digest, None, None
+            return (digest,) + self._check_record(record)
+        else:
+            html = self.reader.read(name)
+            digest = content_hash(html)
+            if digest == previous_hash:
+                return digest, None, None
+            return (digest,) + self._check_html(html, name)
+
+    def build_report(self) -> Dict[str, Any]:
+        """
+        Summarize collected results.
+
+        Runs the corpus-wide uniqueness check first (see check_uniqueness).
+
+        Returns:
+            Quality report for all pages in self.results
+        """
+        self.check_uniqueness()
 
         # Calculate summary stats
         passed_count = sum(1 for r in self.results if r['passed'])
@@ -191,29 +572,157 @@ class QualityChecker:
 
         # Find pages with issues
         pages_with_issues = [r for r in self.results if r['issues']]
+        duplicate_pages = sum(1 for r in self.results if r.get('uniqueness', 100) < self.MIN_UNIQUENESS)
 
-        return {
+        # Same distribution stats as the streaming report
+        stats = QAStats()
+        for r in self.results:
+            stats.add(r)
+        summary = stats.summary()
+
+        report = {
             'total_pages': len(self.results),
             'passed': passed_count,
             'failed': failed_count,
             'pass_rate': round((passed_count / len(self.results)) * 100, 1),
             'average_score': round(avg_score, 1),
+            'near_duplicate_pages': duplicate_pages,
+            'percentiles': summary['percentiles'],
+            'issue_counts': summary['issue_counts'],
+            'warning_counts': summary['warning_counts'],
             'pages_with_issues': pages_with_issues,
             'results': self.results
         }
+        if self.incremental is not None:
+            report['incremental'] = self.incremental
+
+        return report
+
+
+# Per-process checker for --workers mode (pages are read in the worker)
+_worker_checker: Optional[QualityChecker] = None
+
+
+def _init_worker(
+    pages_dir: str,
+    listing: Dict[str, Any],
+    db: Optional[str] = None,
+    boilerplate: List[int] = ()
+):
+    """Open the pages directory (or archive, or site database) once in each worker process, from the parent's listing."""
+    global _worker_checker
+    _worker_checker = QualityChecker(pages_dir, load=False, db=db, boilerplate=boilerplate)
+    _worker_checker._load_pages(listing)
+
+
+def _check_chunk(
+    names: List[str],
+    previous: List[Optional[str]]
+) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[bytes]]]:
+    """Check a contiguous chunk of pages in a worker process, in order."""
+    return [_worker_checker._check_stored(name, digest) for name, digest in zip(names, previous)]
+
+
+def run_sample(checker: QualityChecker, args: argparse.Namespace):
+    """Sampling mode of the CLI: exit 0 on pass, 1 on fail, 2 if inconclusive."""
+    strata = None
+    if args.sample_by:
+        by_slug = load_strata(args.data, args.sample_by, args.url_field)
+        source = checker.db or checker.reader
+        strata = [by_slug.get(source.url_slug(name), '(not in data)') for name in checker.pages]
+
+    report = checker.check_sample(
+        args.sample,
+        strata=strata,
+        confidence=args.confidence,
+        seed=args.seed,
+        workers=args.workers
+    )
+
+    # Print summary
+    print(f"\n{'='*50}")
+    print(f"QUALITY SAMPLE REPORT")
+    print(f"{'='*50}")
+    print(f"Sampled: {report['sampled']} of {report['total_pages']} pages (seed {report['seed']})")
+    print(f"Estimated pass rate: {report['pass_rate']}% "
+          f"({report['confidence']:.0%} interval {report['interval'][0]}-{report['interval'][1]}%)")
+    print(f"Average Score: {report['average_score']}/10")
+    if args.sample_by:
+        print(f"\n📊 By {args.sample_by}:")
+        for stratum, counts in list(report['strata'].items())[:10]:
+            rate = f"{counts['pass_rate']}%" if counts['pass_rate'] is not None else '-'
+            print(f"   {stratum}: {counts['sampled']}/{counts['pages']} sampled, {rate} passed")
+    if report['issue_counts']:
+        print(f"\n⚠️  Issues by type (sample):")
+        for issue, count in report['issue_counts'].items():
+            print(f"     ❌ {issue}: {count} pages")
+
+    output_path = args.output or Path(args.input) / 'quality_sample_report.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\n📊 Sample report saved to: {output_path}")
+
+    if report['decision'] == 'pass':
+        print(f"\n✅ Pass rate above {report['gate']:.0f}% - ready to scale")
+    elif report['decision'] == 'fail':
+        print(f"\n❌ Pass rate below {report['gate']:.0f}% - review and fix issues before scaling")
+        sys.exit(1)
+    else:
+        print(f"\n⚠️  Too close to call - run the full check (without --sample)")
+        sys.exit(2)
 
 
 def main():
     """CLI interface for quality checker."""
     parser = argparse.ArgumentParser(description='Check quality of generated pages')
     parser.add_argument('--input', required=True, help='Directory with generated pages')
-    parser.add_argument('--output', help='Output path for quality report JSON')
+    parser.add_argument('--output', help='Output path for quality report JSON (or JSONL)')
+    parser.add_argument('--workers', type=int, default=1, help='Check in N parallel processes (default: 1)')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'Reuse results of unchanged pages (cached in {QualityChecker.CACHE_FILE})')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Stream results to quality_report.jsonl as pages are checked (results are not kept in memory)')
+    parser.add_argument('--db', help='Read page facts from a site database (site_db.py build) instead of the HTML')
+    parser.add_argument('--template',
+                        help='Template file (or directory) the pages were generated from: its own text '
+                             'is left out of the uniqueness check')
+    parser.add_argument('--sample', type=int, metavar='N',
+                        help='Gate on a stratified random sample of up to N pages instead of every page')
+    parser.add_argument('--sample-by', metavar='FIELD',
+                        help='Data field to stratify the sample by (e.g. category, page_type; needs --data)')
+    parser.add_argument('--data', help='Data source the pages were generated from (for --sample-by)')
+    parser.add_argument('--url-field', default='id', help='Field used for URL slugs when generating (default: id)')
+    parser.add_argument('--confidence', type=float, default=0.99,
+                        help='Confidence level of the sampled pass rate interval (default: 0.99)')
+    parser.add_argument('--seed', type=int, help='Sampling seed (default: random, reported)')
 
     args = parser.parse_args()
 
+    if args.sample is not None and (args.jsonl or args.incremental):
+        parser.error('--sample cannot be combined with --jsonl or --incremental')
+    if args.sample_by and not args.data:
+        parser.error('--sample-by needs --data')
+
     try:
-        checker = QualityChecker(args.input)
-        report = checker.check_all()
+        boilerplate = ()
+        if args.template:
+            from template_engine import template_boilerplate
+            boilerplate = template_boilerplate(args.template)
+
+        checker = QualityChecker(args.input, db=args.db, boilerplate=boilerplate)
+
+        if args.sample is not None:
+            run_sample(checker, args)
+            return
+
+        default_name = 'quality_report.jsonl' if args.jsonl else 'quality_report.json'
+        output_path = args.output or Path(args.input) / default_name
+        report = checker.check_all(
+            workers=args.workers,
+            incremental=args.incremental,
+            jsonl=str(output_path) if args.jsonl else None
+        )
 
         # Print summary
         print(f"\n{'='*50}")
@@ -223,8 +732,18 @@ def main():
         print(f"✅ Passed: {report['passed']} ({report['pass_rate']}%)")
         print(f"❌ Failed: {report['failed']}")
         print(f"Average Score: {report['average_score']}/10")
-
-        if report['pages_with_issues']:
+        if 'incremental' in report:
+            inc = report['incremental']
+            print(f"🔁 Incremental: {inc['reused']} reused, {inc['checked']} re-checked")
+        if report['near_duplicate_pages']:
+            print(f"🔁 Near-duplicates: {report['near_duplicate_pages']} pages below {QualityChecker.MIN_UNIQUENESS}% unique")
+
+        if args.jsonl:
+            if report['issue_counts']:
+                print(f"\n⚠️  Issues by type:")
+                for issue, count in report['issue_counts'].items():
+                    print(f"     ❌ {issue}: {count} pages")
+        elif report['pages_with_issues']:
             print(f"\n⚠️  Pages with issues ({len(report['pages_with_issues'])}):")
             for page in report['pages_with_issues'][:10]:  # Show first 10
                 print(f"\n  📄 {page['page']} (score: {page['score']}/10)")
@@ -233,10 +752,10 @@ def main():
                 for warning in page['warnings']:
                     print(f"     ⚠️  {warning}")
 
-        # Save full report
-        output_path = args.output or Path(args.input) / 'quality_report.json'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # Save full report (streamed reports are already written)
+        if not args.jsonl:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
 
         print(f"\n📊 Full report saved to: {output_path}")
 
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Remote Sources for Programmatic SEO Generator
+Airtable and Google Sheets loaders over a pooled, rate-limited HTTP client
+with an on-disk response cache (standard library only)
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import queue
+import re
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, urlencode, quote, parse_qs
+
+
+# API roots; override with the environment variables of the same name
+# (e.g. to point the loaders at a local mock server)
+AIRTABLE_API_URL = 'https://api.airtable.com/v0'
+SHEETS_API_URL = 'https://sheets.googleapis.com/v4'
+
+# Airtable and the Sheets API both allow about 5 requests/s
+DEFAULT_RATE = 5.0
+DEFAULT_WORKERS = 4
+DEFAULT_CACHE_TTL = 3600  # seconds
+
+
+class RemoteSourceError(Exception):
+    """A remote API request failed for good (after retries)."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections, per host."""
+
+    def __init__(self, max_idle: int = DEFAULT_WORKERS, timeout: float = 30.0):
+        """
+        Initialize connection pool.
+
+        Args:
+            max_idle: Idle connections kept open per host
+            timeout: Socket timeout in seconds
+        """
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def _queue(self, key: Tuple[str, str]) -> queue.LifoQueue:
+        with self._lock:
+            return self._idle.setdefault(key, queue.LifoQueue())
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def request(self, url: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        GET a URL on a pooled connection.
+
+        A stale idle connection (closed by the server) is replaced once.
+
+        Returns:
+            (status, lower-cased headers, body)
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path + (f"?{parts.query}" if parts.query else '')
+        idle = self._queue(key)
+
+        for attempt in range(2):
+            try:
+                conn, reused = idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._connect(*key), False
+
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+
+            if response.will_close or idle.qsize() >= self.max_idle:
+                conn.close()
+            else:
+                idle.put(conn)
+
+            return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            for idle in self._idle.values():
+                while not idle.empty():
+                    idle.get_nowait().close()
+
+
+class RateLimiter:
+    """Space requests evenly at `rate` per second, shared by all threads."""
+
+    def __init__(self, rate: float = DEFAULT_RATE):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request slot."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def pause(self, seconds: float):
+        """Hold every thread back (e.g. after HTTP 429 Retry-After)."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+class ResponseCache:
+    """On-disk JSON cache of API responses with a time-to-live."""
+
+    def __init__(self, cache_dir: str, ttl: float = DEFAULT_CACHE_TTL):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cached responses
+            ttl: Seconds a cached response stays valid (0 disables reads)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for `key`, or None if missing or expired."""
+        path = self._path(key)
+        if self.ttl <= 0 or not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('key') != key or time.time() - entry.get('fetched_at', 0) > self.ttl:
+            return None
+        return entry['value']
+
+    def put(self, key: str, value: Any):
+        """Store `value` atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'fetched_at': time.time(), 'value': value}, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+
+class APIClient:
+    """JSON GET client: pooled connections, rate limit, retries with backoff."""
+
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 1.0  # seconds, doubled per retry
+    BACKOFF_MAX = 30.0
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        rate: float = DEFAULT_RATE,
+        workers: int = DEFAULT_WORKERS,
+        secret_params: Tuple[str, ...] = ()
+    ):
+        """
+        Initialize API client.
+
+        Args:
+            headers: Headers sent with every request (e.g. Authorization)
+            rate: Requests per second across all threads
+            workers: Concurrent requests (also the pool size)
+            secret_params: Query parameters redacted from error messages
+        """
+        self.headers = {'Accept': 'application/json', **(headers or {})}
+        self.workers = max(1, workers)
+        self.pool = ConnectionPool(max_idle=self.workers)
+        self.limiter = RateLimiter(rate)
+        self.secret_params = secret_params
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+    def get_json(self, url: str) -> Any:
+        """
+        GET a URL and decode its JSON body.
+
+        HTTP 429 and 5xx responses and connection errors are retried with
+        exponential backoff; a Retry-After header pauses all threads.
+
+        Raises:
+            RemoteSourceError: On other HTTP errors or when retries run out
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.limiter.wait()
+            with self._count_lock:
+                self.request_count += 1
+
+            delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt)
+            try:
+                status, headers, body = self.pool.request(url, self.headers)
+            except (http.client.HTTPException, OSError) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise RemoteSourceError(f"Request failed: {self._redact(url)}: {e}")
+                time.sleep(delay)
+                continue
+
+            if status == 200:
+                return json.loads(body.decode('utf-8'))
+
+            if (status == 429 or status >= 500) and attempt < self.MAX_RETRIES:
+                retry_after = headers.get('retry-after')
+                try:
+                    delay = float(retry_after) if retry_after else delay
+                except ValueError:
+                    pass
+                self.limiter.pause(delay)
+                continue
+
+            raise RemoteSourceError(
+                f"HTTP {status} from {self._redact(url)}: {body.decode('utf-8', 'replace')[:300]}"
+            )
+
+    def map(self, func, items: List[Any]) -> List[Any]:
+        """Apply `func` to items on `workers` threads; results in item order."""
+        if self.workers == 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(func, items))
+
+    def _redact(self, url: str) -> str:
+        for param in self.secret_params:
+            url = re.sub(rf'([?&]{param}=)[^&]*', r'\1***', url)
+        return url
+
+    def close(self):
+        """Close pooled connections."""
+        self.pool.close()
+
+
+def _cached(cache: Optional[ResponseCache], key: str, fetch):
+    """Return cache[key], else fetch(), store and return it."""
+    if cache is not None:
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    value = fetch()
+    if cache is not None:
+        cache.put(key, value)
+    return value
+
+
+def parse_airtable_url(source: str) -> Dict[str, Any]:
+    """
+    Split an Airtable source into API root, base, tables and view.
+
+    Accepts web URLs (https://airtable.com/appXXX/tblYYY/viwZZZ) and API
+    URLs (https://api.airtable.com/v0/appXXX/Table%20Name?view=Grid).
+    Several tables of one base can be given comma-separated
+    (appXXX/tblA,tblB); they are loaded concurrently and concatenated.
+    """
+    parts = urlsplit(source)
+    segments = [s for s in parts.path.split('/') if s]
+    base_index = next((i for i, s in enumerate(segments) if s.startswith('app')), None)
+
+    if base_index is None or base_index + 1 >= len(segments):
+        raise ValueError(f"Airtable URL needs a base and a table: {source}")
+
+    if parts.netloc.endswith('airtable.com') and not parts.netloc.startswith('api.'):
+        api_root = os.environ.get('AIRTABLE_API_URL', AIRTABLE_API_URL)
+    else:
+        prefix = '/'.join(segments[:base_index])
+        api_root = f"{parts.scheme}://{parts.netloc}" + (f"/{prefix}" if prefix else '')
+
+    view = parse_qs(parts.query).get('view', [None])[0]
+    rest = segments[base_index + 2:]
+    if rest and rest[0].startswith('viw'):
+        view = rest[0]
+
+    return {
+        'api_root': api_root.rstrip('/'),
+        'base': segments[base_index],
+        'tables': segments[base_index + 1].split(','),
+        'view': view
+    }
+
+
+def load_airtable(
+    source: str,
+    cache_dir: Optional[str] = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    workers: int = DEFAULT_WORKERS,
+    token: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load all records of one or more Airtable tables.
+
+    Each table is paged through its 100-record offset cursor (pages of
+    one table depend on each other); several tables are fetched in
+    parallel. Rows are the record fields plus 'id' (the record ID unless
+    the table has its own 'id' field).
+
+    Args:
+        source: Airtable URL (see parse_airtable_url)
+        cache_dir: Response cache directory; a cached table listing younger
+            than cache_ttl is reused without any request
+        cache_ttl: Cache lifetime in seconds
+        workers: Tables fetched concurrently
+        token: Personal access token (default: AIRTABLE_TOKEN or
+            AIRTABLE_API_KEY environment variable)
+
+    Raises:
+        ValueError: If no token is configured
+        RemoteSourceError: If the API keeps failing
+    """
+    token = token or os.environ.get('AIRTABLE_TOKEN') or os.environ.get('AIRTABLE_API_KEY')
+    if not token:
+        raise ValueError(
+            "Airtable integration requires a personal access token.\n"
+            "1. Create one at https://airtable.com/create/tokens (scope: data.records:read)\n"
+            "2. export AIRTABLE_TOKEN=pat..."
+        )
+
+    target = parse_airtable_url(source)
+    cache = ResponseCache(cache_dir, cache_ttl) if cache_dir else None
+    client = APIClient({'Authorization': f"Bearer {token}"}, workers=workers)
+
+    def fetch_table(table: str) -> List[Dict[str, Any]]:
+        url = f"{target['api_root']}/{target['base']}/{quote(table, safe='')}"
+        params = {'pageSize': 100}
+        if target['view']:
+            params['view'] = target['view']
+
+        def fetch() -> List[Dict[str, Any]]:
+            # One cache entry per table: offsets only work within a listing
+            records = []
+            offset = None
+            while True:
+                page_params = dict(params, **({'offset': offset} if offset else {}))
+                page = client.get_json(f"{url}?{urlencode(page_params)}")
+                records.extend(page.get('records', []))
+                offset = page.get('offset')
+                if not offset:
+                    return records
+
+        return _cached(cache, f"airtable:{url}?{urlencode(params)}", fetch)
+
+    try:
+        tables = client.map(fetch_table, target['tables'])
+    finally:
+        client.close()
+
+    rows = []
+    for records in tables:
+        for record in records:
+            row = dict(record.get('fields', {}))
+            row.setdefault('id', record.get('id'))
+            rows.append(row)
+
+    return rows
+
+
+def _column_letter(index: int) -> str:
+    """1-based column index to A1 letters (1 -> A, 27 -> AA)."""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def parse_sheets_url(source: str) -> Dict[str, Any]:
+    """Spreadsheet ID and sheet gid (None = first sheet) of a Sheets URL."""
+    match = re.search(r'/spreadsheets/d/([\w-]+)', source)
+    if not match:
+        raise ValueError(f"Not a Google Sheets URL: {source}")
+
+    gid = re.search(r'[#&?]gid=(\d+)', source)
+    return {
+        'api_root': os.environ.get('SHEETS_API_URL', SHEETS_API_URL).rstrip('/'),
+        'spreadsheet_id': match.group(1),
+        'gid': int(gid.group(1)) if gid else None
+    }
+
+
+def load_google_sheets(
+    source: str,
+    cache_dir: Optional[str] = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    workers: int = DEFAULT_WORKERS,
+    range_rows: int = 1000
+) -> List[Dict[str, Any]]:
+    """
+    Load one sheet of a spreadsheet through the Sheets API v4.
+
+    The sheet's size is read from its metadata, then row ranges of
+    `range_rows` are fetched in parallel. The first row holds the field
+    names; fully empty rows are skipped and short rows padded with None.
+
+    Args:
+        source: Spreadsheet URL (.../spreadsheets/d/<id>/edit#gid=<gid>)
+        cache_dir: Response cache directory (see load_airtable)
+        cache_ttl: Cache lifetime in seconds
+        workers: Concurrent range requests
+        range_rows: Rows per range request
+
+    Raises:
+        ValueError: If no credentials are configured or the gid is unknown
+        RemoteSourceError: If the API keeps failing
+    """
+    api_key = os.environ.get('GOOGLE_API_KEY')
+    oauth_token = os.environ.get('GOOGLE_OAUTH_TOKEN')
+    if not api_key and not oauth_token:
+        raise ValueError(
+            "Google Sheets integration requires credentials.\n"
+            "1. Link-shared sheets: export GOOGLE_API_KEY=... (Sheets API enabled)\n"
+            "2. Private sheets: export GOOGLE_OAUTH_TOKEN=... (spreadsheets.readonly scope)"
+        )
+
+    target = parse_sheets_url(source)
+    cache = ResponseCache(cache_dir, cache_ttl) if cache_dir else None
+    headers = {'Authorization': f"Bearer {oauth_token}"} if oauth_token else {}
+    client = APIClient(headers, workers=workers, secret_params=('key',))
+    base_url = f"{target['api_root']}/spreadsheets/{target['spreadsheet_id']}"
+    auth = {'key': api_key} if api_key and not oauth_token else {}
+
+    def fetch() -> List[List[Any]]:
+        meta = client.get_json(f"{base_url}?{urlencode(dict(auth, fields='sheets.properties'))}")
+        sheets = [s['properties'] for s in meta.get('sheets', [])]
+        sheet = next((s for s in sheets if target['gid'] is None or s.get('sheetId') == target['gid']), None)
+        if sheet is None:
+            raise ValueError(f"Sheet gid={target['gid']} not found in spreadsheet")
+
+        grid = sheet.get('gridProperties', {})
+        row_count = grid.get('rowCount', 0)
+        last_column = _column_letter(max(1, grid.get('columnCount', 26)))
+        title = sheet['title'].replace("'", "''")
+
+        def fetch_range(start: int) -> List[List[Any]]:
+            end = min(row_count, start + range_rows - 1)
+            a1 = quote(f"'{title}'!A{start}:{last_column}{end}", safe='')
+            params = dict(auth, valueRenderOption='UNFORMATTED_VALUE', majorDimension='ROWS')
+            return client.get_json(f"{base_url}/values/{a1}?{urlencode(params)}").get('values', [])
+
+        # Ranges are independent: fetch them all concurrently
+        values = []
+        for block in client.map(fetch_range, list(range(1, row_count + 1, range_rows))):
+            values.extend(block)
+        return values
+
+    key = f"sheets:{base_url}#gid={target['gid']}"
+    try:
+        values = _cached(cache, key, fetch)
+    finally:
+        client.close()
+
+    if not values:
+        return []
+
+    header = [str(name).strip() for name in values[0]]
+    rows = []
+    for cells in values[1:]:
+        if not any(cell not in ('', None) for cell in cells):
+            continue
+        cells = list(cells) + [None] * (len(header) - len(cells))
+        rows.append({name: cell for name, cell in zip(header, cells) if name})
+
+    return rows
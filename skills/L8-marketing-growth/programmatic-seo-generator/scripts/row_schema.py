@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Row Schema for Programmatic SEO Generator
+Declarative field rules (type, required, length, pattern) compiled into
+vectorized checks that DataLoader runs before rendering
+"""
+
+import json
+import math
+import re
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+import pandas as pd
+
+
+TYPES = ['string', 'integer', 'number', 'boolean', 'url']
+ON_FAIL = ['warn', 'reject']
+FIELD_KEYS = ['type', 'required', 'recommended', 'min_length', 'max_length',
+              'pattern', 'on_fail', 'description']
+
+BOOLEAN_VALUES = ['true', 'false', '1', '0', 'yes', 'no']
+URL_PATTERN = r'(?:https?://|/)\S*'
+
+
+def _is_blank(value: Any) -> bool:
+    """True for None, NaN and blank strings (not checked by field rules)."""
+    if value is None:
+        return True
+    if isinstance(value, float) and value != value:
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+class FieldRule:
+    """Compiled rules of one schema field."""
+
+    def __init__(self, field: str, spec: Dict[str, Any]):
+        """
+        Compile a field spec.
+
+        Args:
+            field: Field name
+            spec: Field spec from the schema file (see RowSchema)
+
+        Raises:
+            ValueError: On unknown keys, types or on_fail values, or an
+                invalid regex pattern
+        """
+        unknown = [key for key in spec if key not in FIELD_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown schema keys for '{field}': {', '.join(unknown)}")
+
+        self.field = field
+        self.type = spec.get('type', 'string')
+        self.required = bool(spec.get('required', False))
+        self.recommended = bool(spec.get('recommended', False))
+        self.min_length: Optional[int] = spec.get('min_length')
+        self.max_length: Optional[int] = spec.get('max_length')
+        self.pattern: Optional[str] = spec.get('pattern')
+        self.on_fail = spec.get('on_fail', 'warn')
+
+        if self.type not in TYPES:
+            raise ValueError(f"Unknown type for '{field}': {self.type} (use {', '.join(TYPES)})")
+        if self.on_fail not in ON_FAIL:
+            raise ValueError(f"Unknown on_fail for '{field}': {self.on_fail} (use {', '.join(ON_FAIL)})")
+
+        try:
+            self._regex = re.compile(self.pattern) if self.pattern else None
+        except re.error as e:
+            raise ValueError(f"Invalid pattern for '{field}': {e}")
+
+    def labels(self) -> List[str]:
+        """Failure labels of the checks this field runs, in check order."""
+        labels = []
+        if self.type != 'string':
+            labels.append(f"is not a valid {self.type}")
+        if self.min_length is not None:
+            labels.append(f"shorter than {self.min_length} chars")
+        if self.max_length is not None:
+            labels.append(f"longer than {self.max_length} chars")
+        if self._regex is not None:
+            labels.append(f"does not match {self.pattern!r}")
+        return labels
+
+    def check_column(self, values: pd.Series) -> List[Tuple[str, pd.Series]]:
+        """
+        Run every check on a whole column at once.
+
+        Blank values are skipped (required fields are checked by DataLoader).
+
+        Returns:
+            (label, failure mask) per check, in labels() order
+        """
+        present = ~values.isna()
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            text = values.astype(object).astype(str)
+        else:
+            # String dtype runs on pandas' string kernels; mixed columns as str()
+            text = values if values.dtype != object else values.astype(str)
+            present &= text.str.strip().ne('').fillna(False).astype(bool)
+        results = []
+
+        if self.type != 'string':
+            if self.type in ('integer', 'number'):
+                numbers = pd.to_numeric(values, errors='coerce')
+                bad = numbers.isna() | numbers.isin([math.inf, -math.inf])
+                if self.type == 'integer':
+                    bad |= numbers.mod(1).ne(0)
+            elif self.type == 'boolean':
+                bad = ~text.str.lower().isin(BOOLEAN_VALUES)
+            else:
+                bad = ~text.str.fullmatch(URL_PATTERN).fillna(False).astype(bool)
+            results.append(bad)
+
+        if self.min_length is not None:
+            results.append(text.str.len().lt(self.min_length))
+        if self.max_length is not None:
+            results.append(text.str.len().gt(self.max_length))
+        if self._regex is not None:
+            # Python's re (object dtype), as in check_value()
+            matches = text.astype(object).str.contains(self.pattern, regex=True)
+            results.append(~matches.fillna(False).astype(bool))
+
+        return [(label, (bad & present).astype(bool))
+                for label, bad in zip(self.labels(), results)]
+
+    def check_value(self, value: Any) -> List[str]:
+        """
+        Run every check on a single value (streaming mode).
+
+        Returns:
+            Labels of failed checks; same result as check_column()
+        """
+        if _is_blank(value):
+            return []
+
+        text = str(value)
+        failed = []
+
+        if self.type in ('integer', 'number'):
+            try:
+                number = float(value)
+                ok = math.isfinite(number) and (self.type == 'number' or number % 1 == 0)
+            except (TypeError, ValueError):
+                ok = False
+            if not ok:
+                failed.append(f"is not a valid {self.type}")
+        elif self.type == 'boolean':
+            if text.lower() not in BOOLEAN_VALUES:
+                failed.append(f"is not a valid {self.type}")
+        elif self.type == 'url':
+            if not re.fullmatch(URL_PATTERN, text):
+                failed.append(f"is not a valid {self.type}")
+
+        if self.min_length is not None and len(text) < self.min_length:
+            failed.append(f"shorter than {self.min_length} chars")
+        if self.max_length is not None and len(text) > self.max_length:
+            failed.append(f"longer than {self.max_length} chars")
+        if self._regex is not None and not self._regex.search(text):
+            failed.append(f"does not match {self.pattern!r}")
+
+        return failed
+
+
+class RowSchema:
+    """
+    Declarative row schema loaded from a JSON file.
+
+    Format:
+        {
+          "fields": {
+            "id": {"type": "integer", "required": true},
+            "meta_description": {"min_length": 150, "max_length": 160},
+            "url_slug": {"pattern": "^[a-z0-9-]+$", "on_fail": "reject"}
+          }
+        }
+
+    Field keys: type (string, integer, number, boolean, url), required,
+    recommended, min_length, max_length, pattern (regex, searched),
+    on_fail (warn or reject) and a free-text description.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Compile a schema.
+
+        Args:
+            spec: Parsed schema file
+
+        Raises:
+            ValueError: If the schema is malformed
+        """
+        fields = spec.get('fields')
+        if not isinstance(fields, dict) or not fields:
+            raise ValueError("Schema needs a non-empty 'fields' object")
+
+        self.spec = spec
+        self.rules: Dict[str, FieldRule] = {
+            field: FieldRule(field, rule_spec) for field, rule_spec in fields.items()
+        }
+
+    @classmethod
+    def load(cls, path: str) -> 'RowSchema':
+        """Load and compile a schema file."""
+        schema_path = Path(path)
+        if not schema_path.exists():
+            raise FileNotFoundError(f"Schema file not found: {path}")
+
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def fields(self) -> List[str]:
+        """All fields the schema describes."""
+        return list(self.rules)
+
+    @property
+    def required_fields(self) -> List[str]:
+        """Fields marked required."""
+        return [f for f, rule in self.rules.items() if rule.required]
+
+    @property
+    def recommended_fields(self) -> List[str]:
+        """Fields marked recommended."""
+        return [f for f, rule in self.rules.items() if rule.recommended]
+
+    @property
+    def rejects(self) -> bool:
+        """True if any field rejects failing rows."""
+        return any(rule.on_fail == 'reject' for rule in self.rules.values())
+
+    def check_columns(self, columns: Dict[str, pd.Series]) -> List[Tuple[FieldRule, str, pd.Series]]:
+        """
+        Run all field checks on whole columns.
+
+        Args:
+            columns: Field values as templates will see them; fields missing
+                from the data are skipped
+
+        Returns:
+            (rule, label, failure mask) for every check that failed somewhere
+        """
+        failures = []
+        for field, rule in self.rules.items():
+            if field not in columns:
+                continue
+            for label, mask in rule.check_column(columns[field]):
+                if mask.any():
+                    failures.append((rule, label, mask))
+        return failures
+
+    def check_row(self, row: Dict[str, Any]) -> List[Tuple[FieldRule, str]]:
+        """
+        Run all field checks on one row (streaming mode).
+
+        Returns:
+            (rule, label) for every failed check
+        """
+        return [(rule, label)
+                for field, rule in self.rules.items() if field in row
+                for label in rule.check_value(row[field])]
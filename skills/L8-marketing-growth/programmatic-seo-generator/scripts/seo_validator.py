@@ -1,48 +1,98 @@
 #!/usr/bin/env python3
 """
 SEO Validator for Programmatic SEO Generator
-Validates SEO elements and generates sitemap.xml
+Validates SEO elements and generates sitemaps
 """
 
 import sys
 import argparse
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from datetime import datetime
-import xml.etree.ElementTree as ET
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterator
+from page_store import PageReader, ResultCache, content_hash
+from page_facts import PageFacts, PageRecord, extract_facts
+from link_graph import LinkGraph, link_targets, read_site_urls
+from duplicate_fields import FIELDS, DuplicateIndex, CanonicalIndex, field_key
+from sitemap_writer import SitemapWriter, SitemapHistory, HISTORY_FILE, CHANGES_FILE
+from site_db import SiteDB
 
 
 class SEOValidator:
     """Validate SEO elements and generate sitemap."""
 
-    def __init__(self, pages_dir: str, base_url: str = 'https://example.com'):
+    # Incremental mode: bump CACHE_VERSION whenever per-page checks change
+    CACHE_FILE = 'seo_cache.pkl'
+    CACHE_VERSION = 4
+
+    def __init__(
+        self,
+        pages_dir: str,
+        base_url: str = 'https://example.com',
+        load: bool = True,
+        db: Optional[str] = None
+    ):
         """
         Initialize SEO validator.
 
         Args:
             pages_dir: Directory containing generated HTML pages
             base_url: Base URL for sitemap generation
+            load: Collect pages from pages_dir (False to validate rendered
+                HTML in memory via validate_html)
+            db: Site database (site_db.py) to read page facts from instead
+                of parsing the HTML
         """
         self.pages_dir = Path(pages_dir)
         self.base_url = base_url.rstrip('/')
-        self.pages: List[Path] = []
+        self.db_path = db
+        self.pages: List[str] = []  # page names relative to pages_dir
+        self.reader: Optional[PageReader] = None
+        self.db: Optional[SiteDB] = None
         self.results: List[Dict[str, Any]] = []
+        self.incremental: Optional[Dict[str, int]] = None  # reuse stats of the last validate_all()
+
+        # Link graph: hub page slugs for click depth (None = most linked
+        # pages) and slugs of existing site pages that were not generated
+        # (None = unknown: links to them are unverified, not broken)
+        self.link_hubs: Optional[List[str]] = None
+        self.site_urls: Optional[Set[str]] = None
+        self.sitemap_changes: Optional[Dict[str, Any]] = None  # set by generate_sitemap()
 
         # Load pages
-        self._load_pages()
+        if load:
+            self._load_pages()
+
+    def _load_pages(self, listing: Optional[Dict[str, Any]] = None):
+        """
+        Load all HTML pages from directory (flat, sharded or archived) or the site database.
+
+        Args:
+            listing: Page listing of a loaded instance (see listing), to
+                skip the directory scan (worker processes)
+        """
+        if self.db_path:
+            self.db = SiteDB(self.db_path, readonly=True)
+            self.pages = listing['pages'] if listing else self.db.names()
+            if not self.pages:
+                raise ValueError(f"No pages in site database: {self.db.path}")
+            return
 
-    def _load_pages(self):
-        """Load all HTML pages from directory."""
         if not self.pages_dir.exists():
             raise FileNotFoundError(f"Pages directory not found: {self.pages_dir}")
 
-        self.pages = list(self.pages_dir.glob('*.html'))
+        self.reader = PageReader(str(self.pages_dir), listing)
+        self.pages = self.reader.pages
 
         if not self.pages:
             raise ValueError(f"No HTML pages found in: {self.pages_dir}")
 
+    @property
+    def listing(self) -> Dict[str, Any]:
+        """Resolved pages (and archive offsets) for worker processes."""
+        return self.reader.listing if self.reader is not None else {'pages': self.pages}
+
     def validate_page(self, page_path: Path) -> Dict[str, Any]:
         """
         Validate SEO elements for single page.
@@ -53,50 +103,78 @@ class SEOValidator:
         with open(page_path, 'r', encoding='utf-8') as f:
             html = f.read()
 
-        soup = BeautifulSoup(html, 'html.parser')
+        return self.validate_html(html, page_path.name)
 
+    def validate_html(
+        self,
+        html: str,
+        page_name: str,
+        facts: Optional[PageFacts] = None,
+        url_slug: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate SEO elements of a rendered page held in memory.
+
+        Args:
+            html: Page HTML
+            page_name: Page name relative to pages_dir
+            facts: Already extracted page facts, to share one parse between checkers
+            url_slug: URL slug (default: page filename without extension)
+
+        Returns:
+            Validation result with SEO elements check
+        """
+        if facts is None:
+            facts = extract_facts(html)
+
+        url_slug = url_slug or Path(page_name).stem  # filename without extension
+        return self.validate_record(PageRecord.from_facts(facts, page_name, url_slug, content_hash(html)))
+
+    def validate_record(self, record: PageRecord) -> Dict[str, Any]:
+        """
+        Validate SEO elements of a page from its facts record (no HTML needed).
+
+        Args:
+            record: Page facts with URL slug and content hash (from
+                validate_html() or the site database)
+
+        Returns:
+            Validation result with SEO elements check
+        """
         issues = []
         seo_elements = {}
+        meta = record.meta
 
         # 1. Meta title
-        title = soup.find('title')
-        seo_elements['meta_title'] = title.get_text() if title else None
-        if not title:
+        seo_elements['meta_title'] = record.title
+        if record.title is None:
             issues.append("Missing <title> tag")
 
         # 2. Meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        seo_elements['meta_description'] = meta_desc.get('content') if meta_desc else None
-        if not meta_desc:
+        seo_elements['meta_description'] = meta.get('description')
+        if 'description' not in meta:
             issues.append("Missing meta description")
 
         # 3. Meta keywords (optional but good to have)
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        seo_elements['meta_keywords'] = meta_keywords.get('content') if meta_keywords else None
+        seo_elements['meta_keywords'] = meta.get('keywords')
 
         # 4. Canonical tag
-        canonical = soup.find('link', attrs={'rel': 'canonical'})
-        seo_elements['canonical'] = canonical.get('href') if canonical else None
-        if not canonical:
+        seo_elements['canonical'] = meta.get('canonical')
+        if 'canonical' not in meta:
             issues.append("Missing canonical tag (prevents duplicate content)")
 
         # 5. Open Graph tags (social media)
-        og_title = soup.find('meta', attrs={'property': 'og:title'})
-        og_desc = soup.find('meta', attrs={'property': 'og:description'})
-        og_image = soup.find('meta', attrs={'property': 'og:image'})
-
-        seo_elements['og_title'] = og_title.get('content') if og_title else None
-        seo_elements['og_description'] = og_desc.get('content') if og_desc else None
-        seo_elements['og_image'] = og_image.get('content') if og_image else None
+        seo_elements['og_title'] = meta.get('og:title')
+        seo_elements['og_description'] = meta.get('og:description')
+        seo_elements['og_image'] = meta.get('og:image')
 
         # 6. Schema.org markup (JSON-LD)
-        schema_script = soup.find('script', attrs={'type': 'application/ld+json'})
-        seo_elements['has_schema'] = schema_script is not None
+        seo_elements['has_schema'] = record.schema is not None
 
-        if schema_script:
+        if record.schema is not None:
             try:
-                schema_data = json.loads(schema_script.string)
-                seo_elements['schema_type'] = schema_data.get('@type')
+                schema_data = json.loads(record.schema)
+                seo_elements['schema_type'] = schema_data.get('@type') if isinstance(schema_data, dict) else None
             except json.JSONDecodeError:
                 issues.append("Invalid JSON-LD schema markup")
                 seo_elements['schema_type'] = None
@@ -104,17 +182,15 @@ class SEOValidator:
             issues.append("Missing schema.org markup (JSON-LD)")
 
         # 7. H1 tag
-        h1 = soup.find('h1')
-        seo_elements['h1'] = h1.get_text() if h1 else None
-        if not h1:
+        seo_elements['h1'] = record.h1
+        if record.h1 is None:
             issues.append("Missing H1 tag")
 
         # 8. Robots meta tag
-        robots = soup.find('meta', attrs={'name': 'robots'})
-        seo_elements['robots'] = robots.get('content') if robots else 'index,follow'
+        seo_elements['robots'] = meta['robots'] if 'robots' in meta else 'index,follow'
 
         # 9. URL slug (from filename)
-        url_slug = page_path.stem  # filename without extension
+        url_slug = record.url_slug
         seo_elements['url_slug'] = url_slug
 
         # Check URL slug format
@@ -122,99 +198,312 @@ class SEOValidator:
             issues.append(f"URL slug not SEO-friendly: '{url_slug}' (use hyphens, not underscores/spaces)")
 
         return {
-            'page': page_path.name,
+            'page': record.name,
             'url': f"{self.base_url}/{url_slug}",
             'seo_elements': seo_elements,
             'issues': issues,
-            'valid': len(issues) == 0
+            'valid': len(issues) == 0,
+            'content_hash': record.content_hash,  # drives sitemap lastmod
+            '_links': link_targets(record.links, url_slug, self.base_url)  # consumed by check_links()
         }
 
-    def validate_all(self) -> Dict[str, Any]:
+    def validate_all(
+        self,
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        incremental: bool = False
+    ) -> Dict[str, Any]:
         """
         Validate all pages.
 
+        Args:
+            workers: Number of worker processes (1 = validate in this process)
+            chunk_size: Pages per worker task (default: spread ~4 chunks per worker)
+            incremental: Reuse results of pages whose HTML and URL slug are
+                unchanged since the last incremental run (cached in CACHE_FILE)
+
         Returns:
-            Validation report for all pages
+            Validation report for all pages (results in self.pages order,
+            whatever the number of workers)
         """
         print(f"Validating {len(self.pages)} pages...")
 
-        self.results = []
+        self.incremental = None
+        cache = ResultCache(str(self.pages_dir / self.CACHE_FILE), self.cache_key()) if incremental else None
+        previous = [cache.hash(name) if cache else None for name in self.pages]
+        checked = []  # (content hash, result or None if reused)
+        total = len(self.pages)
+
+        if workers > 1 and total > 1:
+            chunk_size = chunk_size or max(1, -(-total // (workers * 4)))
+            pending = deque()
+
+            def collect(future):
+                checked.extend(future.result())
+                print(f"  {len(checked)}/{total} pages validated...", end='\r')
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(self.pages_dir), self.listing, self.base_url, self.db_path)
+            ) as executor:
+                # Bounded in-flight chunks; results are collected in submission order
+                for start in range(0, total, chunk_size):
+                    stop = start + chunk_size
+                    pending.append(executor.submit(_validate_chunk, self.pages[start:stop], previous[start:stop]))
+                    if len(pending) >= workers * 2:
+                        collect(pending.popleft())
+                while pending:
+                    collect(pending.popleft())
+        else:
+            for i, name in enumerate(self.pages, 1):
+                checked.append(self._validate_stored(name, previous[i - 1]))
+
+                # Progress indicator
+                if i % 10 == 0 or i == total:
+                    print(f"  {i}/{total} pages validated...", end='\r')
 
-        for i, page_path in enumerate(self.pages, 1):
-            result = self.validate_page(page_path)
-            self.results.append(result)
+        self.results = [
+            result if result is not None else cache.result(name)
+            for name, (_, result) in zip(self.pages, checked)
+        ]
 
-            # Progress indicator
-            if i % 10 == 0 or i == len(self.pages):
-                print(f"  {i}/{len(self.pages)} pages validated...", end='\r')
+        if cache:
+            cache.save([(name, digest, result) for name, (digest, _), result
+                        in zip(self.pages, checked, self.results)])
+            reused = sum(1 for _, result in checked if result is None)
+            self.incremental = {'reused': reused, 'checked': total - reused}
 
         print(f"\n✅ Validation complete!")
 
+        return self.build_report()
+
+    def cache_key(self) -> Dict[str, Any]:
+        """Validator version and every setting a per-page result depends on."""
+        return {'version': self.CACHE_VERSION, 'base_url': self.base_url}
+
+    def _validate_stored(self, name: str, previous_hash: Optional[str] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Validate a page from pages_dir (or the site database) unless its HTML
+        and URL slug are unchanged.
+
+        Returns:
+            (content hash, result), with result None if the hash equals
+            previous_hash (cached result still valid)
+        """
+        if self.db is not None:
+            record = self.db.record(name)
+            digest = content_hash(record.content_hash, record.url_slug)
+            if digest == previous_hash:
+                return digest, None
+            return digest, self.validate_record(record)
+
+        html = self.reader.read(name)
+        url_slug = self.reader.url_slug(name)
+        # Same key as from the database, so both sources share the cache
+        digest = content_hash(content_hash(html), url_slug)
+        if digest == previous_hash:
+            return digest, None
+        return digest, self.validate_html(html, name, url_slug=url_slug)
+
+    def check_links(self) -> Dict[str, Any]:
+        """
+        Corpus-wide link graph pass over all results.
+
+        Internal link targets collected per page are matched against the
+        URL slugs of every page. Adds 'inbound_links', 'click_depth' (None
+        if unreachable from the hubs), 'broken_links' (targets that are
+        neither generated pages nor in self.site_urls) and
+        'unverified_links' (targets outside the generated pages when no
+        self.site_urls are given) to each result. The site root is never
+        broken.
+
+        Returns:
+            Link graph summary (see LinkGraph.analyze)
+        """
+        targets = [result.pop('_links', []) for result in self.results]
+        slugs = [result['seo_elements']['url_slug'] for result in self.results]
+
+        graph = LinkGraph(slugs, targets, self.site_urls)
+        summary = graph.analyze([result['page'] for result in self.results], self.link_hubs)
+
+        for result, inbound, depth, broken, unverified in zip(
+            self.results, graph.in_degree.tolist(), graph.depth.tolist(), graph.broken, graph.unverified
+        ):
+            result['inbound_links'] = inbound
+            result['click_depth'] = depth if depth >= 0 else None
+            result['broken_links'] = [f"/{target}" for target in broken]
+            result['unverified_links'] = [f"/{target}" for target in unverified]
+
+        return summary
+
+    def check_duplicates(self) -> Dict[str, Any]:
+        """
+        Corpus-wide duplicate pass over all results.
+
+        Titles, meta descriptions and H1s are hashed into one index per
+        field (ignoring case and whitespace) and canonicals are resolved to
+        URL slugs, in a single linear sweep. Adds 'duplicate_fields' (field
+        -> pages sharing the value) to each result, and fails pages that
+        share a field with another page, whose canonical points at a page
+        that does not exist, or whose canonical points at another page
+        that other pages canonicalize to as well.
+
+        Returns:
+            Collision groups per field and the canonical summary
+        """
+        pages = [result['page'] for result in self.results]
+        elements = [result['seo_elements'] for result in self.results]
+        for result in self.results:
+            result['duplicate_fields'] = {}
+
+        summary = {}
+        for field, label in FIELDS.items():
+            values = [element.get(field) for element in elements]
+            index = DuplicateIndex(field_key(value) for value in values)
+            summary[field] = index.summary(pages, values)
+
+            for group in index.groups:
+                for page in group:
+                    result = self.results[page]
+                    result['duplicate_fields'][field] = len(group)
+                    result['issues'].append(f"Duplicate {label}: shared by {len(group)} pages "
+                                            f"(e.g. {pages[index.other(page)]})")
+
+        slugs = [element['url_slug'] for element in elements]
+        canonicals = CanonicalIndex([element.get('canonical') for element in elements],
+                                    slugs, self.base_url, self.site_urls or ())
+        summary['canonical'] = canonicals.analyze(pages)
+
+        for page, (result, target) in enumerate(zip(self.results, canonicals.targets)):
+            shared = canonicals.index.size(page)
+            if canonicals.missing[page]:
+                result['issues'].append(f"Canonical points to missing page: /{target}")
+            elif shared and target != slugs[page]:
+                result['duplicate_fields']['canonical'] = shared
+                result['issues'].append(f"Canonical points to another page: /{target} "
+                                        f"(shared by {shared} pages)")
+
+        for result in self.results:
+            result['valid'] = len(result['issues']) == 0
+
+        return summary
+
+    def build_report(self) -> Dict[str, Any]:
+        """
+        Summarize collected results.
+
+        Runs the corpus-wide link graph and duplicate passes first (see
+        check_links and check_duplicates).
+
+        Returns:
+            Validation report for all pages in self.results
+        """
+        link_graph = self.check_links()
+        duplicates = self.check_duplicates()
+
         # Calculate summary
         valid_count = sum(1 for r in self.results if r['valid'])
         invalid_count = len(self.results) - valid_count
 
         pages_with_issues = [r for r in self.results if r['issues']]
 
-        return {
+        report = {
             'total_pages': len(self.results),
             'valid': valid_count,
             'invalid': invalid_count,
             'pages_with_issues': pages_with_issues,
+            'link_graph': link_graph,
+            'duplicates': duplicates,
             'results': self.results
         }
+        if self.incremental is not None:
+            report['incremental'] = self.incremental
 
-    def generate_sitemap(self, output_path: str = None) -> str:
-        """
-        Generate sitemap.xml for all pages.
+        return report
 
-        Args:
-            output_path: Path to save sitemap.xml (default: pages_dir/sitemap.xml)
+    def iter_pages(self) -> Iterator[Tuple[str, str]]:
+        """
+        (URL, content hash) of every page in page order: from self.results
+        if validated, otherwise from the site database or read straight from
+        the page store (hashing only, no parsing).
+        """
+        if self.results:
+            for result in self.results:
+                yield result['url'], result['content_hash']
+        elif self.db is not None:
+            for url_slug, digest in self.db.iter_urls():
+                yield f"{self.base_url}/{url_slug}", digest
+        elif self.reader is not None:
+            for name in self.pages:
+                url_slug = self.reader.url_slug(name)
+                yield f"{self.base_url}/{url_slug}", content_hash(self.reader.read(name))
+        else:
+            raise ValueError("No pages: run validate_all() or load pages from pages_dir first")
 
-        Returns:
-            Path to generated sitemap
+    def generate_sitemap(self, output_dir: str = None, compress: bool = False) -> str:
         """
-        if not self.results:
-            raise ValueError("Run validate_all() first before generating sitemap")
+        Generate or update the sitemap files for all pages.
 
-        # Create XML structure
-        urlset = ET.Element('urlset')
-        urlset.set('xmlns', 'http://www.sitemaps.org/schemas/sitemap/0.9')
+        URLs are streamed into sitemap-N.xml (50,000 URLs / 50 MB each) and
+        a sitemap_index.xml listing them (see SitemapWriter). Each URL's
+        lastmod is the time its content last changed, tracked by content
+        hash in sitemap_history.json, which also keeps each URL in the
+        sitemap file it was in; sitemap files whose content did not change
+        are left untouched. New, changed and removed URLs are
+        written to sitemap_changes.json (and kept in self.sitemap_changes).
 
-        # Current date for lastmod
-        today = datetime.now().strftime('%Y-%m-%d')
+        Args:
+            output_dir: Directory for the sitemap files (default: pages_dir)
+            compress: Write gzip-compressed sitemap-N.xml.gz files
 
-        for result in self.results:
-            url_element = ET.SubElement(urlset, 'url')
+        Returns:
+            Path to sitemap_index.xml
+        """
+        output_dir = Path(output_dir or self.pages_dir)
+        history = SitemapHistory(str(output_dir / HISTORY_FILE))
+
+        with SitemapWriter(output_dir, self.base_url, compress, history=history) as writer:
+            for url, digest in self.iter_pages():
+                writer.add(url, lastmod=history.lastmod(url, digest))
+        history.save()
+
+        self.sitemap_changes = {
+            'generated': history.now,
+            'new': history.new,
+            'changed': history.changed,
+            'removed': history.removed,
+            'files_written': [path.name for path in writer.written]
+        }
+        with open(output_dir / CHANGES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(self.sitemap_changes, f, indent=2, ensure_ascii=False)
 
-            # loc (required)
-            loc = ET.SubElement(url_element, 'loc')
-            loc.text = result['url']
+        print(f"✅ Sitemap generated: {writer.index_path}")
+        print(f"   {writer.urls} URLs in {len(writer.files)} sitemap file(s), "
+              f"{len(writer.written)} rewritten")
+        print(f"   {len(history.new)} new, {len(history.changed)} changed, "
+              f"{len(history.removed)} removed URLs (see {CHANGES_FILE})")
 
-            # lastmod (recommended)
-            lastmod = ET.SubElement(url_element, 'lastmod')
-            lastmod.text = today
+        return str(writer.index_path)
 
-            # changefreq (optional)
-            changefreq = ET.SubElement(url_element, 'changefreq')
-            changefreq.text = 'weekly'
 
-            # priority (optional)
-            priority = ET.SubElement(url_element, 'priority')
-            priority.text = '0.8'
+# Per-process validator for --workers mode (pages are read in the worker)
+_worker_validator: Optional[SEOValidator] = None
 
-        # Generate XML string
-        tree = ET.ElementTree(urlset)
-        ET.indent(tree, space='  ')  # Pretty print
 
-        # Save to file
-        output_path = output_path or self.pages_dir / 'sitemap.xml'
-        tree.write(output_path, encoding='utf-8', xml_declaration=True)
+def _init_worker(pages_dir: str, listing: Dict[str, Any], base_url: str, db: Optional[str] = None):
+    """Open the pages directory (or archive, or site database) once in each worker process, from the parent's listing."""
+    global _worker_validator
+    _worker_validator = SEOValidator(pages_dir, base_url, load=False, db=db)
+    _worker_validator._load_pages(listing)
 
-        print(f"✅ Sitemap generated: {output_path}")
-        print(f"   {len(self.results)} URLs included")
 
-        return str(output_path)
+def _validate_chunk(
+    names: List[str],
+    previous: List[Optional[str]]
+) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Validate a contiguous chunk of pages in a worker process, in order."""
+    return [_worker_validator._validate_stored(name, digest) for name, digest in zip(names, previous)]
 
 
 def main():
@@ -222,14 +511,35 @@ def main():
     parser = argparse.ArgumentParser(description='Validate SEO elements and generate sitemap')
     parser.add_argument('--input', required=True, help='Directory with generated pages')
     parser.add_argument('--domain', required=True, help='Base URL (e.g. https://topholz24.de)')
-    parser.add_argument('--generate-sitemap', action='store_true', help='Generate sitemap.xml')
+    parser.add_argument('--generate-sitemap', action='store_true',
+                        help='Generate sitemap-N.xml files and sitemap_index.xml '
+                             '(no single sitemap.xml, even for small sites)')
+    parser.add_argument('--sitemap-only', action='store_true',
+                        help='Only generate the sitemap, straight from the pages (no validation)')
+    parser.add_argument('--gzip', action='store_true', help='Write gzip-compressed sitemap-N.xml.gz files')
     parser.add_argument('--output', help='Output path for validation report JSON')
+    parser.add_argument('--workers', type=int, default=1, help='Validate in N parallel processes (default: 1)')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'Reuse results of unchanged pages (cached in {SEOValidator.CACHE_FILE})')
+    parser.add_argument('--db', help='Read page facts from a site database (site_db.py build) instead of the HTML')
+    parser.add_argument('--hubs', help='Comma-separated hub page slugs for click depth (default: most linked pages)')
+    parser.add_argument('--site-urls', help='File with existing site URLs that were not generated, one per line '
+                                            '(other links outside the generated pages are then reported as broken)')
 
     args = parser.parse_args()
 
     try:
-        validator = SEOValidator(args.input, args.domain)
-        report = validator.validate_all()
+        validator = SEOValidator(args.input, args.domain, db=args.db)
+        if args.hubs:
+            validator.link_hubs = [slug.strip().strip('/') for slug in args.hubs.split(',')]
+        if args.site_urls:
+            validator.site_urls = read_site_urls(args.site_urls, validator.base_url)
+
+        if args.sitemap_only:
+            validator.generate_sitemap(compress=args.gzip)
+            return
+
+        report = validator.validate_all(workers=args.workers, incremental=args.incremental)
 
         # Print summary
         print(f"\n{'='*50}")
@@ -238,6 +548,36 @@ def main():
         print(f"Total Pages: {report['total_pages']}")
         print(f"✅ Valid: {report['valid']}")
         print(f"❌ Invalid: {report['invalid']}")
+        if 'incremental' in report:
+            inc = report['incremental']
+            print(f"🔁 Incremental: {inc['reused']} reused, {inc['checked']} re-checked")
+
+        links = report['link_graph']
+        depth = links['click_depth']
+        print(f"\n🔗 Internal links: {links['links']} between pages, {links['broken_links']} broken "
+              f"({links['pages_with_broken_links']} pages)")
+        print(f"   Orphan pages: {links['orphans']}, in-degree median: {links['in_degree']['percentiles']['p50']}")
+        print(f"   Click depth from {len(links['hubs'])} hubs: max {depth['max']}, "
+              f"{depth['unreachable']} pages unreachable")
+        for target in links['broken_targets'][:5]:
+            print(f"     ❌ {target['target']} ({target['pages']} pages, e.g. {target['example']})")
+        if links['unverified_links']:
+            print(f"   ⚠️  {links['unverified_links']} links to pages that were not generated "
+                  f"(pass --site-urls to check them)")
+            for target in links['unverified_targets'][:5]:
+                print(f"     ⚠️  {target['target']} ({target['pages']} pages, e.g. {target['example']})")
+
+        duplicates = report['duplicates']
+        canonical = duplicates['canonical']
+        print(f"\n📑 Duplicates: " + ", ".join(
+            f"{label} {duplicates[field]['pages']} pages in {duplicates[field]['groups']} groups"
+            for field, label in FIELDS.items()
+        ))
+        print(f"   Canonicals: {canonical['shared_pages']} pages share a target, "
+              f"{canonical['missing']} point to missing pages")
+        for field, label in FIELDS.items():
+            for group in duplicates[field]['largest'][:3]:
+                print(f"     ❌ {label} ({group['pages']} pages): {group['value'][:80]}")
 
         if report['pages_with_issues']:
             print(f"\n⚠️  Pages with SEO issues ({len(report['pages_with_issues'])}):")
@@ -256,10 +596,10 @@ def main():
         # Generate sitemap if requested
         if args.generate_sitemap:
             print(f"\nGenerating sitemap...")
-            sitemap_path = validator.generate_sitemap()
+            validator.generate_sitemap(compress=args.gzip)
             print(f"\n📍 Next steps:")
-            print(f"   1. Upload sitemap to: {args.domain}/sitemap.xml")
-            print(f"   2. Submit to Google Search Console")
+            print(f"   1. Upload sitemap_index.xml and the sitemap files to: {args.domain}/")
+            print(f"   2. Submit sitemap_index.xml to Google Search Console")
             print(f"   3. Submit to Bing Webmaster Tools")
 
     except Exception as e:
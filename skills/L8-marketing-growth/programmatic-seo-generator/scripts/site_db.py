@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Site Database for Programmatic SEO Generator
+Indexed SQLite store of per-page facts, built once from the generated
+pages and read by quality_checker, seo_validator and the sitemap writer
+"""
+
+import sys
+import argparse
+import json
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from page_store import PageReader, content_hash
+from page_facts import PageRecord, extract_facts
+from near_duplicates import MinHasher
+from qa_sampling import load_fields
+
+DB_FILE = 'site.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    url_slug TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    title TEXT,
+    title_length INTEGER,
+    meta_description TEXT,
+    description_length INTEGER,
+    h1 TEXT,
+    h1_count INTEGER NOT NULL,
+    canonical TEXT,
+    robots TEXT,
+    word_count INTEGER NOT NULL,
+    internal_links INTEGER NOT NULL,
+    images INTEGER NOT NULL,
+    images_without_alt INTEGER NOT NULL,
+    has_schema INTEGER NOT NULL,
+    schema_type TEXT,
+    meta TEXT NOT NULL,
+    links TEXT NOT NULL,
+    schema TEXT,
+    signature BLOB
+);
+CREATE INDEX IF NOT EXISTS pages_position ON pages (position);
+CREATE INDEX IF NOT EXISTS pages_url_slug ON pages (url_slug);
+CREATE INDEX IF NOT EXISTS pages_title ON pages (title);
+CREATE INDEX IF NOT EXISTS pages_title_length ON pages (title_length);
+CREATE INDEX IF NOT EXISTS pages_meta_description ON pages (meta_description);
+CREATE INDEX IF NOT EXISTS pages_description_length ON pages (description_length);
+CREATE INDEX IF NOT EXISTS pages_h1 ON pages (h1);
+CREATE INDEX IF NOT EXISTS pages_canonical ON pages (canonical);
+CREATE INDEX IF NOT EXISTS pages_word_count ON pages (word_count);
+CREATE TABLE IF NOT EXISTS fields (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (field, value, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fields_name ON fields (name, field);
+"""
+
+# Columns read back into a PageRecord, in order
+RECORD_COLUMNS = ['name', 'url_slug', 'content_hash', 'title', 'h1', 'h1_count', 'meta', 'links',
+                  'word_count', 'images', 'images_without_alt', 'schema', 'signature']
+
+# Rows written per transaction while building
+BATCH_SIZE = 1000
+
+
+def _schema_type(schema: Optional[str]) -> Optional[str]:
+    """@type of a JSON-LD block (None if missing, invalid or not an object)."""
+    if not schema:
+        return None
+    try:
+        data = json.loads(schema)
+    except json.JSONDecodeError:
+        return None
+    return data.get('@type') if isinstance(data, dict) else None
+
+
+class SiteDB:
+    """
+    Per-page facts of a generated site in SQLite.
+
+    One row per page in `pages`, holding a PageRecord (everything the
+    checkers need, including the MinHash signature) plus query columns
+    (title_length, description_length, canonical, schema_type...). Data
+    fields such as category are kept in `fields` (field, value, name), so
+    corpus-wide questions are plain indexed SQL:
+
+        SELECT p.name, p.title FROM pages p
+        JOIN fields f ON f.name = p.name AND f.field = 'category'
+        WHERE f.value = 'Möbel' AND p.title_length > 60
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, readonly: bool = False):
+        """
+        Open (or create) a site database.
+
+        Args:
+            path: Database file (or a pages directory containing DB_FILE)
+            readonly: Open read-only (the database must exist)
+        """
+        path = Path(path)
+        self.path = path / DB_FILE if path.is_dir() else path
+
+        if readonly:
+            if not self.path.exists():
+                raise FileNotFoundError(f"Site database not found: {self.path} (build it with site_db.py build)")
+            self.conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            self.conn = sqlite3.connect(str(self.path))
+            self.conn.executescript(SCHEMA)
+            self._init_info()
+
+        version = self.info('version')
+        if version != str(self.VERSION):
+            raise ValueError(f"Site database version {version} is not supported (rebuild {self.path})")
+
+    def _init_info(self):
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO info VALUES ('version', ?)", (str(self.VERSION),))
+
+    def info(self, key: str) -> Optional[str]:
+        """Value of a database setting (None if unset)."""
+        row = self.conn.execute("SELECT value FROM info WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        """Close the connection."""
+        self.conn.close()
+
+    # Reading
+
+    def names(self) -> List[str]:
+        """Page names in page order."""
+        return [row[0] for row in self.conn.execute("SELECT name FROM pages ORDER BY position")]
+
+    def hashes(self) -> Dict[str, str]:
+        """Page name -> content hash."""
+        return dict(self.conn.execute("SELECT name, content_hash FROM pages"))
+
+    def record(self, name: str) -> Optional[PageRecord]:
+        """Facts record of a page (None if not in the database)."""
+        row = self.conn.execute(
+            f"SELECT {', '.join(RECORD_COLUMNS)} FROM pages WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        values = dict(zip(RECORD_COLUMNS, row))
+        values['meta'] = json.loads(values['meta'])
+        values['links'] = json.loads(values['links'])
+        return PageRecord(values.pop('name'), **values)
+
+    def url_slug(self, name: str) -> Optional[str]:
+        """URL slug of a page (None if not in the database)."""
+        row = self.conn.execute("SELECT url_slug FROM pages WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def iter_urls(self) -> Iterator[Tuple[str, str]]:
+        """(URL slug, content hash) of every page in page order."""
+        yield from self.conn.execute("SELECT url_slug, content_hash FROM pages ORDER BY position")
+
+    def minhash(self) -> Optional[List[int]]:
+        """MinHasher.settings of the stored signatures (None if no build yet)."""
+        value = self.info('minhash')
+        return json.loads(value) if value else None
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> Tuple[List[str], List[tuple]]:
+        """
+        Run a read query.
+
+        Returns:
+            (column names, rows)
+        """
+        cursor = self.conn.execute(sql, tuple(params))
+        columns = [column[0] for column in cursor.description] if cursor.description else []
+        return columns, cursor.fetchall()
+
+    # Writing
+
+    def put(self, records: Iterable[Tuple[int, PageRecord]]):
+        """Insert or replace pages ((position, record) pairs) in one transaction."""
+        rows = []
+        for position, record in records:
+            meta = record.meta
+            title = record.title
+            description = meta.get('description')
+            rows.append((
+                record.name, position, record.url_slug, record.content_hash,
+                title, None if title is None else len(title),
+                description, None if 'description' not in meta else len(description or ''),
+                record.h1, record.h1_count, meta.get('canonical'), meta.get('robots'),
+                record.word_count, len(record.internal_links), record.images, record.images_without_alt,
+                int(record.schema is not None), _schema_type(record.schema),
+                json.dumps(meta, ensure_ascii=False), json.dumps(record.links, ensure_ascii=False),
+                record.schema, record.signature
+            ))
+
+        with self.conn:
+            self.conn.executemany(f"INSERT OR REPLACE INTO pages VALUES ({', '.join('?' * 22)})", rows)
+
+    def move(self, positions: Iterable[Tuple[int, str, str]]):
+        """Update position and URL slug of unchanged pages ((position, url_slug, name) triples)."""
+        with self.conn:
+            self.conn.executemany("UPDATE pages SET position = ?, url_slug = ? WHERE name = ?", positions)
+
+    def remove(self, names: Iterable[str]):
+        """Delete pages and their fields."""
+        names = [(name,) for name in names]
+        with self.conn:
+            self.conn.executemany("DELETE FROM pages WHERE name = ?", names)
+            self.conn.executemany("DELETE FROM fields WHERE name = ?", names)
+
+    def set_fields(self, values: Dict[str, Dict[str, str]]):
+        """
+        Replace the data fields of pages.
+
+        Args:
+            values: Page name -> {field: value}
+        """
+        with self.conn:
+            for name, fields in values.items():
+                self.conn.execute("DELETE FROM fields WHERE name = ?", (name,))
+                self.conn.executemany(
+                    "INSERT INTO fields VALUES (?, ?, ?)",
+                    [(field, value, name) for field, value in fields.items()]
+                )
+
+    def set_info(self, key: str, value: str):
+        """Store a database setting."""
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO info VALUES (?, ?)", (key, value))
+
+
+def build(
+    pages_dir: str,
+    db_path: Optional[str] = None,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    data: Optional[str] = None,
+    fields: Iterable[str] = (),
+    url_field: str = 'id',
+    boilerplate: Iterable[int] = ()
+) -> Dict[str, int]:
+    """
+    Build or update the site database of a pages directory.
+
+    Pages whose HTML is unchanged since the last build (same content hash)
+    are not parsed again; pages no longer in the directory are removed.
+
+    Args:
+        pages_dir: Directory with generated pages (flat, sharded or archived)
+        db_path: Database file (default: pages_dir/site.db)
+        workers: Number of worker processes for parsing
+        chunk_size: Pages per worker task (default: spread ~4 chunks per worker)
+        data: Data source the pages were generated from (for fields)
+        fields: Row fields to store per page (e.g. category)
+        url_field: Field used for URL slugs when generating
+        boilerplate: Shingle hashes of the template text, left out of the
+            MinHash signatures (see template_engine.template_boilerplate)
+
+    Returns:
+        Build stats: pages, parsed, reused, removed
+    """
+    reader = PageReader(pages_dir)
+    pages = reader.pages
+    db = SiteDB(db_path or str(Path(pages_dir) / DB_FILE))
+
+    # Signatures leave out the template text; another template re-parses every page
+    minhasher = MinHasher(boilerplate=boilerplate)
+    minhash = minhasher.settings
+    previous = db.hashes() if db.minhash() == minhash else {}
+    hashes = [previous.get(name) for name in pages]
+    total = len(pages)
+
+    print(f"Building site database for {total} pages...")
+
+    batch: List[Tuple[int, PageRecord]] = []
+    moved: List[Tuple[int, str, str]] = []
+    parsed = 0
+
+    records = _iter_records(pages_dir, reader.listing, hashes, minhasher.boilerplate.tolist(), workers, chunk_size)
+    for position, (name, record) in enumerate(records):
+        if record is None:
+            moved.append((position, reader.url_slug(name), name))
+        else:
+            batch.append((position, record))
+            parsed += 1
+
+        if len(batch) >= BATCH_SIZE:
+            db.put(batch)
+            batch = []
+        if (position + 1) % 100 == 0 or position + 1 == total:
+            print(f"  {position + 1}/{total} pages stored...", end='\r')
+
+    db.put(batch)
+    db.move(moved)
+
+    current = set(pages)
+    removed = [name for name in db.hashes() if name not in current]
+    db.remove(removed)
+    db.set_info('minhash', json.dumps(minhash))
+
+    if fields:
+        by_slug = load_fields(data, list(fields), url_field)
+        db.set_fields({name: by_slug.get(reader.url_slug(name), {}) for name in pages})
+
+    db.close()
+    print(f"\n✅ Site database built!")
+
+    return {'pages': total, 'parsed': parsed, 'reused': total - parsed, 'removed': len(removed)}
+
+
+def _iter_records(
+    pages_dir: str,
+    listing: Dict[str, Any],
+    hashes: List[Optional[str]],
+    boilerplate: List[int],
+    workers: int,
+    chunk_size: Optional[int]
+) -> Iterator[Tuple[str, Optional[PageRecord]]]:
+    """Yield (name, record or None if unchanged) for pages in order, serially or in a process pool."""
+    pages = listing['pages']
+    total = len(pages)
+
+    if workers > 1 and total > 1:
+        chunk_size = chunk_size or max(1, -(-total // (workers * 4)))
+        pending = deque()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(pages_dir, listing, boilerplate)
+        ) as executor:
+            # Bounded in-flight chunks; results are collected in submission order
+            for start in range(0, total, chunk_size):
+                stop = start + chunk_size
+                pending.append(executor.submit(_record_chunk, pages[start:stop], hashes[start:stop]))
+                while pending and (len(pending) >= workers * 2 or stop >= total):
+                    yield from pending.popleft().result()
+    else:
+        _init_worker(pages_dir, listing, boilerplate)
+        yield from _record_chunk(pages, hashes)
+
+
+# Per-process reader and hasher (pages are read in the worker)
+_worker_reader: Optional[PageReader] = None
+_worker_minhasher: Optional[MinHasher] = None
+
+
+def _init_worker(pages_dir: str, listing: Dict[str, Any], boilerplate: List[int]):
+    """Open the pages directory (or archive) once in each worker process, from the parent's listing."""
+    global _worker_reader, _worker_minhasher
+    _worker_reader = PageReader(pages_dir, listing)
+    _worker_minhasher = MinHasher(boilerplate=boilerplate)
+
+
+def _record_chunk(names: List[str], hashes: List[Optional[str]]) -> List[Tuple[str, Optional[PageRecord]]]:
+    """Facts records of a chunk of pages, None for pages whose content hash is unchanged."""
+    records = []
+    for name, previous in zip(names, hashes):
+        html = _worker_reader.read(name)
+        digest = content_hash(html)
+        if digest == previous:
+            records.append((name, None))
+            continue
+
+        facts = extract_facts(html)
+        records.append((name, PageRecord.from_facts(
+            facts, name, _worker_reader.url_slug(name), digest,
+            signature=_worker_minhasher.signature(facts.body_text)
+        )))
+    return records
+
+
+def main():
+    """CLI interface for the site database."""
+    parser = argparse.ArgumentParser(description='Build and query the site database of generated pages')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', help='Build or update the database from generated pages')
+    build_parser.add_argument('--input', required=True, help='Directory with generated pages')
+    build_parser.add_argument('--db', help=f'Database file (default: INPUT/{DB_FILE})')
+    build_parser.add_argument('--workers', type=int, default=1, help='Parse in N parallel processes (default: 1)')
+    build_parser.add_argument('--data', help='Data source the pages were generated from (for --fields)')
+    build_parser.add_argument('--fields', help='Comma-separated data fields to store per page (e.g. category)')
+    build_parser.add_argument('--url-field', default='id', help='Field used for URL slugs when generating (default: id)')
+    build_parser.add_argument('--template',
+                              help='Template file (or directory) the pages were generated from: its own text '
+                                   'is left out of the uniqueness signatures')
+
+    query_parser = commands.add_parser('query', help='Run an SQL query')
+    query_parser.add_argument('db', help='Database file or pages directory')
+    query_parser.add_argument('sql', help="SQL, e.g. \"SELECT name, title FROM pages WHERE title_length > 60\"")
+    query_parser.add_argument('--json', action='store_true', help='Print rows as JSON objects')
+
+    args = parser.parse_args()
+
+    if args.command == 'build' and args.fields and not args.data:
+        build_parser.error('--fields needs --data')
+
+    try:
+        if args.command == 'build':
+            fields = [field.strip() for field in args.fields.split(',')] if args.fields else []
+            boilerplate = ()
+            if args.template:
+                from template_engine import template_boilerplate
+                boilerplate = template_boilerplate(args.template)
+
+            stats = build(args.input, args.db, workers=args.workers, data=args.data,
+                          fields=fields, url_field=args.url_field, boilerplate=boilerplate)
+            print(f"📄 {stats['pages']} pages: {stats['parsed']} parsed, {stats['reused']} unchanged, "
+                  f"{stats['removed']} removed")
+            return
+
+        db = SiteDB(args.db, readonly=True)
+        columns, rows = db.query(args.sql)
+        if args.json:
+            for row in rows:
+                print(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str))
+        else:
+            print('\t'.join(columns))
+            for row in rows:
+                print('\t'.join('' if value is None else str(value) for value in row))
+            print(f"\n{len(rows)} rows")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Sitemap Writer for Programmatic SEO Generator
+Streams URLs into sitemap-N.xml(.gz) files within the protocol limits,
+writes a sitemap_index.xml pointing at them and keeps the content and
+membership history behind lastmod, so unchanged shards are left untouched
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from xml.sax.saxutils import escape
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# Protocol limits per sitemap file (size is uncompressed)
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+INDEX_FILE = 'sitemap_index.xml'
+
+# URL and shard history (content hash, lastmod, shard), kept next to the sitemap
+HISTORY_FILE = 'sitemap_history.json'
+
+# New, changed and removed URLs of the last update (for recrawl requests)
+CHANGES_FILE = 'sitemap_changes.json'
+
+
+def w3c_now() -> str:
+    """Current UTC time as a W3C datetime (e.g. '2026-10-18T09:30:00+00:00')."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00')
+
+
+class SitemapHistory:
+    """
+    Content hash, lastmod and sitemap file of every URL of the last run,
+    and content hash and lastmod of every sitemap file.
+
+    A URL's lastmod is the time its content hash last changed, so pages
+    that were re-generated without changes keep their old lastmod. The
+    same applies to sitemap files, whose hash is taken over their
+    uncompressed content. The file number of each URL lets SitemapWriter
+    keep URLs in the file they were in, so adding or removing a URL only
+    changes the file it goes into or leaves.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: str, now: Optional[str] = None):
+        """
+        Load the history of the last run (if any).
+
+        Args:
+            path: History file (see HISTORY_FILE)
+            now: lastmod for content that changed in this run (default: w3c_now())
+        """
+        self.path = Path(path)
+        self.now = now or w3c_now()
+        self._previous_urls: Dict[str, list] = {}
+        self._previous_shards: Dict[str, List[str]] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # Version 1 has no file numbers: its URLs are placed like new ones
+                if data.get('version') in (1, self.VERSION):
+                    self._previous_urls = data['urls']
+                    self._previous_shards = data['shards']
+            except (OSError, ValueError, KeyError):
+                # Unreadable history: every URL counts as new
+                pass
+
+        # URLs per sitemap file number in the last run
+        self.previous_files: Dict[int, int] = {}
+        for entry in self._previous_urls.values():
+            if len(entry) > 2 and entry[2] is not None:
+                self.previous_files[entry[2]] = self.previous_files.get(entry[2], 0) + 1
+
+        self.urls: Dict[str, list] = {}  # url -> [content hash, lastmod, file number]
+        self.shards: Dict[str, List[str]] = {}  # filename -> [content hash, lastmod]
+        self.new: List[str] = []
+        self.changed: List[str] = []
+
+    def lastmod(self, url: str, digest: str) -> str:
+        """
+        Record a URL's content hash for this run.
+
+        Returns:
+            lastmod of the URL (unchanged if its hash is unchanged)
+        """
+        old = self._previous_urls.pop(url, None)
+        if old is not None and old[0] == digest:
+            lastmod = old[1]
+        else:
+            lastmod = self.now
+            (self.changed if old is not None else self.new).append(url)
+
+        number = old[2] if old is not None and len(old) > 2 else None
+        self.urls[url] = [digest, lastmod, number]
+        return lastmod
+
+    def member(self, url: str) -> Optional[int]:
+        """Sitemap file number of a recorded URL (from the last run until placed; None if new)."""
+        entry = self.urls.get(url)
+        return entry[2] if entry is not None else None
+
+    def place(self, url: str, number: int):
+        """Record the sitemap file number a URL was written to in this run."""
+        entry = self.urls.get(url)
+        if entry is not None:
+            entry[2] = number
+
+    def shard(self, name: str, digest: str) -> Tuple[bool, str]:
+        """
+        Record a sitemap file's content hash for this run.
+
+        Returns:
+            (changed since the last run, lastmod of the file)
+        """
+        old = self._previous_shards.get(name)
+        if old is not None and old[0] == digest:
+            self.shards[name] = old
+            return False, old[1]
+
+        self.shards[name] = [digest, self.now]
+        return True, self.now
+
+    @property
+    def removed(self) -> List[str]:
+        """URLs of the last run that were not recorded in this one."""
+        return list(self._previous_urls)
+
+    def save(self):
+        """Write the history of this run (atomically)."""
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'urls': self.urls, 'shards': self.shards},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+
+class _SitemapFile:
+    """One sitemap file being written under a temporary name."""
+
+    def __init__(self, path: Path, compress: bool, header: bytes):
+        self.path = path
+        self.temp_path = path.with_name(path.name + '.tmp')
+        self._raw = open(self.temp_path, 'wb')
+        # mtime=0 keeps unchanged shards byte-identical between runs
+        self._file = gzip.GzipFile(filename='', mode='wb', fileobj=self._raw, mtime=0) if compress else self._raw
+        self.digest = hashlib.blake2b(digest_size=16)
+        self.count = 0
+        self.bytes = 0
+        self.write(header)
+
+    def write(self, data: bytes):
+        self._file.write(data)
+        self.digest.update(data)
+        self.bytes += len(data)
+
+    def close(self):
+        self._file.close()
+        self._raw.close()
+
+
+class SitemapWriter:
+    """
+    Write sitemap entries as they arrive.
+
+    Entries are serialized straight to disk, so memory does not grow with
+    the number of URLs. New URLs go into the last sitemap-N.xml (or
+    .xml.gz); a new file is started before an entry would push it past
+    max_urls or max_bytes. close() writes sitemap_index.xml and removes
+    shards left over from an earlier run. Files are written under a
+    temporary name and renamed when complete, so a served sitemap is never
+    half-written.
+
+    With a SitemapHistory, every URL of the last run goes back into the
+    file it was in (in page order), and only new URLs fill up the last
+    file. Inserting or removing a URL therefore changes one file, wherever
+    the URL is in page order. A file is finished once all its URLs of the
+    last run have arrived, so only files still waiting for URLs stay open.
+    A finished file whose content is unchanged since the last run is
+    discarded instead of replacing the existing one, so unchanged files
+    stay byte-identical (and keep their mtime and ETag), and the index
+    lists each file with the time it last changed.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        base_url: str,
+        compress: bool = False,
+        max_urls: int = MAX_URLS,
+        max_bytes: int = MAX_BYTES,
+        prefix: str = 'sitemap',
+        history: Optional[SitemapHistory] = None
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            output_dir: Directory for the sitemap files and the index
+            base_url: URL the sitemap files are served under (for the index)
+            compress: Write gzip-compressed sitemap-N.xml.gz files
+            max_urls: URLs per sitemap file
+            max_bytes: Uncompressed bytes per sitemap file
+            prefix: Sitemap filename prefix (prefix-N.xml)
+            history: URL and file history for incremental updates (the
+                caller passes lastmod from history.lastmod() to add())
+        """
+        self.output_dir = Path(output_dir)
+        self.base_url = base_url.rstrip('/')
+        self.compress = compress
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+        self.history = history
+        self.files: List[Path] = []  # completed sitemap files, in order
+        self.written: List[Path] = []  # files replaced in this run
+        self.lastmods: Dict[str, str] = {}  # filename -> lastmod for the index
+        self.urls = 0
+        self.index_path: Optional[Path] = None  # set by close()
+
+        self._open: Dict[int, _SitemapFile] = {}  # file number -> file being written
+        self._done: Dict[int, Path] = {}  # file number -> completed file
+        # URLs of the last run not yet added, per file number
+        self._remaining: Dict[int, int] = dict(history.previous_files) if history is not None else {}
+        self._target: Optional[int] = max(self._remaining) if self._remaining else None  # file for new URLs
+        self._header = f'{XML_DECLARATION}<urlset xmlns="{SITEMAP_NS}">\n'.encode('utf-8')
+        self._footer = b'</urlset>\n'
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> 'SitemapWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            for sitemap in self._open.values():
+                sitemap.close()
+                os.unlink(sitemap.temp_path)
+            self._open.clear()
+
+    def _start(self, number: int) -> _SitemapFile:
+        """Start sitemap file number N."""
+        suffix = '.xml.gz' if self.compress else '.xml'
+        sitemap = _SitemapFile(self.output_dir / f"{self.prefix}-{number}{suffix}", self.compress, self._header)
+        self._open[number] = sitemap
+        return sitemap
+
+    def _fits(self, number: int, entry: bytes, reserved: int = 0) -> bool:
+        """Whether file N takes the entry, keeping room for `reserved` more URLs."""
+        if number in self._done:
+            return False
+        sitemap = self._open.get(number)
+        count, size = (sitemap.count, sitemap.bytes) if sitemap is not None else (0, len(self._header))
+        return count + reserved < self.max_urls and size + len(entry) + len(self._footer) <= self.max_bytes
+
+    def _place(self, loc: str, entry: bytes) -> int:
+        """File number for an entry: its file of the last run, else the last file with room."""
+        number = self.history.member(loc) if self.history is not None else None
+        if number is not None and number in self._remaining:
+            self._remaining[number] -= 1
+            if self._fits(number, entry):
+                return number
+
+        # New URL (or its file is full): the last file, else a new one
+        if self._target is not None:
+            if self._fits(self._target, entry, self._remaining.get(self._target, 0)):
+                return self._target
+            if self._target in self._open and not self._remaining.get(self._target):
+                self._finish(self._target)
+        numbers = list(self._remaining) + list(self._open) + list(self._done)
+        self._target = max(numbers) + 1 if numbers else 1
+        return self._target
+
+    def _finish(self, number: int):
+        """Close sitemap file N and move it into place (if changed)."""
+        sitemap = self._open.pop(number)
+        sitemap.write(self._footer)
+        sitemap.close()
+
+        changed, lastmod = True, w3c_now()
+        if self.history is not None:
+            changed, lastmod = self.history.shard(sitemap.path.name, sitemap.digest.hexdigest())
+
+        if changed or not sitemap.path.exists():
+            os.replace(sitemap.temp_path, sitemap.path)
+            self.written.append(sitemap.path)
+        else:
+            os.unlink(sitemap.temp_path)
+
+        self._done[number] = sitemap.path
+        self.files.append(sitemap.path)
+        self.lastmods[sitemap.path.name] = lastmod
+
+    def add(
+        self,
+        loc: str,
+        lastmod: Optional[str] = None,
+        changefreq: Optional[str] = None,
+        priority: Optional[str] = None
+    ):
+        """
+        Write one <url> entry.
+
+        Args:
+            loc: Absolute page URL
+            lastmod: W3C date (e.g. '2026-10-18')
+            changefreq: always, hourly, daily, weekly, monthly, yearly, never
+            priority: '0.0' to '1.0'
+        """
+        lines = [f"  <url>\n    <loc>{escape(loc)}</loc>\n"]
+        if lastmod:
+            lines.append(f"    <lastmod>{lastmod}</lastmod>\n")
+        if changefreq:
+            lines.append(f"    <changefreq>{changefreq}</changefreq>\n")
+        if priority:
+            lines.append(f"    <priority>{priority}</priority>\n")
+        lines.append("  </url>\n")
+        entry = ''.join(lines).encode('utf-8')
+
+        number = self._place(loc, entry)
+        sitemap = self._open.get(number)
+        if sitemap is None:
+            sitemap = self._start(number)
+            if sitemap.bytes + len(entry) + len(self._footer) > self.max_bytes:
+                raise ValueError(f"Sitemap entry larger than {self.max_bytes} bytes: {loc[:100]}")
+
+        sitemap.write(entry)
+        sitemap.count += 1
+        self.urls += 1
+        if self.history is not None:
+            self.history.place(loc, number)
+
+        # All URLs of an earlier file arrived: nothing more goes into it
+        if number != self._target and not self._remaining.get(number):
+            self._finish(number)
+
+    def close(self) -> Path:
+        """
+        Finish the open sitemap files and write the index.
+
+        Returns:
+            Path of sitemap_index.xml
+        """
+        if not self._open and not self._done:
+            self._start(1)  # no URLs: still write one (empty) sitemap
+        for number in sorted(self._open):
+            self._finish(number)
+        self.files = [self._done[number] for number in sorted(self._done)]
+
+        # Shards not written in this run (or in the other compression) are stale
+        current = {path.name for path in self.files}
+        pattern = re.compile(rf'^{re.escape(self.prefix)}-\d+\.xml(\.gz)?$')
+        for path in self.output_dir.iterdir():
+            if pattern.match(path.name) and path.name not in current:
+                path.unlink()
+
+        lines = [XML_DECLARATION, f'<sitemapindex xmlns="{SITEMAP_NS}">\n']
+        for path in self.files:
+            lines.append(f"  <sitemap>\n    <loc>{escape(f'{self.base_url}/{path.name}')}</loc>\n"
+                         f"    <lastmod>{self.lastmods[path.name]}</lastmod>\n  </sitemap>\n")
+        lines.append('</sitemapindex>\n')
+        content = ''.join(lines)
+
+        # Rewritten only when a file was added, removed or changed
+        index_path = self.output_dir / INDEX_FILE
+        if not index_path.exists() or index_path.read_text(encoding='utf-8') != content:
+            temp_path = index_path.with_name(index_path.name + '.tmp')
+            temp_path.write_text(content, encoding='utf-8')
+            os.replace(temp_path, index_path)
+
+        self.index_path = index_path
+        return index_path
@@ -6,27 +6,74 @@ Renders Jinja2 templates with data from data_loader
 
 import sys
 import argparse
+import hashlib
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, Template, TemplateError
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Set, Tuple
+from jinja2 import Environment, FileSystemLoader, Template, TemplateError, meta
 import json
 from data_loader import DataLoader
+from remote_sources import DEFAULT_CACHE_TTL
+from quality_checker import QualityChecker
+from seo_validator import SEOValidator
+from page_facts import extract_facts
+from near_duplicates import MinHasher
+from page_store import (
+    LAYOUTS, ARCHIVE_LAYOUTS, PageArchive, page_name, archive_name, write_index, load_index, slugify
+)
+
+# Row value for rendering a template without row data: has no words, but
+# passes {% if field %} tests so conditional template text is rendered too
+SKELETON_VALUE = '-'
 
 
 class TemplateEngine:
     """Render Jinja2 templates with structured data."""
 
-    def __init__(self, template_path: str, output_dir: str):
+    def __init__(
+        self,
+        template_path: str,
+        output_dir: str,
+        layout: str = 'flat',
+        route_field: Optional[str] = None,
+        routes: Optional[Dict[str, str]] = None
+    ):
         """
         Initialize template engine.
 
         Args:
-            template_path: Path to Jinja2 template file
+            template_path: Path to Jinja2 template file, or a templates
+                directory when routing rows to several templates
             output_dir: Directory to write generated pages
+            layout: Output layout - 'flat' (<slug>.html), 'sharded'
+                (hash-prefix subdirectories), or 'tar'/'zip' (single archive)
+            route_field: Row field that selects the template (e.g. 'page_type');
+                a template file given as template_path becomes the fallback
+            routes: Field value -> template filename mapping (default: value
+                'product' uses product.html or product_page.html)
         """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unsupported layout: {layout} (use {', '.join(LAYOUTS)})")
+
         self.template_path = Path(template_path)
         self.output_dir = Path(output_dir)
+        self.layout = layout
+        self.route_field = route_field
+        self.routes: Dict[str, str] = dict(routes or {})
+        self._shard_dirs: Set[Path] = set()
         self.template: Optional[Template] = None
+        self.template_hash = ''
+
+        # Compiled templates and source hashes by filename (shared Environment)
+        self.templates: Dict[str, Template] = {}
+        self.template_hashes: Dict[str, str] = {}
+        self.manifest_path = self.output_dir / 'generation_manifest.json'
+
+        # In-memory QA (see enable_qa)
+        self.quality_checker: Optional[QualityChecker] = None
+        self.seo_validator: Optional[SEOValidator] = None
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -35,26 +82,106 @@ class TemplateEngine:
         self._load_template()
 
     def _load_template(self):
-        """Load Jinja2 template from file."""
+        """Load Jinja2 template(s) from file or templates directory."""
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template not found: {self.template_path}")
 
+        is_dir = self.template_path.is_dir()
+        if is_dir and not self.route_field:
+            raise ValueError("A templates directory requires a route field (e.g. page_type)")
+
+        self.template_dir = self.template_path if is_dir else self.template_path.parent
+
         try:
             # Setup Jinja2 environment
-            template_dir = self.template_path.parent
-            env = Environment(
-                loader=FileSystemLoader(str(template_dir)),
-                autoescape=True,  # Security: escape HTML by default
-                trim_blocks=True,
-                lstrip_blocks=True
-            )
+            self.env = env = _environment(self.template_dir)
 
             # Load template
-            self.template = env.get_template(self.template_path.name)
+            if not is_dir:
+                self.template = self._compile(env, self.template_path.name)
+
+            # Routing: compile every candidate template once up front
+            if self.route_field:
+                names = set(self.routes.values())
+                if not self.routes:
+                    names.update(p.name for p in self.template_dir.glob('*.html'))
+                for name in sorted(names):
+                    self._compile(env, name)
 
         except TemplateError as e:
             raise Exception(f"Template error: {e}")
 
+        # Fingerprint template source(s) for incremental mode
+        if len(self.template_hashes) == 1:
+            self.template_hash = next(iter(self.template_hashes.values()))
+        else:
+            combined = json.dumps(self.template_hashes, sort_keys=True)
+            self.template_hash = hashlib.sha256(combined.encode('utf-8')).hexdigest()
+
+    def _compile(self, env: Environment, name: str) -> Template:
+        """Compile a template from the templates directory and record its hash."""
+        template = env.get_template(name)
+        source = (self.template_dir / name).read_bytes()
+        self.templates[name] = template
+        self.template_hashes[name] = hashlib.sha256(source).hexdigest()
+        return template
+
+    def referenced_fields(self) -> Set[str]:
+        """
+        Variables the loaded template(s) read from row data.
+
+        Found from the Jinja2 AST; included/extended templates are followed.
+        Use as DataLoader(columns=...) to load only these fields.
+        """
+        return _referenced_fields(self.env, self.templates)
+
+    def _template_name(self, data: Dict[str, Any]) -> str:
+        """
+        Select the template filename for a row.
+
+        Raises:
+            Exception: If the row routes to no known template
+        """
+        if self.route_field:
+            value = data.get(self.route_field)
+            if value != value:  # NaN from empty CSV cells
+                value = None
+            if value is not None:
+                value = str(value).strip()
+                if value in self.routes:
+                    return self.routes[value]
+                for name in (f"{value}.html", f"{value}_page.html"):
+                    if name in self.templates and not self.routes:
+                        return name
+
+            if self.template is None:
+                raise Exception(f"No template for {self.route_field}={value!r}")
+
+        return self.template_path.name
+
+    def boilerplate(self) -> List[int]:
+        """Shingle hashes of the loaded template(s)' own text (see template_boilerplate)."""
+        return _template_boilerplate(self.env, sorted(self.templates))
+
+    def enable_qa(self, base_url: str = 'https://example.com', boilerplate: Optional[List[int]] = None):
+        """
+        Check every page with QualityChecker and SEOValidator as it is rendered.
+
+        Each HTML string is parsed once and both checkers share the parse, so
+        the output directory never has to be re-read. After generate_pages()
+        the results are in self.quality_checker.results and
+        self.seo_validator.results (in row order).
+
+        Args:
+            base_url: Base URL for SEO validation and sitemap generation
+            boilerplate: Template shingles left out of the uniqueness
+                signatures (default: those of the loaded template(s))
+        """
+        if boilerplate is None:
+            boilerplate = self.boilerplate()
+        self.quality_checker = QualityChecker(str(self.output_dir), load=False, boilerplate=boilerplate)
+        self.seo_validator = SEOValidator(str(self.output_dir), base_url, load=False)
+
     def render_page(self, data: Dict[str, Any]) -> str:
         """
         Render single page with data.
@@ -66,69 +193,103 @@ class TemplateEngine:
             Rendered HTML as string
         """
         try:
-            return self.template.render(**data)
+            return self.templates[self._template_name(data)].render(**data)
         except TemplateError as e:
             raise Exception(f"Render error for ID {data.get('id', 'unknown')}: {e}")
 
     def generate_pages(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         limit: Optional[int] = None,
-        url_field: str = 'id'
+        url_field: str = 'id',
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        incremental: bool = False,
+        prune: bool = False
     ) -> Dict[str, Any]:
         """
         Generate multiple pages from data list.
 
         Args:
-            data: List of data dictionaries
+            data: List of data dictionaries, or any iterator of rows
+                (e.g. DataLoader.iter_rows()) to stream in constant memory
             limit: Maximum pages to generate (for pilot mode)
             url_field: Field to use for URL slug (default: 'id')
+            workers: Number of worker processes (1 = render in this process)
+            chunk_size: Rows per worker task (default: spread ~4 chunks per
+                worker, or 1000 rows when streaming)
+            incremental: Skip pages whose row data and template are unchanged
+                since the last run (tracked in generation_manifest.json)
+            prune: In incremental mode, delete pages whose rows were removed
 
         Returns:
             Generation report with stats
         """
+        if incremental and self.layout in ARCHIVE_LAYOUTS:
+            raise ValueError("Incremental mode requires a directory layout (flat or sharded)")
+
         generated = []
         errors = []
+        quality_results = []
+        quality_signatures = []
+        seo_results = []
+        index_pages = []
+
+        archive = None
+        if self.layout in ARCHIVE_LAYOUTS:
+            archive = PageArchive(str(self.output_dir / archive_name(self.layout)), self.layout)
+
+        def add(entry: Dict[str, Any]):
+            # Move in-memory QA results out of the page entry
+            if '_quality' in entry:
+                quality, signature = entry.pop('_quality')
+                quality_results.append(quality)
+                quality_signatures.append(signature)
+                seo_results.append(entry.pop('_seo'))
+
+            # Archives are written by this process only, in row order
+            if archive is not None:
+                index_entry = archive.add(entry.pop('_page'), entry.pop('_html'))
+                index_pages.append({**index_entry, 'url_slug': entry['url_slug']})
+            elif self.layout == 'sharded':
+                index_pages.append({'name': entry.pop('_page'), 'url_slug': entry['url_slug']})
+            else:
+                entry.pop('_page')
+
+            generated.append(entry)
 
         # Limit for pilot mode
-        data_subset = data[:limit] if limit else data
+        rows = islice(data, limit) if limit else data
+        total = None
+        if hasattr(data, '__len__'):
+            total = min(len(data), limit) if limit else len(data)
 
-        print(f"Generating {len(data_subset)} pages...")
+        print(f"Generating {total if total is not None else 'streamed'} pages...")
 
-        for i, row in enumerate(data_subset, 1):
-            try:
-                # Render page
-                html = self.render_page(row)
-
-                # Generate filename from URL field
-                url_slug = self._sanitize_slug(str(row.get(url_field, i)))
-                filename = f"{url_slug}.html"
-                filepath = self.output_dir / filename
-
-                # Write to file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(html)
-
-                generated.append({
-                    'id': row.get('id'),
-                    'url_slug': url_slug,
-                    'filepath': str(filepath),
-                    'title': row.get('title', 'Untitled')
-                })
-
-                # Progress indicator
-                if i % 10 == 0 or i == len(data_subset):
-                    print(f"  {i}/{len(data_subset)} pages generated...", end='\r')
-
-            except Exception as e:
-                errors.append({
-                    'id': row.get('id'),
-                    'error': str(e)
-                })
+        # Previous page hashes (None = full regeneration)
+        previous = self._load_manifest() if incremental else None
+
+        # Slugs of every row seen, including rows that fail to render
+        current_slugs: Set[str] = set()
+        if incremental:
+            rows = self._track_slugs(rows, url_field, current_slugs)
+
+        try:
+            self._render_rows(rows, total, url_field, workers, chunk_size, previous, add, errors)
+        finally:
+            if archive is not None:
+                archive.close()
 
         print(f"\n✅ Generation complete!")
 
-        return {
+        if self.quality_checker:
+            self.quality_checker.set_results(quality_results, quality_signatures)
+            self.seo_validator.results = seo_results
+
+        if self.layout != 'flat':
+            self._write_index(index_pages, partial=bool(limit))
+
+        report = {
             'generated_count': len(generated),
             'error_count': len(errors),
             'generated': generated,
@@ -136,67 +297,512 @@ class TemplateEngine:
             'output_dir': str(self.output_dir)
         }
 
-    def _sanitize_slug(self, text: str) -> str:
+        if self.route_field:
+            templates = Counter(entry['template'] for entry in generated)
+            report['templates'] = {name: templates[name] for name in sorted(templates)}
+
+        if incremental:
+            report['incremental'] = self._update_manifest(
+                previous, generated, current_slugs,
+                partial=bool(limit), prune=prune
+            )
+
+        return report
+
+    def _render_rows(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        total: Optional[int],
+        url_field: str,
+        workers: int,
+        chunk_size: Optional[int],
+        previous: Optional[Dict[str, str]],
+        add,
+        errors: List[Dict[str, Any]]
+    ):
+        """Render rows serially or in a process pool, passing entries to add() in row order."""
+        def progress(done: int) -> str:
+            return f"{done}/{total}" if total is not None else str(done)
+
+        if workers > 1 and total != 1:
+            if not chunk_size:
+                chunk_size = max(1, -(-total // (workers * 4))) if total else 1000
+            pending = deque()
+            done = 0
+
+            def collect(future):
+                nonlocal done
+                chunk_generated, chunk_errors, chunk_count = future.result()
+                for entry in chunk_generated:
+                    add(entry)
+                errors.extend(chunk_errors)
+                done += chunk_count
+                print(f"  {progress(done)} pages generated...", end='\r')
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(
+                    {
+                        'template_path': str(self.template_path),
+                        'output_dir': str(self.output_dir),
+                        'layout': self.layout,
+                        'route_field': self.route_field,
+                        'routes': self.routes
+                    },
+                    previous,
+                    self.seo_validator.base_url if self.seo_validator else None,
+                    self.quality_checker.minhasher.boilerplate.tolist() if self.quality_checker else None
+                )
+            ) as executor:
+                # Bounded in-flight chunks; results are collected in submission order
+                for start, chunk in _chunked(rows, chunk_size):
+                    pending.append(executor.submit(_render_chunk, start, chunk, url_field))
+                    if len(pending) >= workers * 2:
+                        collect(pending.popleft())
+                while pending:
+                    collect(pending.popleft())
+        else:
+            for i, row in enumerate(rows, 1):
+                try:
+                    add(self._generate_one(i, row, url_field, previous))
+
+                    # Progress indicator
+                    if i % 10 == 0 or i == total:
+                        print(f"  {progress(i)} pages generated...", end='\r')
+
+                except Exception as e:
+                    errors.append({
+                        'id': row.get('id'),
+                        'error': str(e)
+                    })
+
+    def _generate_one(
+        self,
+        index: int,
+        row: Dict[str, Any],
+        url_field: str,
+        previous: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Render a single row and write it to the output directory.
+
+        Args:
+            index: 1-based row position (slug fallback when url_field is missing)
+            row: Data dictionary for the page
+            url_field: Field to use for URL slug
+            previous: Page hashes from the last run (incremental mode only)
+
+        Returns:
+            Generated page entry for the report
+        """
+        # Generate filename from URL field
+        url_slug = self._sanitize_slug(str(row.get(url_field, index)))
+        is_archive = self.layout in ARCHIVE_LAYOUTS
+        filename = page_name(url_slug, 'flat' if is_archive else self.layout)
+        filepath = self.output_dir / filename
+
+        entry = {
+            'id': row.get('id'),
+            'url_slug': url_slug,
+            'filepath': str(filepath),
+            'title': row.get('title', 'Untitled'),
+            '_page': filename
+        }
+
+        if is_archive:
+            entry['filepath'] = f"{self.output_dir / archive_name(self.layout)}:{filename}"
+
+        if self.route_field:
+            entry['template'] = self._template_name(row)
+
+        if previous is not None:
+            page_hash = self._page_hash(row)
+            entry['hash'] = page_hash
+
+            if previous.get(url_slug) == page_hash and filepath.exists():
+                entry['status'] = 'unchanged'
+                if self.quality_checker:
+                    # Not re-rendered, but still part of the QA reports
+                    self._check_html(entry, filepath.read_text(encoding='utf-8'), filename)
+                return entry
+
+            entry['status'] = 'changed' if url_slug in previous else 'new'
+
+        # Render page
+        html = self.render_page(row)
+
+        # Check in memory before writing (single parse for both checkers)
+        if self.quality_checker:
+            self._check_html(entry, html, filename)
+
+        if is_archive:
+            # Appended to the archive by the main process
+            entry['_html'] = html
+            return entry
+
+        if self.layout == 'sharded' and filepath.parent not in self._shard_dirs:
+            filepath.parent.mkdir(exist_ok=True)
+            self._shard_dirs.add(filepath.parent)
+
+        # Write to file
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+        return entry
+
+    def _check_html(self, entry: Dict[str, Any], html: str, filename: str):
+        """Attach quality and SEO results for rendered HTML to a page entry."""
+        facts = extract_facts(html)
+        # (result, MinHash signature) until set_results()
+        entry['_quality'] = self.quality_checker._check_html(html, filename, facts)
+        entry['_seo'] = self.seo_validator.validate_html(
+            html, filename, facts, url_slug=entry['url_slug']
+        )
+
+    def _write_index(self, pages: List[Dict[str, Any]], partial: bool = False):
+        """
+        Write page_index.json for sharded and archived layouts.
+
+        Args:
+            pages: Index entries from this run, in row order
+            partial: Run covered only part of the data (--limit); for sharded
+                output, pages from earlier runs stay in the index
+        """
+        if partial and self.layout == 'sharded':
+            existing = load_index(str(self.output_dir))
+            if existing and existing.get('layout') == 'sharded':
+                merged = {entry['name']: entry for entry in existing['pages']}
+                merged.update({entry['name']: entry for entry in pages})
+                pages = list(merged.values())
+
+        write_index(str(self.output_dir), self.layout, pages)
+
+    def _page_hash(self, row: Dict[str, Any]) -> str:
+        """Hash row data together with the source of its template."""
+        payload = json.dumps(row, sort_keys=True, default=str, ensure_ascii=False)
+        template_hash = self.template_hashes[self._template_name(row)]
+        digest = hashlib.sha256(template_hash.encode('utf-8'))
+        digest.update(payload.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_manifest(self) -> Dict[str, str]:
+        """Load url_slug -> page hash mapping from the last incremental run."""
+        if not self.manifest_path.exists():
+            return {}
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest.get('pages', {})
+        except (json.JSONDecodeError, AttributeError):
+            # Corrupt manifest: fall back to a full rebuild
+            return {}
+
+    def _update_manifest(
+        self,
+        previous: Dict[str, str],
+        generated: List[Dict[str, Any]],
+        current: Set[str],
+        partial: bool = False,
+        prune: bool = False
+    ) -> Dict[str, Any]:
         """
-        Convert text to URL-safe slug.
+        Write the new manifest and detect pages whose rows were removed.
+
+        Args:
+            previous: Page hashes from the last run
+            generated: Generated page entries from this run
+            current: Slugs of every row processed in this run
+            partial: Run covered only part of the data (--limit), so
+                pages outside it are kept rather than reported as removed
+            prune: Delete HTML files of removed pages
 
-        Examples:
-            "Oak Desk" -> "oak-desk"
-            "Product #123" -> "product-123"
+        Returns:
+            Incremental summary for the generation report
         """
-        import re
+        pages = {entry['url_slug']: entry['hash'] for entry in generated}
+        removed = []
+
+        if partial:
+            pages = {**previous, **pages}
+        else:
+            removed = sorted(slug for slug in previous if slug not in current)
+
+        if prune:
+            for slug in removed:
+                (self.output_dir / page_name(slug, self.layout)).unlink(missing_ok=True)
+        else:
+            # Keep reporting stale pages until a --prune run deletes them
+            pages.update({slug: previous[slug] for slug in removed})
+
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'template': str(self.template_path),
+                'template_hash': self.template_hash,
+                'pages': pages
+            }, f, indent=2, ensure_ascii=False)
+
+        statuses = [entry['status'] for entry in generated]
 
-        # Lowercase
-        slug = text.lower()
+        return {
+            'new': statuses.count('new'),
+            'changed': statuses.count('changed'),
+            'unchanged': statuses.count('unchanged'),
+            'removed': removed,
+            'pruned': prune
+        }
 
-        # Replace spaces and special chars with hyphens
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[\s_]+', '-', slug)
+    def _track_slugs(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        url_field: str,
+        slugs: Set[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Pass rows through while recording their URL slugs."""
+        for i, row in enumerate(rows, 1):
+            slugs.add(self._sanitize_slug(str(row.get(url_field, i))))
+            yield row
 
-        # Remove leading/trailing hyphens
-        slug = slug.strip('-')
+    def _sanitize_slug(self, text: str) -> str:
+        """Convert text to URL-safe slug (see page_store.slugify)."""
+        return slugify(text)
+
+
+def _environment(template_dir: Path) -> Environment:
+    """Jinja2 environment for a templates directory."""
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=True,  # Security: escape HTML by default
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+def _referenced_fields(env: Environment, names: Iterable[str]) -> Set[str]:
+    """Variables the named templates read from row data (included/extended templates followed)."""
+    fields: Set[str] = set()
+    seen: Set[str] = set()
+    pending = list(names)
+
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+
+        source = env.loader.get_source(env, name)[0]
+        ast = env.parse(source)
+        fields |= meta.find_undeclared_variables(ast)
+        pending.extend(ref for ref in meta.find_referenced_templates(ast) if ref)
+
+    return fields
+
+
+def _template_boilerplate(env: Environment, names: List[str]) -> List[int]:
+    """Shingle hashes of the named templates rendered empty and with SKELETON_VALUE in every field."""
+    fields = _referenced_fields(env, names)
+    texts = []
+    for name in names:
+        template = env.get_template(name)
+        for row in ({}, dict.fromkeys(fields, SKELETON_VALUE)):
+            try:
+                texts.append(extract_facts(template.render(**row)).body_text)
+            except Exception:
+                continue  # the template needs real values here
+    return MinHasher().learn_boilerplate(texts).boilerplate.tolist()
+
+
+def template_boilerplate(template_path: str) -> List[int]:
+    """
+    Shingle hashes of a template's own text, to leave out of the uniqueness
+    check of pages generated from it (QualityChecker(boilerplate=...),
+    site_db.build(boilerplate=...)).
+
+    The template is rendered without row data, once with every field empty
+    and once with a placeholder in every field, so text behind
+    {% if field %} counts as well. Text that only appears through row data
+    stays in the check.
+
+    Args:
+        template_path: Template file, or a templates directory (every
+            *.html template in it)
+
+    Returns:
+        Sorted shingle hashes
+    """
+    path = Path(template_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Template not found: {path}")
+
+    if path.is_dir():
+        return _template_boilerplate(_environment(path), sorted(p.name for p in path.glob('*.html')))
+    return _template_boilerplate(_environment(path.parent), [path.name])
+
+
+# Per-process engine and incremental manifest for --workers mode (loaded once per worker)
+_worker_engine: Optional[TemplateEngine] = None
+_worker_previous: Optional[Dict[str, str]] = None
+
+
+def _init_worker(
+    engine_args: Dict[str, Any],
+    previous: Optional[Dict[str, str]] = None,
+    qa_base_url: Optional[str] = None,
+    boilerplate: Optional[List[int]] = None
+):
+    """Load the template(s) (and incremental manifest) once in each worker process."""
+    global _worker_engine, _worker_previous
+    _worker_engine = TemplateEngine(**engine_args)
+    _worker_previous = previous
+
+    if qa_base_url is not None:
+        _worker_engine.enable_qa(qa_base_url, boilerplate)
+
+
+def _chunked(
+    rows: Iterable[Dict[str, Any]],
+    size: int
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """Yield (1-based start index, rows) chunks without materializing the input."""
+    iterator = iter(rows)
+    start = 1
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _render_chunk(start: int, rows: List[Dict[str, Any]], url_field: str):
+    """
+    Render a contiguous chunk of rows in a worker process.
+
+    Returns:
+        Tuple of (generated entries, errors, rows processed), in row order
+    """
+    generated = []
+    errors = []
+
+    for i, row in enumerate(rows, start):
+        try:
+            generated.append(_worker_engine._generate_one(i, row, url_field, _worker_previous))
+        except Exception as e:
+            errors.append({
+                'id': row.get('id'),
+                'error': str(e)
+            })
 
-        return slug or 'page'
+    return generated, errors, len(rows)
 
 
 def main():
     """CLI interface for template engine."""
     parser = argparse.ArgumentParser(description='Generate pages from template + data')
-    parser.add_argument('--data', required=True, help='Path to data source (CSV/JSON)')
-    parser.add_argument('--template', required=True, help='Path to Jinja2 template')
+    parser.add_argument('--data', required=True, help='Path to data source (CSV/JSON/NDJSON/Parquet/Arrow)')
+    parser.add_argument('--template', required=True,
+                        help='Path to Jinja2 template (or templates directory with --route-field)')
     parser.add_argument('--output', required=True, help='Output directory')
     parser.add_argument('--limit', type=int, help='Limit pages (pilot mode)')
     parser.add_argument('--url-field', default='id', help='Field for URL slug (default: id)')
+    parser.add_argument('--workers', type=int, default=1, help='Render in N parallel processes (default: 1)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-render pages whose row data or template changed')
+    parser.add_argument('--prune', action='store_true',
+                        help='With --incremental, delete pages whose rows were removed')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream rows from the source in chunks (constant memory)')
+    parser.add_argument('--route-field', help='Row field that selects the template (e.g. page_type)')
+    parser.add_argument('--route-map', help='JSON file mapping route field values to template filenames')
+    parser.add_argument('--cache-dir',
+                        help='Cache parsed + normalized data here; unchanged sources load instantly')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL,
+                        help='Seconds to reuse cached Airtable/Sheets responses (default: 3600)')
+    parser.add_argument('--schema',
+                        help='Row schema JSON (types, lengths, patterns) checked before rendering')
+    parser.add_argument('--all-columns', action='store_true',
+                        help='Load every source column (default: only fields the templates reference)')
+    parser.add_argument('--layout', choices=LAYOUTS, default='flat',
+                        help='Output layout: flat, sharded (hash-prefix dirs), tar or zip archive')
+    parser.add_argument('--qa', action='store_true',
+                        help='Run quality and SEO checks on each page before writing it')
+    parser.add_argument('--domain', default='https://example.com',
+                        help='Base URL for --qa SEO validation and sitemap')
+    parser.add_argument('--generate-sitemap', action='store_true',
+                        help='With --qa, also generate sitemap-N.xml files and sitemap_index.xml '
+                             '(no single sitemap.xml)')
 
     args = parser.parse_args()
 
     try:
+        # Load template(s) first: they decide which columns to load
+        print(f"Loading template: {args.template}")
+        routes = None
+        if args.route_map:
+            with open(args.route_map, 'r', encoding='utf-8') as f:
+                routes = json.load(f)
+
+        engine = TemplateEngine(
+            args.template,
+            args.output,
+            layout=args.layout,
+            route_field=args.route_field or ('page_type' if routes else None),
+            routes=routes
+        )
+
+        if args.qa:
+            engine.enable_qa(args.domain)
+
+        columns = None
+        if not args.all_columns:
+            columns = engine.referenced_fields() | {args.url_field}
+            if engine.route_field:
+                columns.add(engine.route_field)
+
         # Load data
         print(f"Loading data from: {args.data}")
-        loader = DataLoader(args.data)
-        data = loader.load()
-
-        # Validate
-        validation = loader.validate()
-        if not validation['valid']:
-            print("❌ Data validation failed:")
-            for error in validation['errors']:
-                print(f"   {error}")
-            sys.exit(1)
-
-        # Normalize
-        normalized = loader.normalize()
-        print(f"✅ Loaded and normalized {len(normalized)} rows")
+        loader = DataLoader(args.data, columns=columns, cache_dir=args.cache_dir,
+                            schema=args.schema, cache_ttl=args.cache_ttl)
+
+        if args.stream:
+            # Each row is validated before it is rendered; an invalid row
+            # (missing required field, duplicate ID) stops the run
+            normalized = loader.iter_rows()
+            print(f"✅ Streaming rows from source")
+        else:
+            data = loader.load()
+
+            # Validate
+            validation = loader.validate()
+            if not validation['valid']:
+                print("❌ Data validation failed:")
+                for error in validation['errors']:
+                    print(f"   {error}")
+                sys.exit(1)
+
+            if validation['schema_failures']:
+                print(f"⚠️  Schema: {len(validation['schema_failures'])} checks failed, "
+                      f"{len(validation['rejected_rows'])} rows rejected "
+                      f"(details: data_loader.py --validate --schema)")
+
+            # Normalize
+            normalized = loader.normalize()
+            loader.save_cache()
+            print(f"✅ Loaded and normalized {len(normalized)} rows"
+                  f"{' (from cache)' if loader.cache_hit else ''}")
 
         # Render pages
         print(f"\nRendering template: {args.template}")
-        engine = TemplateEngine(args.template, args.output)
 
         # Generate
         report = engine.generate_pages(
             normalized,
             limit=args.limit,
-            url_field=args.url_field
+            url_field=args.url_field,
+            workers=args.workers,
+            incremental=args.incremental,
+            prune=args.prune
         )
 
         # Print report
@@ -207,6 +813,15 @@ def main():
         print(f"❌ Errors: {report['error_count']} pages")
         print(f"📁 Output: {report['output_dir']}")
 
+        for name, count in report.get('templates', {}).items():
+            print(f"📄 {name}: {count} pages")
+
+        if 'incremental' in report:
+            inc = report['incremental']
+            print(f"🔁 Incremental: {inc['new']} new, {inc['changed']} changed, "
+                  f"{inc['unchanged']} unchanged, {len(inc['removed'])} removed"
+                  f"{' (pruned)' if inc['pruned'] else ''}")
+
         if report['errors']:
             print(f"\nErrors:")
             for error in report['errors']:
@@ -219,6 +834,48 @@ def main():
 
         print(f"\n📊 Full report saved to: {report_path}")
 
+        if args.qa and engine.quality_checker.results:
+            quality_report = engine.quality_checker.build_report()
+            seo_report = engine.seo_validator.build_report()
+
+            quality_path = Path(args.output) / 'quality_report.json'
+            with open(quality_path, 'w', encoding='utf-8') as f:
+                json.dump(quality_report, f, indent=2, ensure_ascii=False)
+
+            seo_path = Path(args.output) / 'seo_validation_report.json'
+            with open(seo_path, 'w', encoding='utf-8') as f:
+                json.dump(seo_report, f, indent=2, ensure_ascii=False)
+
+            print(f"\n{'='*50}")
+            print(f"QA REPORT")
+            print(f"{'='*50}")
+            print(f"✅ Quality passed: {quality_report['passed']} ({quality_report['pass_rate']}%)")
+            print(f"Average Score: {quality_report['average_score']}/10")
+            print(f"✅ SEO valid: {seo_report['valid']}/{seo_report['total_pages']}")
+            print(f"🔗 Broken internal links: {seo_report['link_graph']['broken_links']}, "
+                  f"unverified: {seo_report['link_graph']['unverified_links']}, "
+                  f"orphan pages: {seo_report['link_graph']['orphans']}")
+            duplicates = seo_report['duplicates']
+            print(f"📑 Duplicate titles: {duplicates['meta_title']['pages']} pages, "
+                  f"meta descriptions: {duplicates['meta_description']['pages']} pages, "
+                  f"shared canonicals: {duplicates['canonical']['shared_pages']} pages")
+            print(f"📊 Reports saved to: {quality_path}, {seo_path}")
+
+            if args.generate_sitemap:
+                engine.seo_validator.generate_sitemap()
+
+            # Same gate as quality_checker.py
+            if quality_report['pass_rate'] < 90:
+                print(f"\n❌ Pass rate below 90% - review and fix issues before scaling")
+                sys.exit(1)
+
+        # Errors stop the stream; an empty feed is only known at the end
+        if args.stream and not args.limit and not loader.stream_validation['valid']:
+            print("\n❌ Data validation failed:")
+            for error in loader.stream_validation['errors']:
+                print(f"   {error}")
+            sys.exit(1)
+
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
@@ -0,0 +1,42 @@
+"""Shared fixtures for the Programmatic SEO Generator script tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+
+# Scripts import each other as top-level modules (run from scripts/)
+sys.path.insert(0, str(SKILL_DIR / 'scripts'))
+
+from data_loader import DataLoader  # noqa: E402
+
+
+@pytest.fixture
+def sample_csv() -> Path:
+    """Bundled example data (10 products)."""
+    return SKILL_DIR / 'examples' / 'sample_data.csv'
+
+
+@pytest.fixture
+def product_template() -> Path:
+    """Bundled product page template."""
+    return SKILL_DIR / 'templates' / 'product_page.html'
+
+
+@pytest.fixture
+def sample_rows(sample_csv):
+    """Normalized rows of the example data."""
+    return DataLoader(str(sample_csv)).load()
+
+
+@pytest.fixture
+def many_rows(sample_rows):
+    """Example rows repeated with distinct slugs (enough for several worker chunks)."""
+    rows = []
+    for copy in range(6):
+        for row in sample_rows:
+            rows.append({**row, 'id': f"{row['id']}-{copy}", 'url_slug': f"{row['url_slug']}-{copy}",
+                         'title': f"{row['title']} {copy}"})
+    return rows
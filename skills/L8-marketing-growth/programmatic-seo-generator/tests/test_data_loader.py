@@ -0,0 +1,186 @@
+"""Tests for data_loader.py."""
+
+import os
+import pickle
+
+import pandas as pd
+import pytest
+
+from data_loader import DataLoader
+
+
+def _write_csv(path, rows, header='id,title,description'):
+    path.write_text('\n'.join([header] + rows) + '\n', encoding='utf-8')
+    return path
+
+
+def test_stream_stops_at_duplicate_id(tmp_path):
+    source = _write_csv(tmp_path / 'feed.csv', [f"{i},Title {i},Text {i}" for i in range(1, 6)] + ['3,Again,Text'])
+    loader = DataLoader(str(source))
+    rendered = []
+
+    with pytest.raises(ValueError, match=r"Duplicate ID 3 in row 6"):
+        for row in loader.iter_rows(chunk_size=2):
+            rendered.append(row['id'])
+
+    # Every row before the duplicate, nothing after it
+    assert rendered == [1, 2, 3, 4, 5]
+
+
+def test_stream_stops_at_missing_required_field(tmp_path):
+    source = tmp_path / 'feed.ndjson'
+    source.write_text('{"id": 1, "title": "A", "description": "x"}\n{"id": 2, "title": "B"}\n', encoding='utf-8')
+    loader = DataLoader(str(source))
+
+    with pytest.raises(ValueError, match=r"Row 2: missing required fields: description"):
+        list(loader.iter_rows())
+
+
+def test_stream_warnings_keep_counts_and_examples(tmp_path):
+    rows = [f"{i},Title {i},   " for i in range(1, 101)]  # blank description everywhere
+    loader = DataLoader(str(_write_csv(tmp_path / 'feed.csv', rows)))
+
+    assert len(list(loader.iter_rows(chunk_size=30))) == 100
+
+    validation = loader.stream_validation
+    assert validation['valid']
+    assert validation['counts']['empty_fields'] == {'description': 100}
+    assert validation['empty_fields']['description'] == list(range(1, DataLoader.MAX_REPORTED + 1))
+    assert "in 100 rows: rows 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 (+90 more)" in validation['warnings'][0]
+
+
+def test_stream_ids_across_chunks_with_gaps(tmp_path):
+    # A chunk with an empty ID reads the column as float: 4.0 must still match 4
+    rows = ['1,A,x', '2,B,x', ',C,x', '4,D,x', '4,E,x']
+    loader = DataLoader(str(_write_csv(tmp_path / 'feed.csv', rows)))
+
+    with pytest.raises(ValueError, match=r"Duplicate ID .* in row 5"):
+        list(loader.iter_rows(chunk_size=2))
+
+
+def _cached_loader(source, cache_dir):
+    loader = DataLoader(str(source), cache_dir=str(cache_dir))
+    loader.load()
+    loader.validate()
+    loader.normalize()
+    loader.save_cache()
+    return loader
+
+
+def _age(path, seconds=60):
+    """Move a file's mtime into the past (outside the racy window)."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
+def test_cache_hit_skips_hashing(tmp_path, sample_csv, monkeypatch):
+    source = tmp_path / 'feed.csv'
+    source.write_bytes(sample_csv.read_bytes())
+    _age(source)
+    first = _cached_loader(source, tmp_path / 'cache')
+    assert not first.cache_hit
+
+    monkeypatch.setattr(DataLoader, '_content_hash', lambda self: pytest.fail('source was hashed'))
+    second = DataLoader(str(source), cache_dir=str(tmp_path / 'cache'))
+    assert second.load() == first.data
+    assert second.cache_hit
+    assert second.normalize() == first.normalize()
+
+
+def test_cache_touched_file_is_hashed_hit(tmp_path, sample_csv):
+    source = tmp_path / 'feed.csv'
+    source.write_bytes(sample_csv.read_bytes())
+    _age(source)
+    _cached_loader(source, tmp_path / 'cache')
+
+    _age(source, 30)  # same bytes, other mtime
+    loader = DataLoader(str(source), cache_dir=str(tmp_path / 'cache'))
+    loader.load()
+    assert loader.cache_hit
+
+
+def test_cache_invalidated_by_content_and_columns(tmp_path, sample_csv):
+    source = tmp_path / 'feed.csv'
+    source.write_bytes(sample_csv.read_bytes())
+    _age(source)
+    _cached_loader(source, tmp_path / 'cache')
+
+    # Other column projection: separate entry
+    projected = DataLoader(str(source), columns=['price'], cache_dir=str(tmp_path / 'cache'))
+    projected.load()
+    assert not projected.cache_hit
+
+    # Same size, other bytes, other mtime
+    content = source.read_bytes()
+    source.write_bytes(content.replace(b'Eiche Schreibtisch', b'Eiche Schreibtizch'))
+    assert len(source.read_bytes()) == len(content)
+    _age(source, 30)
+    changed = DataLoader(str(source), cache_dir=str(tmp_path / 'cache'))
+    rows = changed.load()
+    assert not changed.cache_hit
+    assert rows[0]['title'] == 'Eiche Schreibtizch'
+
+
+def test_cache_unreadable_or_foreign_entry_is_miss(tmp_path, sample_csv):
+    source = tmp_path / 'feed.csv'
+    source.write_bytes(sample_csv.read_bytes())
+    _age(source)
+    loader = _cached_loader(source, tmp_path / 'cache')
+    cache_path = loader._cache_path()
+
+    cache_path.write_bytes(b'not a pickle')
+    corrupt = DataLoader(str(source), cache_dir=str(tmp_path / 'cache'))
+    assert len(corrupt.load()) == 10
+    assert not corrupt.cache_hit
+
+    with open(cache_path, 'wb') as f:
+        pickle.dump({'format': DataLoader.CACHE_FORMAT + 1, 'data': []}, f)
+    foreign = DataLoader(str(source), cache_dir=str(tmp_path / 'cache'))
+    assert len(foreign.load()) == 10
+    assert not foreign.cache_hit
+
+
+def _comparable(rows):
+    """Rows with NaN replaced by a marker (NaN != NaN) and value types kept."""
+    return [{key: ('<nan>' if isinstance(value, float) and value != value else (type(value), value))
+             for key, value in row.items()} for row in rows]
+
+
+def _frame_parity(df):
+    rows = DataLoader._records(df)
+    assert _comparable(DataLoader._normalize_frame(df)) == _comparable(
+        [DataLoader._normalize_row(row) for row in rows])
+
+
+@pytest.mark.parametrize('infer_string', [False, True])
+def test_normalize_frame_matches_rows(tmp_path, infer_string):
+    source = tmp_path / 'feed.csv'
+    source.write_text(
+        'id,title,description,category,price,meta_title,mixed,blank\n'
+        '1,  Eiche Tisch ,"  Massiv  ",Möbel,599.99,,  x  ,\n'
+        '2,   ,,  ,12,Own Title,3,\n'
+        '3,Kiefer,' + 'Lang ' * 60 + ',,0,  ,,\n'
+        '4,,   ,Garten,,0,yes,\n',
+        encoding='utf-8'
+    )
+    # Object string columns (pandas 2 default) and string dtype (pandas 3)
+    with pd.option_context('future.infer_string', infer_string):
+        _frame_parity(pd.read_csv(source))
+
+
+def test_normalize_frame_mixed_columns():
+    df = pd.DataFrame({
+        'id': [1, 2, 3, 4, 5],
+        'title': ['  A ', None, float('nan'), 7, ''],
+        'description': [' text ', 0, float('nan'), 12.5, '   '],
+        'category': [None, 'Cat', '  ', float('nan'), 3],
+        'keywords': ['', 'given', None, 0, '  k  '],
+        'flag': [True, False, True, False, True]
+    })
+    _frame_parity(df)
+
+
+def test_normalize_uses_frame_for_csv(tmp_path, sample_csv):
+    loader = DataLoader(str(sample_csv))
+    rows = loader.load()
+    assert _comparable(loader.normalize()) == _comparable([DataLoader._normalize_row(row) for row in rows])
@@ -0,0 +1,112 @@
+"""Tests for duplicate_fields.py."""
+
+import pytest
+
+from duplicate_fields import EXAMPLES, CanonicalIndex, DuplicateIndex, field_key
+from seo_validator import SEOValidator
+from template_engine import TemplateEngine
+
+BASE_URL = 'https://topholz24.de'
+
+
+@pytest.mark.parametrize('value, same', [
+    ('Eiche Tisch', 'Eiche Tisch'),
+    ('Eiche Tisch', '  eiche   TISCH '),
+    ('Eiche\tTisch', 'Eiche\nTisch'),
+    ('Holzstraße', 'HOLZSTRASSE'),
+])
+def test_field_key_ignores_case_and_whitespace(value, same):
+    assert field_key(value) == field_key(same)
+
+
+def test_field_key_missing_and_distinct():
+    assert field_key(None) is None
+    assert field_key('') is None
+    assert field_key('   ') is None
+    assert field_key('Eiche Tisch') != field_key('Eiche Tische')
+    assert len(field_key('Eiche Tisch')) == 8
+
+
+def test_duplicate_index_groups():
+    index = DuplicateIndex(['a', 'b', None, 'a', None, 'c', 'a', 'b'])
+
+    assert index.groups == [[0, 3, 6], [1, 7]]
+    assert index.group == [0, 1, -1, 0, -1, -1, 0, 1]
+    # Missing values never collide, unique values are not grouped
+    assert [index.size(page) for page in range(8)] == [3, 2, 0, 3, 0, 0, 3, 2]
+    assert index.other(0) == 3
+    assert index.other(6) == 0
+    assert index.other(2) is None
+    assert index.largest(1) == [[0, 3, 6]]
+
+
+def test_duplicate_index_summary():
+    keys = ['x'] * (EXAMPLES + 2) + ['y', 'y', 'z']
+    pages = [f"page-{i}.html" for i in range(len(keys))]
+    labels = [f"Title {key}" for key in keys]
+
+    summary = DuplicateIndex(keys).summary(pages, labels, listed=1)
+    assert summary['groups'] == 2
+    assert summary['pages'] == EXAMPLES + 4
+    assert summary['largest'] == [
+        {'value': 'Title x', 'pages': EXAMPLES + 2, 'examples': pages[:EXAMPLES]}
+    ]
+
+
+def test_duplicate_index_empty():
+    index = DuplicateIndex(iter([]))
+    assert index.groups == []
+    assert index.summary([], []) == {'groups': 0, 'pages': 0, 'largest': []}
+
+
+def test_canonical_index():
+    slugs = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+    canonicals = [
+        f"{BASE_URL}/a",          # self-referencing
+        f"{BASE_URL}/a",          # hands its ranking to a
+        '/a',                     # root-relative, same target
+        'https://other.de/d',     # another site
+        f"{BASE_URL}/gone",       # page that does not exist
+        f"{BASE_URL}/",           # site root always exists
+        None,
+    ]
+    index = CanonicalIndex(canonicals, slugs, BASE_URL)
+
+    assert index.targets == ['a', 'a', 'a', None, 'gone', '', None]
+    assert index.missing == [False, False, False, False, True, False, False]
+    assert index.index.groups == [[0, 1, 2]]
+
+    report = index.analyze([f"{slug}.html" for slug in slugs])
+    assert report['self_referencing'] == 1
+    assert report['external'] == 1
+    assert report['shared_groups'] == 1
+    assert report['shared_pages'] == 3
+    assert report['largest'] == [{'target': '/a', 'pages': 3, 'examples': ['a.html', 'b.html', 'c.html']}]
+    assert report['missing'] == 1
+    assert report['missing_targets'] == [{'target': '/gone', 'pages': 1, 'example': 'e.html'}]
+
+
+def test_canonical_index_known_pages():
+    index = CanonicalIndex([f"{BASE_URL}/kontakt", f"{BASE_URL}/gone"], ['a', 'b'], BASE_URL, known={'kontakt'})
+    assert index.missing == [False, True]
+
+
+def test_validator_reports_duplicate_titles(tmp_path, product_template, sample_rows):
+    rows = [{**row, 'meta_title': row['title']} for row in sample_rows]
+    rows[4]['meta_title'] = rows[1]['meta_title'] = 'Massivholz  Möbel'
+    rows[7]['meta_title'] = 'massivholz möbel'
+    TemplateEngine(str(product_template), str(tmp_path)).generate_pages(rows, url_field='url_slug')
+
+    validator = SEOValidator(str(tmp_path), BASE_URL)
+    report = validator.validate_all()
+
+    titles = report['duplicates']['meta_title']
+    assert titles['groups'] == 1
+    assert titles['pages'] == 3
+    duplicated = sorted(result['url'] for result in report['results']
+                        if result['duplicate_fields'].get('meta_title') == 3)
+    assert duplicated == sorted(f"{BASE_URL}/{rows[i]['url_slug']}" for i in (1, 4, 7))
+    for result in report['results']:
+        if result['url'] in duplicated:
+            assert not result['valid']
+            assert any(issue.startswith('Duplicate title: shared by 3 pages') for issue in result['issues'])
@@ -0,0 +1,73 @@
+"""Tests for link_graph.py."""
+
+from link_graph import LinkGraph, link_targets, resolve_href
+
+BASE_URL = 'https://topholz24.de'
+
+
+def _graph(links, known=None):
+    """Graph of pages a-f from {slug: [hrefs]}."""
+    slugs = list(links)
+    targets = [link_targets(hrefs, slug, BASE_URL) for slug, hrefs in links.items()]
+    graph = LinkGraph(slugs, targets, known)
+    return graph, graph.analyze([f"{slug}.html" for slug in slugs], hubs=['a'])
+
+
+SITE = {
+    'a': ['/b', '/c', '/', '#top'],
+    'b': ['/d', '/impressum', 'https://topholz24.de/a'],
+    'c': ['d.html', '/tipo'],
+    'd': ['../e?sort=price', '/impressum'],
+    'e': ['https://other.de/x', 'mailto:info@topholz24.de'],
+    'f': ['/a'],
+}
+
+
+def test_resolve_href():
+    assert resolve_href('/', '/a', BASE_URL) == ''
+    assert resolve_href(BASE_URL, '/a', BASE_URL) == ''
+    assert resolve_href('/kategorie/tische/', '/a', BASE_URL) == 'kategorie/tische'
+    assert resolve_href('../b.html#faq', '/kategorie/a', BASE_URL) == 'b'
+    assert resolve_href('/M%C3%B6bel', '/a', BASE_URL) == 'Möbel'
+    assert resolve_href('#faq', '/a', BASE_URL) is None
+    assert resolve_href('//cdn.de/x', '/a', BASE_URL) is None
+
+
+def test_broken_links_need_site_urls():
+    graph, report = _graph(SITE)
+
+    # Without a site URL list nothing outside the generated pages is broken
+    assert report['broken_links'] == 0
+    assert report['unverified_links'] == 3
+    assert report['unverified_targets'][0] == {'target': '/impressum', 'pages': 2, 'example': 'b.html'}
+    assert graph.unverified[2] == ['tipo']
+
+    graph, report = _graph(SITE, known={'impressum'})
+    assert report['unverified_links'] == 0
+    assert report['broken_targets'] == [{'target': '/tipo', 'pages': 1, 'example': 'c.html'}]
+    assert graph.broken == [[], [], ['tipo'], [], [], []]
+
+
+def test_orphans_and_in_degree():
+    graph, report = _graph(SITE)
+
+    assert report['links'] == 7  # a->b, a->c, b->d, b->a, c->d, d->e, f->a
+    assert graph.in_degree.tolist() == [2, 1, 1, 2, 1, 0]
+    assert report['orphans'] == 1
+    assert report['orphan_pages'] == ['f.html']
+    assert report['in_degree']['histogram'] == {'0': 1, '1': 3, '2-5': 2, '6-10': 0, '11-50': 0, '51+': 0}
+
+
+def test_click_depth():
+    graph, report = _graph(SITE)
+
+    assert graph.depth.tolist() == [0, 1, 1, 2, 3, -1]
+    assert report['click_depth'] == {'max': 3, 'average': 1.4, 'unreachable': 1,
+                                     'histogram': {'0': 1, '1': 2, '2': 1, '3': 1}}
+
+
+def test_default_hubs_are_most_linked():
+    slugs = ['hub', 'x', 'y', 'z']
+    graph = LinkGraph(slugs, [['x', 'y', 'z'], ['hub'], ['hub'], ['hub', 'x']])
+    assert graph.hubs() == [0, 1, 2, 3]
+    assert graph.hubs(['z', 'missing']) == [3]
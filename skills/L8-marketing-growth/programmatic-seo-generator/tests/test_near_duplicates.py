@@ -0,0 +1,141 @@
+"""Tests for near_duplicates.py and the uniqueness check of quality_checker.py."""
+
+import random
+
+from near_duplicates import MinHasher, find_near_duplicates
+from quality_checker import QualityChecker
+from site_db import build
+from template_engine import TemplateEngine, template_boilerplate
+
+CITIES = ['Berlin', 'Hamburg', 'München', 'Köln', 'Frankfurt', 'Stuttgart', 'Düsseldorf', 'Leipzig',
+          'Dortmund', 'Essen', 'Bremen', 'Dresden', 'Hannover', 'Nürnberg', 'Duisburg', 'Bochum',
+          'Wuppertal', 'Bielefeld', 'Bonn', 'Münster']
+
+# Own text of each planted pair
+LONG_TEXTS = [
+    "Unsere Werkstatt fertigt jedes Stück von Hand aus regionalem Holz, das langsam an der Luft "
+    "getrocknet wird. Die Oberfläche wird mehrfach geschliffen und mit natürlichem Hartwachsöl "
+    "behandelt, damit die Maserung lebendig bleibt und das Möbel über Jahrzehnte schön bleibt.",
+    "Das Regal wird in kleiner Serie von Hand gebaut und kommt vormontiert mit allen Beschlägen. "
+    "Die Böden tragen jeweils bis zu zwanzig Kilogramm und lassen sich in der Höhe frei versetzen, "
+    "sodass Bücher, Pflanzen und Vorratsgläser gleichermaßen Platz finden."
+]
+
+
+def _planted_rows(sample_rows):
+    """Example rows (distinct pages sharing the template) plus two near-duplicate pairs."""
+    rows = [dict(row) for row in sample_rows]
+    for number, (original, text) in enumerate(zip(rows[:2], LONG_TEXTS)):
+        original['description'] = f"{original['description']} {text}"
+        rows.append({**original, 'id': 100 + number, 'url_slug': f"{original['url_slug']}-kopie",
+                     'description': original['description'].replace('Hand', 'Handarbeit')})
+    return rows
+
+
+def _generate(tmp_path, template, rows, **qa):
+    engine = TemplateEngine(str(template), str(tmp_path / 'pages'))
+    if qa:
+        engine.enable_qa('https://topholz24.de')
+    engine.generate_pages(rows, url_field='url_slug')
+    return engine
+
+
+def _flagged(report):
+    return {result['page']: {d['page'] for d in result['duplicates']}
+            for result in report['results'] if result['uniqueness'] < QualityChecker.MIN_UNIQUENESS}
+
+
+def _expected(rows):
+    pairs = {}
+    for original in rows[:2]:
+        page, copy = f"{original['url_slug']}.html", f"{original['url_slug']}-kopie.html"
+        pairs[page], pairs[copy] = {copy}, {page}
+    return pairs
+
+
+def _spun_copy(count=20, words=400):
+    """The same random words on every page, which differ only in a city name."""
+    rng = random.Random(7)
+    vocabulary = [f"wort{n}" for n in range(2000)]
+    copy = ' '.join(rng.choice(vocabulary) for _ in range(words))
+    return [f"Holzbau in {city}. {copy}" for city in CITIES[:count]]
+
+
+def test_template_text_is_not_duplication(tmp_path, product_template, sample_rows):
+    _generate(tmp_path, product_template, sample_rows)
+
+    checker = QualityChecker(str(tmp_path / 'pages'), boilerplate=template_boilerplate(product_template))
+    assert checker.check_all()['near_duplicate_pages'] == 0
+
+
+def test_template_boilerplate_leaves_row_text(tmp_path):
+    template = tmp_path / 'page.html'
+    template.write_text(
+        "<html><body><nav>Startseite Produkte Ratgeber Kontakt Impressum</nav><h1>{{ title }}</h1>"
+        "{% if features %}<h3>Alle Produktmerkmale auf einen Blick</h3><p>{{ features }}</p>{% endif %}"
+        "<footer>Premium Holzprodukte aus Deutschland seit 1950</footer></body></html>",
+        encoding='utf-8'
+    )
+    hasher = MinHasher(boilerplate=template_boilerplate(str(template)))
+
+    assert len(hasher.shingles("Startseite Produkte Ratgeber Kontakt Impressum")) == 0
+    assert len(hasher.shingles("Alle Produktmerkmale auf einen Blick")) == 0  # behind {% if %}
+    assert len(hasher.shingles("Premium Holzprodukte aus Deutschland seit 1950")) == 0
+    assert len(hasher.shingles("Massiver Tisch aus geölter Eiche für sechs Personen")) == 4
+
+
+def test_spun_copy_fails_uniqueness(tmp_path):
+    # Every page a near-duplicate of every other: nothing may count as template text
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    for city, text in zip(CITIES, _spun_copy()):
+        (pages / f"holzbau-{city.lower()}.html").write_text(
+            f"<html><body><h1>Holzbau {city}</h1><p>{text}</p></body></html>", encoding='utf-8')
+
+    report = QualityChecker(str(pages)).check_all()
+    assert report['near_duplicate_pages'] == 20
+    assert report['passed'] == 0
+    assert all(result['uniqueness'] < 10 and result['duplicates'] for result in report['results'])
+
+
+def test_spun_copy_in_row_data_fails_with_template(tmp_path, product_template, sample_rows):
+    rows = [{**sample_rows[i % 10], 'id': i, 'url_slug': f"holzbau-{i}", 'title': f"Holzbau {city}",
+             'description': text}
+            for i, (city, text) in enumerate(zip(CITIES, _spun_copy()))]
+    engine = _generate(tmp_path, product_template, rows, qa=True)
+    assert len(engine.quality_checker.minhasher.boilerplate) > 0
+    assert engine.quality_checker.build_report()['near_duplicate_pages'] == 20
+
+    checker = QualityChecker(str(tmp_path / 'pages'), boilerplate=template_boilerplate(product_template))
+    assert checker.check_all()['near_duplicate_pages'] == 20
+
+
+def test_planted_duplicates_found(tmp_path, product_template, sample_rows):
+    rows = _planted_rows(sample_rows)
+    _generate(tmp_path, product_template, rows)
+    boilerplate = template_boilerplate(product_template)
+
+    checker = QualityChecker(str(tmp_path / 'pages'), boilerplate=boilerplate)
+    assert _flagged(checker.check_all()) == _expected(rows)
+
+    parallel = QualityChecker(str(tmp_path / 'pages'), boilerplate=boilerplate)
+    assert _flagged(parallel.check_all(workers=2)) == _expected(rows)
+
+
+def test_planted_duplicates_found_in_render_and_db(tmp_path, product_template, sample_rows):
+    rows = _planted_rows(sample_rows)
+    engine = _generate(tmp_path, product_template, rows, qa=True)
+    assert _flagged(engine.quality_checker.build_report()) == _expected(rows)
+
+    build(str(tmp_path / 'pages'), boilerplate=template_boilerplate(product_template))
+    checker = QualityChecker(str(tmp_path / 'pages'), db=str(tmp_path / 'pages' / 'site.db'))
+    assert _flagged(checker.check_all()) == _expected(rows)
+
+
+def test_template_only_pages_are_identical():
+    header, footer = 'shared header text on every single page', 'the same footer line closes every page'
+    hasher = MinHasher().learn_boilerplate([f"{header} {footer}"])
+    template_only = hasher.signature(header)
+    assert template_only == hasher.signature(footer)
+    assert template_only != hasher.signature(f"{header} own words 3 4 5 {footer}")
+    assert find_near_duplicates([template_only, template_only], 0.3)[0][0] == 1.0
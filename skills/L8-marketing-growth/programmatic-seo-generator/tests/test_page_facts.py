@@ -0,0 +1,95 @@
+"""Tests for page_facts.py: parity with the BeautifulSoup extraction it replaces."""
+
+import re
+
+import pytest
+
+from page_facts import extract_facts
+from template_engine import TemplateEngine
+
+bs4 = pytest.importorskip('bs4')
+
+TRICKY_PAGES = [
+    # Entities, comments, CDATA, doctype and whitespace-only text
+    '<!DOCTYPE html><html><head><title>Tische &amp; St&uuml;hle</title></head>\n'
+    '<body>  <!-- nav -->\n <p>Preis: 5&nbsp;&euro;</p><![CDATA[roh]]>\t</body></html>',
+    # Unclosed and stray tags, nested h1, text after </body>
+    '<html><body><div><h1>Erste <b>Überschrift</h1><p>offen<span>innen</div></i>'
+    '<h1>Zweite</h1></body>nach dem Body</html>',
+    # Hidden elements, <pre> whitespace, ruby text
+    '<body><script>var x = "<p>kein Text</p>";</script><style>p {}</style><pre>  \n  </pre>'
+    '<ruby>漢<rt>kan</rt></ruby><template><p>Vorlage</p></template>Ende</body>',
+    # First of each tag wins, valueless and duplicate attributes, rel lists
+    '<head><meta name="description" content="erste"><meta name="description" content="zweite">'
+    '<meta name="robots"><meta property="og:title" content="a" content="b">'
+    '<link rel="alternate canonical" href="/kanonisch"><link rel="canonical" href="/zweite"></head>'
+    '<body><a href="/a">a</a><a>ohne</a><a href="">leer</a><a href="https://x.de">x</a>'
+    '<img src="a.jpg"><img src="b.jpg" alt=""><img src="c.jpg" alt="C"><img alt/></body>',
+    # JSON-LD: only the first script counts; no body at all
+    '<script type="application/ld+json">{"@type": "Product"}</script>'
+    '<script type="application/ld+json">{"@type": "Offer"}</script><p>Kein Body</p>',
+    '<html><head><script type="application/ld+json"></script></head><body><br/>x<hr>y</body></html>',
+]
+
+
+def _soup_facts(html):
+    """The values the BeautifulSoup-based checkers read from a page."""
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+    title, h1, body = soup.find('title'), soup.find('h1'), soup.find('body')
+    schema = soup.find('script', attrs={'type': 'application/ld+json'})
+
+    meta = {}
+    for key in ('description', 'keywords', 'robots'):
+        tag = soup.find('meta', attrs={'name': key})
+        if tag:
+            meta[key] = tag.get('content')
+    for key in ('og:title', 'og:description', 'og:image'):
+        tag = soup.find('meta', attrs={'property': key})
+        if tag:
+            meta[key] = tag.get('content')
+    canonical = soup.find('link', attrs={'rel': 'canonical'})
+    if canonical:
+        meta['canonical'] = canonical.get('href')
+
+    images = soup.find_all('img')
+    return {
+        'text': soup.get_text(),
+        'body_text': body.get_text() if body else soup.get_text(),
+        'title': title.get_text() if title else None,
+        'h1': h1.get_text() if h1 else None,
+        'h1_count': len(soup.find_all('h1')),
+        'meta': meta,
+        'links': [a['href'] for a in soup.find_all('a', href=True)],
+        'images': len(images),
+        'images_without_alt': sum(1 for img in images if not img.get('alt')),
+        'schema': (schema.string or '') if schema else None
+    }
+
+
+def _facts(html):
+    facts = extract_facts(html)
+    return {key: getattr(facts, key) for key in _soup_facts('').keys()}
+
+
+@pytest.mark.parametrize('html', TRICKY_PAGES)
+def test_matches_beautifulsoup(html):
+    assert _facts(html) == _soup_facts(html)
+
+
+def test_rendered_pages_match_beautifulsoup(tmp_path, product_template, sample_rows):
+    engine = TemplateEngine(str(product_template), str(tmp_path))
+    for row in sample_rows:
+        html = engine.render_page(row)
+        assert _facts(html) == _soup_facts(html)
+
+
+def test_word_count_and_internal_links(sample_rows, product_template, tmp_path):
+    html = TemplateEngine(str(product_template), str(tmp_path)).render_page(sample_rows[0])
+    facts = extract_facts(html)
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+
+    assert facts.word_count == len(re.findall(r'\b\w+\b', soup.get_text()))
+    assert facts.internal_links == [
+        a['href'] for a in soup.find_all('a', href=True)
+        if not a['href'].startswith(('http://', 'https://', 'mailto:', 'tel:'))
+    ]
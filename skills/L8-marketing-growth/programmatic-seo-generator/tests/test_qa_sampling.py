@@ -0,0 +1,98 @@
+"""Tests for qa_sampling.py."""
+
+import random
+from collections import Counter
+from statistics import NormalDist
+
+import pytest
+
+from qa_sampling import PassRateEstimate, stratified_order, wilson_interval
+
+Z95 = NormalDist().inv_cdf(0.975)
+
+
+def test_wilson_interval_reference_values():
+    # Textbook example: 90 of 100 at 95% confidence
+    lower, upper = wilson_interval(0.9, 100, Z95)
+    assert lower == pytest.approx(0.8256, abs=1e-4)
+    assert upper == pytest.approx(0.9448, abs=1e-4)
+
+    lower, upper = wilson_interval(0.5, 10, Z95)
+    assert (lower, upper) == pytest.approx((0.2366, 0.7634), abs=1e-4)
+
+
+def test_wilson_interval_edges():
+    assert wilson_interval(0.7, 0, Z95) == (0.0, 1.0)
+
+    lower, upper = wilson_interval(0.0, 20, Z95)
+    assert lower == 0.0 and upper == pytest.approx(Z95 ** 2 / (20 + Z95 ** 2))
+
+    lower, upper = wilson_interval(1.0, 20, Z95)
+    assert upper == 1.0 and lower == pytest.approx(20 / (20 + Z95 ** 2))
+
+    # Narrows with more trials and always contains the rate
+    widths = [upper - lower for lower, upper in (wilson_interval(0.95, n, Z95) for n in (10, 100, 1000))]
+    assert widths == sorted(widths, reverse=True)
+
+
+@pytest.mark.parametrize('rate', [0.5, 0.9, 0.98])
+def test_wilson_interval_coverage(rate):
+    rng = random.Random(7)
+    n, trials = 150, 2000
+    covered = 0
+    for _ in range(trials):
+        passed = sum(rng.random() < rate for _ in range(n))
+        lower, upper = wilson_interval(passed / n, n, Z95)
+        covered += lower <= rate <= upper
+    assert covered / trials >= 0.93
+
+
+def test_estimate_weights_strata_and_bounds_unknown():
+    estimate = PassRateEstimate({'a': 800, 'b': 200}, confidence=0.95)
+    for i in range(40):
+        estimate.add('a', i % 10 != 0)  # 90%
+
+    # Stratum b is unknown: anything from all failing to all passing
+    rate, lower, upper = estimate.interval()
+    assert rate == pytest.approx(0.9)
+    assert upper >= 0.2 + 0.8 * 0.9
+    assert lower <= 0.8 * 0.9
+
+    for i in range(10):
+        estimate.add('b', i < 5)  # 50%
+    rate, lower, upper = estimate.interval()
+    assert rate == pytest.approx(0.8 * 0.9 + 0.2 * 0.5)
+    assert lower < rate < upper
+
+
+def test_estimate_exact_once_every_page_is_checked():
+    estimate = PassRateEstimate({'a': 3, 'b': 2}, gate=50.0)
+    for stratum, passed in [('a', True), ('a', True), ('a', False), ('b', True), ('b', False)]:
+        estimate.add(stratum, passed)
+    assert estimate.interval() == (pytest.approx(0.6), pytest.approx(0.6), pytest.approx(0.6))
+    assert estimate.decision() == 'pass'
+
+
+def test_estimate_decisions():
+    good, bad = PassRateEstimate({'all': 100000}), PassRateEstimate({'all': 100000})
+    assert good.decision() is None
+    for _ in range(500):
+        good.add('all', True)
+        bad.add('all', False)
+    assert good.decision() == 'pass'
+    assert bad.decision() == 'fail'
+    assert bad.summary()['decision'] == 'fail'
+
+
+def test_stratified_order_prefixes_are_proportional():
+    strata = ['a'] * 600 + ['b'] * 300 + ['c'] * 100
+    order = stratified_order(strata, 500, random.Random(1))
+
+    assert len(order) == len(set(order)) == 500
+    for prefix in (10, 50, 200, 500):
+        counts = Counter(strata[page] for page in order[:prefix])
+        for stratum, share in (('a', 0.6), ('b', 0.3), ('c', 0.1)):
+            assert abs(counts[stratum] - share * prefix) <= 1
+
+    assert stratified_order(strata, 500, random.Random(1)) == order
+    assert len(stratified_order(strata, 5000, random.Random(1))) == 1000
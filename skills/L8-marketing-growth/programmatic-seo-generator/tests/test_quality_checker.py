@@ -0,0 +1,102 @@
+"""Tests for quality_checker.py."""
+
+import json
+
+import pytest
+
+from quality_checker import QualityChecker
+from site_db import build
+from template_engine import TemplateEngine
+
+
+@pytest.fixture(params=['flat', 'sharded', 'tar', 'zip'])
+def pages_dir(request, tmp_path, product_template, many_rows):
+    """Generated example pages in each output layout."""
+    output = tmp_path / request.param
+    TemplateEngine(str(product_template), str(output), layout=request.param).generate_pages(many_rows, url_field='url_slug')
+    return output
+
+
+def _report(pages_dir, workers, **options):
+    checker = QualityChecker(str(pages_dir), **options)
+    return checker.check_all(workers=workers, chunk_size=7)
+
+
+def test_workers_match_serial(pages_dir):
+    serial = _report(pages_dir, workers=1)
+    assert serial['total_pages'] == 60
+    assert _report(pages_dir, workers=3) == serial
+
+
+def test_workers_match_serial_from_db(pages_dir):
+    build(str(pages_dir))
+    db = str(pages_dir / 'site.db')
+    serial = _report(pages_dir, workers=1, db=db)
+    assert _report(pages_dir, workers=3, db=db) == serial
+    assert serial['results'] == _report(pages_dir, workers=1)['results']
+
+
+def test_workers_reuse_listing(pages_dir, monkeypatch):
+    checker = QualityChecker(str(pages_dir))
+
+    # Worker processes (forked) must open pages from the parent's listing
+    def scan(self):
+        raise AssertionError('pages directory scanned again')
+    monkeypatch.setattr('page_store.PageReader._scan', scan)
+
+    checker.check_all(workers=2, chunk_size=7)
+    assert len(checker.results) == 60
+
+
+def test_jsonl_matches_report(pages_dir, tmp_path):
+    full = _report(pages_dir, workers=1)
+
+    checker = QualityChecker(str(pages_dir))
+    summary = checker.check_all(workers=2, chunk_size=7, jsonl=str(tmp_path / 'report.jsonl'))
+    with open(tmp_path / 'report.jsonl', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+
+    # The example copies differ only in a suffix: every page is a near-duplicate
+    assert summary['near_duplicate_pages'] == full['near_duplicate_pages'] == 60
+    assert summary['pass_rate'] == full['pass_rate']
+    revisions = {r['page']: r for r in records if r['record'] == 'revision'}
+    assert {r['page']: (r['uniqueness'], r['duplicates']) for r in full['results']} == \
+        {page: (r['uniqueness'], r['duplicates']) for page, r in revisions.items()}
+
+
+def test_incremental_rerun_matches_full(tmp_path, product_template, many_rows):
+    pages = tmp_path / 'pages'
+    TemplateEngine(str(product_template), str(pages), layout='flat').generate_pages(many_rows, url_field='url_slug')
+    full = QualityChecker(str(pages)).check_all(incremental=True)
+
+    # Cached results come back with their signatures: uniqueness is checked again
+    rerun = QualityChecker(str(pages)).check_all(incremental=True)
+    assert full.pop('incremental') == {'reused': 0, 'checked': 60}
+    assert rerun.pop('incremental') == {'reused': 60, 'checked': 0}
+    assert rerun == full
+    assert full['near_duplicate_pages'] == 60
+
+
+def test_sample_stops_at_clear_failure(tmp_path, product_template, many_rows):
+    pages = tmp_path / 'pages'
+    TemplateEngine(str(product_template), str(pages)).generate_pages(many_rows, url_field='url_slug')
+    strata = [name.split('-')[0] for name in QualityChecker(str(pages)).pages]
+
+    # The example pages all fail the word count: 10 checked pages settle it
+    report = QualityChecker(str(pages)).check_sample(60, strata=strata, confidence=0.9, check_every=10, seed=3)
+    assert report['decision'] == 'fail'
+    assert report['sampled'] == len(report['results']) == 10
+    assert report['interval'][1] < report['gate']
+    assert sum(stratum['pages'] for stratum in report['strata'].values()) == 60
+
+
+def test_page_results_are_json(tmp_path, product_template, sample_rows):
+    pages = tmp_path / 'pages'
+    TemplateEngine(str(product_template), str(pages)).generate_pages(sample_rows, url_field='url_slug')
+    checker = QualityChecker(str(pages))
+    page = pages / checker.pages[0]
+
+    result = checker.check_page(page)
+    assert json.loads(json.dumps(result)) == result
+    assert checker.check_html(page.read_text(encoding='utf-8'), page.name) == result
+    assert all(not key.startswith('_') for key in result)
@@ -0,0 +1,187 @@
+"""Tests for remote_sources.py against a local mock API server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+
+import pytest
+
+import remote_sources
+from remote_sources import RateLimiter, RemoteSourceError, load_airtable, load_google_sheets
+
+
+class MockAPI:
+    """Local HTTP/1.1 server answering GETs from a route function."""
+
+    def __init__(self, route):
+        self.route = route
+        self.requests = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, as the real APIs
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                api.requests.append((unquote(parts.path), query, dict(self.headers)))
+                status, headers, payload = api.route(unquote(parts.path), query)
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def mock_api():
+    servers = []
+
+    def start(route):
+        servers.append(MockAPI(route))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(remote_sources.APIClient, 'BACKOFF_BASE', 0.01)
+    monkeypatch.setattr(remote_sources.APIClient, 'MAX_RETRIES', 2)
+
+
+def _airtable_route(tables):
+    """Serve each table's records in pages of 100 behind an offset cursor."""
+    def route(path, query):
+        table = path.rsplit('/', 1)[-1]
+        start = int(query.get('offset', 0))
+        size = int(query['pageSize'])
+        records = tables[table][start:start + size]
+        page = {'records': records}
+        if start + size < len(tables[table]):
+            page['offset'] = str(start + size)
+        return 200, {}, page
+    return route
+
+
+def _records(table, count):
+    return [{'id': f"rec{table}{i}", 'fields': {'title': f"{table} {i}"}} for i in range(count)]
+
+
+def test_airtable_pages_through_offsets(mock_api):
+    api = mock_api(_airtable_route({'tblA': _records('A', 250), 'Table B': _records('B', 30)}))
+
+    rows = load_airtable(f"{api.url}/v0/appBASE/tblA,Table B?view=viwGrid", token='pat-test')
+
+    assert [row['title'] for row in rows] == [f"A {i}" for i in range(250)] + [f"B {i}" for i in range(30)]
+    assert rows[0]['id'] == 'recA0'
+    offsets = sorted(query.get('offset') or '' for path, query, _ in api.requests if path.endswith('tblA'))
+    assert offsets == ['', '100', '200']
+    assert all(query['view'] == 'viwGrid' for _, query, _ in api.requests)
+    assert all(headers['Authorization'] == 'Bearer pat-test' for _, _, headers in api.requests)
+
+
+def test_airtable_cache_skips_requests(mock_api, tmp_path):
+    api = mock_api(_airtable_route({'tblA': _records('A', 150)}))
+    source = f"{api.url}/v0/appBASE/tblA"
+
+    first = load_airtable(source, cache_dir=str(tmp_path), token='pat-test')
+    assert len(api.requests) == 2
+
+    assert load_airtable(source, cache_dir=str(tmp_path), token='pat-test') == first
+    assert len(api.requests) == 2
+
+    # Expired entries are fetched again
+    load_airtable(source, cache_dir=str(tmp_path), cache_ttl=0, token='pat-test')
+    assert len(api.requests) == 4
+
+
+def test_retry_after_is_honoured(mock_api):
+    limited = []
+    inner = _airtable_route({'tblA': _records('A', 5)})
+
+    def route(path, query):
+        if not limited:
+            limited.append(time.monotonic())
+            return 429, {'Retry-After': '0.3'}, {'error': 'RATE_LIMIT_REACHED'}
+        limited.append(time.monotonic())
+        return inner(path, query)
+
+    api = mock_api(route)
+    rows = load_airtable(f"{api.url}/v0/appBASE/tblA", token='pat-test')
+
+    assert len(rows) == 5
+    assert len(api.requests) == 2
+    assert limited[1] - limited[0] >= 0.3
+
+
+def test_errors_exhaust_retries_and_redact_key(mock_api, monkeypatch):
+    api = mock_api(lambda path, query: (503, {}, {'error': 'unavailable'}))
+    monkeypatch.setenv('SHEETS_API_URL', api.url)
+    monkeypatch.setenv('GOOGLE_API_KEY', 'secret-key')
+    monkeypatch.delenv('GOOGLE_OAUTH_TOKEN', raising=False)
+
+    with pytest.raises(RemoteSourceError) as error:
+        load_google_sheets('https://docs.google.com/spreadsheets/d/SHEET1/edit')
+
+    assert len(api.requests) == 1 + remote_sources.APIClient.MAX_RETRIES
+    assert 'HTTP 503' in str(error.value)
+    assert 'secret-key' not in str(error.value)
+
+
+def test_google_sheets_ranges(mock_api, monkeypatch):
+    grid = [['title', 'price', ' url_slug '], ['Tisch', 10, 'tisch'], ['', None],
+            ['Regal', 20], ['Bank', 30, 'bank'], ['Stuhl', 40, 'stuhl']]
+
+    def route(path, query):
+        assert query['key'] == 'test-key'
+        if path == '/spreadsheets/SHEET1':
+            sheets = [{'properties': {'sheetId': 0, 'title': 'Other', 'gridProperties': {'rowCount': 1}}},
+                      {'properties': {'sheetId': 7, 'title': "Bob's",
+                                      'gridProperties': {'rowCount': len(grid), 'columnCount': 3}}}]
+            return 200, {}, {'sheets': sheets}
+        a1 = path.rsplit('/', 1)[-1]
+        assert a1.startswith("'Bob''s'!A")
+        start, end = (int(''.join(c for c in cell if c.isdigit())) for cell in a1.split('!')[1].split(':'))
+        return 200, {}, {'values': grid[start - 1:end]}
+
+    api = mock_api(route)
+    monkeypatch.setenv('SHEETS_API_URL', api.url)
+    monkeypatch.setenv('GOOGLE_API_KEY', 'test-key')
+    monkeypatch.delenv('GOOGLE_OAUTH_TOKEN', raising=False)
+
+    rows = load_google_sheets('https://docs.google.com/spreadsheets/d/SHEET1/edit#gid=7', range_rows=2)
+
+    assert rows == [
+        {'title': 'Tisch', 'price': 10, 'url_slug': 'tisch'},
+        {'title': 'Regal', 'price': 20, 'url_slug': None},
+        {'title': 'Bank', 'price': 30, 'url_slug': 'bank'},
+        {'title': 'Stuhl', 'price': 40, 'url_slug': 'stuhl'}
+    ]
+    assert len(api.requests) == 1 + 3  # metadata, then 3 ranges of 2 rows
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=20)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.wait()
+    assert time.monotonic() - start >= 4 / 20
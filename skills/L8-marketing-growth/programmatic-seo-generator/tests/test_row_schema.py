@@ -0,0 +1,105 @@
+"""Tests for row_schema.py and the schema checks in DataLoader."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from data_loader import DataLoader
+from row_schema import RowSchema
+
+SCHEMA = {
+    'fields': {
+        'id': {'type': 'integer', 'required': True},
+        'title': {'required': True, 'max_length': 20},
+        'description': {'required': True},
+        'price': {'type': 'number'},
+        'url_slug': {'pattern': '^[a-z0-9]+(?:-[a-z0-9]+)*$', 'on_fail': 'reject'}
+    }
+}
+
+ROWS = [
+    'id,title,description,price,url_slug',
+    '1,Eiche Tisch,Massiv,599.99,eiche-tisch',
+    '2,Ein viel zu langer Produkttitel,Text,12,langer-titel',  # warn: title too long
+    '3,Kiefer Regal,Text,abc,kiefer_regal',                     # warn: price, reject: slug
+    '4,Buche Brett,Text,,buche-brett',                         # blank price is not checked
+    '5,Teak Bank,Text,45,Teak Bank',                            # reject: slug
+]
+
+
+@pytest.fixture
+def feed(tmp_path):
+    schema_path = tmp_path / 'schema.json'
+    schema_path.write_text(json.dumps(SCHEMA), encoding='utf-8')
+    source = tmp_path / 'feed.csv'
+    source.write_text('\n'.join(ROWS) + '\n', encoding='utf-8')
+    return str(source), str(schema_path)
+
+
+def test_reject_rows_dropped_and_reported(feed):
+    source, schema = feed
+    loader = DataLoader(source, schema=schema)
+    loader.load()
+    validation = loader.validate()
+
+    assert validation['valid']
+    assert validation['rejected_rows'] == [3, 5]
+    assert [row['id'] for row in loader.normalize()] == [1, 2, 4]
+    assert any(w.startswith('Rejected 2 rows failing schema rules: rows 3, 5') for w in validation['warnings'])
+
+
+def test_warn_rows_kept_and_reported(feed):
+    source, schema = feed
+    loader = DataLoader(source, schema=schema)
+    loader.load()
+    failures = loader.validate()['schema_failures']
+
+    assert failures == {
+        'title longer than 20 chars': [2],
+        'price is not a valid number': [3],
+        "url_slug does not match '^[a-z0-9]+(?:-[a-z0-9]+)*$'": [3, 5]
+    }
+    assert 2 in [row['id'] for row in loader.normalize()]
+
+
+def test_stream_matches_batch(feed):
+    source, schema = feed
+    batch = DataLoader(source, schema=schema)
+    batch.load()
+    expected = batch.validate()
+
+    stream = DataLoader(source, schema=schema)
+    rows = list(stream.iter_rows(chunk_size=2))
+
+    assert [row['id'] for row in rows] == [row['id'] for row in batch.normalize()]
+    assert stream.stream_validation['schema_failures'] == expected['schema_failures']
+    assert stream.stream_validation['rejected_rows'] == expected['rejected_rows']
+
+
+@pytest.mark.parametrize('spec, values', [
+    ({'type': 'integer'}, [1, '2', 2.5, 'x', None, '  ', float('inf')]),
+    ({'type': 'number'}, ['1.5', 'abc', 3, '', float('nan')]),
+    ({'type': 'boolean'}, ['yes', 'No', 'maybe', 1, 2]),
+    ({'type': 'url'}, ['https://a.de/x', '/img.jpg', 'ftp://x', 'img.jpg']),
+    ({'min_length': 3, 'max_length': 5}, ['ab', 'abc', 'abcdef', 1234]),
+    ({'pattern': '^[a-z-]+$'}, ['ok-slug', 'Not_ok', ' padded ']),
+])
+def test_column_checks_match_value_checks(spec, values):
+    rule = RowSchema({'fields': {'f': spec}}).rules['f']
+    column = pd.Series(values, dtype=object)
+    by_column = [[label for label, mask in rule.check_column(column) if mask.iloc[i]]
+                 for i in range(len(values))]
+    assert by_column == [rule.check_value(value) for value in values]
+
+
+@pytest.mark.parametrize('spec, message', [
+    ({'fields': {}}, "non-empty 'fields'"),
+    ({'fields': {'f': {'type': 'date'}}}, 'Unknown type'),
+    ({'fields': {'f': {'on_fail': 'drop'}}}, 'Unknown on_fail'),
+    ({'fields': {'f': {'maxlen': 5}}}, 'Unknown schema keys'),
+    ({'fields': {'f': {'pattern': '('}}}, 'Invalid pattern'),
+])
+def test_malformed_schema(spec, message):
+    with pytest.raises(ValueError, match=message):
+        RowSchema(spec)
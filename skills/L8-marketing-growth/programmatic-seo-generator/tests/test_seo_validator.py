@@ -0,0 +1,50 @@
+"""Tests for seo_validator.py."""
+
+import pytest
+
+from seo_validator import SEOValidator
+from site_db import build
+from template_engine import TemplateEngine
+
+
+@pytest.fixture(params=['flat', 'sharded', 'tar', 'zip'])
+def pages_dir(request, tmp_path, product_template, many_rows):
+    """Generated example pages in each output layout."""
+    output = tmp_path / request.param
+    TemplateEngine(str(product_template), str(output), layout=request.param).generate_pages(many_rows, url_field='url_slug')
+    return output
+
+
+def _report(pages_dir, workers, **options):
+    validator = SEOValidator(str(pages_dir), 'https://topholz24.de', **options)
+    return validator.validate_all(workers=workers, chunk_size=7)
+
+
+def test_workers_match_serial(pages_dir):
+    serial = _report(pages_dir, workers=1)
+    assert serial['total_pages'] == 60
+    assert _report(pages_dir, workers=3) == serial
+
+
+def test_workers_match_serial_from_db(pages_dir):
+    build(str(pages_dir))
+    db = str(pages_dir / 'site.db')
+    serial = _report(pages_dir, workers=1, db=db)
+    assert _report(pages_dir, workers=3, db=db) == serial
+    assert serial['results'] == _report(pages_dir, workers=1)['results']
+
+
+def test_links_outside_generated_pages(tmp_path, product_template, sample_rows):
+    TemplateEngine(str(product_template), str(tmp_path / 'pages')).generate_pages(sample_rows, url_field='url_slug')
+
+    links = _report(tmp_path / 'pages', workers=1)['link_graph']
+    assert links['broken_links'] == 0
+    assert {'/impressum', '/kontakt', '/holzarten'} <= {t['target'] for t in links['unverified_targets']}
+    assert '/' not in {t['target'] for t in links['unverified_targets']}
+
+    validator = SEOValidator(str(tmp_path / 'pages'), 'https://topholz24.de')
+    validator.site_urls = {'impressum', 'datenschutz', 'agb', 'kontakt', 'holzarten', 'verwendung'}
+    links = validator.validate_all()['link_graph']
+    assert links['unverified_links'] == 0
+    assert links['broken_links'] > 0
+    assert all(t['target'] not in {'/', '/impressum'} for t in links['broken_targets'])
@@ -0,0 +1,86 @@
+"""Tests for site_db.py."""
+
+import pytest
+
+from site_db import SiteDB, build
+from template_engine import TemplateEngine
+
+
+def _generate(output, template, rows, layout='sharded'):
+    TemplateEngine(str(template), str(output), layout=layout).generate_pages(rows, url_field='url_slug')
+    return output
+
+
+def _pages(db_path):
+    """Every stored column of every page, in page order."""
+    db = SiteDB(str(db_path), readonly=True)
+    try:
+        return db.query("SELECT * FROM pages ORDER BY position")[1]
+    finally:
+        db.close()
+
+
+def _fresh(pages_dir, tmp_path):
+    """Pages of a database built from scratch over the same directory."""
+    fresh = tmp_path / 'fresh.db'
+    build(str(pages_dir), str(fresh))
+    return _pages(fresh)
+
+
+def test_unchanged_rebuild_reuses_every_page(tmp_path, product_template, sample_rows):
+    pages_dir = _generate(tmp_path / 'pages', product_template, sample_rows)
+
+    assert build(str(pages_dir)) == {'pages': 10, 'parsed': 10, 'reused': 0, 'removed': 0}
+    first = _pages(pages_dir / 'site.db')
+    assert build(str(pages_dir)) == {'pages': 10, 'parsed': 0, 'reused': 10, 'removed': 0}
+    assert _pages(pages_dir / 'site.db') == first
+
+
+def test_changed_page_is_parsed_again(tmp_path, product_template, sample_rows):
+    pages_dir = _generate(tmp_path / 'pages', product_template, sample_rows, layout='flat')
+    build(str(pages_dir))
+
+    page = sorted(pages_dir.glob('*.html'))[3]
+    page.write_text(page.read_text(encoding='utf-8').replace('</h1>', ' Neu</h1>', 1), encoding='utf-8')
+
+    assert build(str(pages_dir)) == {'pages': 10, 'parsed': 1, 'reused': 9, 'removed': 0}
+    db = SiteDB(str(pages_dir / 'site.db'), readonly=True)
+    assert db.record(page.name).h1.endswith(' Neu')
+    db.close()
+    assert _pages(pages_dir / 'site.db') == _fresh(pages_dir, tmp_path)
+
+
+def test_removed_and_moved_pages(tmp_path, product_template, sample_rows):
+    pages_dir = _generate(tmp_path / 'pages', product_template, sample_rows)
+    build(str(pages_dir))
+
+    # Regenerated in reverse order without the first two rows
+    _generate(pages_dir, product_template, sample_rows[2:][::-1])
+    assert build(str(pages_dir)) == {'pages': 8, 'parsed': 0, 'reused': 8, 'removed': 2}
+
+    db = SiteDB(str(pages_dir / 'site.db'), readonly=True)
+    slugs = [slug for slug, _ in db.iter_urls()]
+    db.close()
+    assert slugs == [row['url_slug'] for row in sample_rows[2:][::-1]]
+    assert _pages(pages_dir / 'site.db') == _fresh(pages_dir, tmp_path)
+
+
+def test_changed_minhash_settings_parse_everything(tmp_path, product_template, sample_rows):
+    pages_dir = _generate(tmp_path / 'pages', product_template, sample_rows)
+    build(str(pages_dir))
+
+    db = SiteDB(str(pages_dir / 'site.db'))
+    db.set_info('minhash', '[64, 5, "other"]')
+    db.close()
+
+    assert build(str(pages_dir))['parsed'] == 10
+
+
+@pytest.mark.parametrize('layout', ['flat', 'tar'])
+def test_workers_match_serial(tmp_path, product_template, many_rows, layout):
+    pages_dir = _generate(tmp_path / 'pages', product_template, many_rows, layout=layout)
+    build(str(pages_dir), str(tmp_path / 'serial.db'))
+    stats = build(str(pages_dir), str(tmp_path / 'workers.db'), workers=3, chunk_size=7)
+
+    assert stats == {'pages': 60, 'parsed': 60, 'reused': 0, 'removed': 0}
+    assert _pages(tmp_path / 'workers.db') == _pages(tmp_path / 'serial.db')
@@ -0,0 +1,129 @@
+"""Tests for sitemap_writer.py."""
+
+import gzip
+import re
+
+import pytest
+
+from page_store import PageReader
+from sitemap_writer import SitemapWriter, SitemapHistory, HISTORY_FILE
+
+BASE_URL = 'https://topholz24.de'
+
+
+def _write(output, urls, compress=False, max_urls=10, now='2026-10-01T00:00:00+00:00'):
+    """One sitemap run over (url, content hash) pairs in page order."""
+    history = SitemapHistory(str(output / HISTORY_FILE), now=now)
+    with SitemapWriter(output, BASE_URL, compress, max_urls=max_urls, history=history) as writer:
+        for url, digest in urls:
+            writer.add(url, lastmod=history.lastmod(url, digest))
+    history.save()
+    return writer
+
+
+def _files(output):
+    return {path.name: path.read_bytes() for path in output.glob('sitemap-*.xml*')}
+
+
+def _locs(content):
+    return re.findall(rb'<loc>(.*?)</loc>', content)
+
+
+def _urls(count):
+    return [(f"{BASE_URL}/page-{i:03d}", f"hash-{i}") for i in range(count)]
+
+
+def test_split_at_max_urls(tmp_path):
+    writer = _write(tmp_path, _urls(25))
+    assert [path.name for path in writer.files] == ['sitemap-1.xml', 'sitemap-2.xml', 'sitemap-3.xml']
+    assert [len(_locs(path.read_bytes())) for path in writer.files] == [10, 10, 5]
+
+    index = (tmp_path / 'sitemap_index.xml').read_bytes()
+    assert _locs(index) == [f"{BASE_URL}/sitemap-{n}.xml".encode() for n in (1, 2, 3)]
+
+
+def test_insert_mid_order_rewrites_one_file(tmp_path):
+    urls = _urls(25)
+    _write(tmp_path, urls)
+    before = _files(tmp_path)
+
+    inserted = urls[:4] + [(f"{BASE_URL}/page-003a", 'hash-new')] + urls[4:]
+    writer = _write(tmp_path, inserted, now='2026-10-02T00:00:00+00:00')
+    after = _files(tmp_path)
+
+    assert after['sitemap-1.xml'] == before['sitemap-1.xml']
+    assert after['sitemap-2.xml'] == before['sitemap-2.xml']
+    assert f"{BASE_URL}/page-003a".encode() in _locs(after['sitemap-3.xml'])
+    assert [path.name for path in writer.written] == ['sitemap-3.xml']
+
+
+def test_remove_rewrites_only_its_file(tmp_path):
+    urls = _urls(25)
+    _write(tmp_path, urls)
+    before = _files(tmp_path)
+
+    writer = _write(tmp_path, urls[:12] + urls[13:], now='2026-10-02T00:00:00+00:00')
+    after = _files(tmp_path)
+
+    assert after['sitemap-1.xml'] == before['sitemap-1.xml']
+    assert after['sitemap-3.xml'] == before['sitemap-3.xml']
+    assert len(_locs(after['sitemap-2.xml'])) == 9
+    assert [path.name for path in writer.written] == ['sitemap-2.xml']
+
+
+def test_new_urls_start_a_file_when_last_is_full(tmp_path):
+    urls = _urls(20)
+    _write(tmp_path, urls)
+    before = _files(tmp_path)
+
+    writer = _write(tmp_path, [(f"{BASE_URL}/page-000a", 'hash-new')] + urls, now='2026-10-02T00:00:00+00:00')
+    after = _files(tmp_path)
+
+    assert {name: after[name] for name in before} == before
+    assert _locs(after['sitemap-3.xml']) == [f"{BASE_URL}/page-000a".encode()]
+    assert [path.name for path in writer.written] == ['sitemap-3.xml']
+
+
+def test_emptied_file_is_removed(tmp_path):
+    urls = _urls(25)
+    _write(tmp_path, urls)
+
+    writer = _write(tmp_path, urls[:10] + urls[20:], now='2026-10-02T00:00:00+00:00')
+    assert [path.name for path in writer.files] == ['sitemap-1.xml', 'sitemap-3.xml']
+    assert sorted(_files(tmp_path)) == ['sitemap-1.xml', 'sitemap-3.xml']
+    assert b'sitemap-2.xml' not in (tmp_path / 'sitemap_index.xml').read_bytes()
+
+
+def test_unchanged_rerun_keeps_lastmod_and_files(tmp_path):
+    urls = _urls(25)
+    _write(tmp_path, urls, compress=True)
+    before = _files(tmp_path)
+
+    writer = _write(tmp_path, urls, compress=True, now='2026-10-02T00:00:00+00:00')
+    assert _files(tmp_path) == before
+    assert writer.written == []
+    content = gzip.decompress(before['sitemap-1.xml.gz'])
+    assert set(re.findall(rb'<lastmod>(.*?)</lastmod>', content)) == {b'2026-10-01T00:00:00+00:00'}
+
+
+def test_version_1_history_is_read(tmp_path):
+    (tmp_path / HISTORY_FILE).write_text(
+        '{"version": 1, "urls": {"https://topholz24.de/page-000": ["hash-0", "2026-01-01T00:00:00+00:00"]},'
+        ' "shards": {}}', encoding='utf-8')
+
+    history = SitemapHistory(str(tmp_path / HISTORY_FILE))
+    assert history.lastmod(f"{BASE_URL}/page-000", 'hash-0') == '2026-01-01T00:00:00+00:00'
+    assert history.member(f"{BASE_URL}/page-000") is None
+
+
+def test_entry_larger_than_max_bytes(tmp_path):
+    with pytest.raises(ValueError, match='larger than'):
+        with SitemapWriter(tmp_path, BASE_URL, max_bytes=200) as writer:
+            writer.add(f"{BASE_URL}/{'x' * 300}")
+    assert list(tmp_path.glob('*.tmp')) == []
+
+
+def test_flat_listing_is_sorted(tmp_path):
+    for name in ('b.html', 'c.html', 'a.html'):
+        (tmp_path / name).write_text('<html></html>', encoding='utf-8')
+    assert PageReader(str(tmp_path)).pages == ['a.html', 'b.html', 'c.html']
@@ -0,0 +1,53 @@
+"""Tests for template_engine.py."""
+
+from pathlib import Path
+
+from template_engine import TemplateEngine
+
+
+def _render(template, rows, output_dir, workers, **options):
+    engine = TemplateEngine(str(template), str(output_dir), **options)
+    report = engine.generate_pages(rows, url_field='url_slug', workers=workers, chunk_size=7)
+    pages = {path.relative_to(output_dir).as_posix(): path.read_bytes()
+             for path in Path(output_dir).rglob('*.html')}
+    return report, pages
+
+
+def _entries(report, output_dir):
+    return [{**entry, 'filepath': str(Path(entry['filepath']).relative_to(output_dir))}
+            for entry in report['generated']]
+
+
+def test_workers_match_serial(tmp_path, product_template, many_rows):
+    serial, serial_pages = _render(product_template, many_rows, tmp_path / 'serial', workers=1)
+    parallel, parallel_pages = _render(product_template, many_rows, tmp_path / 'parallel', workers=3)
+
+    assert serial['generated_count'] == len(many_rows)
+    assert parallel['error_count'] == serial['error_count'] == 0
+    assert _entries(parallel, tmp_path / 'parallel') == _entries(serial, tmp_path / 'serial')
+    assert parallel_pages == serial_pages
+
+
+def test_workers_match_serial_with_qa(tmp_path, product_template, many_rows):
+    results = []
+    for workers in (1, 2):
+        engine = TemplateEngine(str(product_template), str(tmp_path / str(workers)))
+        engine.enable_qa('https://topholz24.de')
+        engine.generate_pages(many_rows, url_field='url_slug', workers=workers, chunk_size=5)
+        results.append((engine.quality_checker.build_report(), engine.seo_validator.build_report()))
+
+    assert results[0] == results[1]
+
+
+def test_route_counts(tmp_path, many_rows):
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'a.html').write_text('<h1>{{ title }}</h1>', encoding='utf-8')
+    (templates / 'b.html').write_text('<h2>{{ title }}</h2>', encoding='utf-8')
+    rows = [{**row, 'page_type': 'a' if i % 3 else 'b'} for i, row in enumerate(many_rows)]
+
+    engine = TemplateEngine(str(templates), str(tmp_path / 'out'),
+                            route_field='page_type', routes={'a': 'a.html', 'b': 'b.html'})
+    report = engine.generate_pages(rows, url_field='url_slug')
+
+    assert report['templates'] == {'a.html': 40, 'b.html': 20}